@@ -0,0 +1,74 @@
+"""
+Maximal marginal relevance (MMR) re-ranking for vector search results.
+Picks a subset of candidates that is both relevant to the query and
+diverse, so near-duplicate sentences don't crowd out the top-k.
+"""
+from typing import List, Sequence
+
+import numpy as np
+
+
+def _row_norms(matrix: np.ndarray) -> np.ndarray:
+    """L2 norm of each row, with zero rows given norm 1 so they score 0"""
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+    norms[norms == 0] = 1.0
+    return norms
+
+
+def mmr_select(
+    query_embedding: Sequence[float],
+    candidate_embeddings: Sequence[Sequence[float]],
+    k: int,
+    lambda_mult: float = 0.5,
+) -> List[int]:
+    """
+    Select k candidates by maximal marginal relevance.
+
+    Each step picks the candidate maximizing
+    ``lambda * sim(query, c) - (1 - lambda) * max(sim(c, selected))``.
+    Cosine similarities are taken from dot products divided by row norms,
+    so the candidates are never copied to normalize them, and only the
+    k - 1 similarity rows of picked candidates are computed. The running
+    max-similarity to the selected set is updated with a single vector
+    operation per pick.
+
+    Args:
+        query_embedding: Query vector
+        candidate_embeddings: Candidate vectors, one row per candidate
+        k: Number of candidates to select
+        lambda_mult: 1.0 ranks purely by relevance, 0.0 purely by diversity
+
+    Returns:
+        Indices into candidate_embeddings, in selection order
+    """
+    candidates = np.asarray(candidate_embeddings, dtype=np.float32)
+    if candidates.ndim != 2 or len(candidates) == 0 or k <= 0:
+        return []
+
+    k = min(k, len(candidates))
+    query = np.asarray(query_embedding, dtype=np.float32)
+    norms = _row_norms(candidates)
+    query_norm = float(np.sqrt(query @ query)) or 1.0
+
+    relevance = (candidates @ query) / (norms * query_norm)
+
+    def similarities(index: int) -> np.ndarray:
+        return (candidates @ candidates[index]) / (norms * norms[index])
+
+    selected = np.empty(k, dtype=np.intp)
+    available = np.ones(len(candidates), dtype=bool)
+
+    # The first pick has nothing to be redundant with
+    selected[0] = int(np.argmax(relevance))
+    available[selected[0]] = False
+    max_redundancy = similarities(selected[0])
+
+    for step in range(1, k):
+        scores = lambda_mult * relevance - (1.0 - lambda_mult) * max_redundancy
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected[step] = best
+        available[best] = False
+        np.maximum(max_redundancy, similarities(best), out=max_redundancy)
+
+    return selected.tolist()
@@ -2,12 +2,15 @@
 Vector database client for RAG-based content retrieval.
 Uses Qdrant for storing and searching Telugu learning content embeddings.
 """
-from typing import Optional, List
+import asyncio
+from typing import Optional, List, Tuple
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import Distance, VectorParams, PointStruct
 
 from app.core.config import settings
+from app.core.mmr import mmr_select
 
 
 class VectorDBClient:
@@ -66,12 +69,36 @@ class VectorDBClient:
             points=[point],
         )
     
+    async def upsert_contents(
+        self,
+        items: List[Tuple[str, List[float], dict]],
+    ) -> None:
+        """
+        Insert or update many content items in one request.
+        Runs in a worker thread so concurrent uploads don't block the event loop.
+        
+        Args:
+            items: (content_id, embedding, payload) tuples
+        """
+        points = [
+            PointStruct(id=content_id, vector=embedding, payload=payload)
+            for content_id, embedding, payload in items
+        ]
+        
+        await asyncio.to_thread(
+            self.client.upsert,
+            collection_name=self.collection_name,
+            points=points,
+        )
+    
     async def search(
         self,
         query_embedding: List[float],
         limit: int = 5,
         domain_filter: Optional[str] = None,
         category_filter: Optional[str] = None,
+        mmr_lambda: Optional[float] = None,
+        fetch_k: Optional[int] = None,
     ) -> List[dict]:
         """
         Search for similar content using vector similarity.
@@ -81,6 +108,10 @@ class VectorDBClient:
             limit: Maximum number of results
             domain_filter: Optional domain to filter by (office, family, movies)
             category_filter: Optional category to filter by
+            mmr_lambda: Enable MMR diversity re-ranking with this relevance
+                weight (1.0 = pure relevance, 0.0 = pure diversity)
+            fetch_k: Candidates to over-fetch for MMR
+                (default: limit * settings.mmr_fetch_multiplier)
             
         Returns:
             List of matching content with scores
@@ -108,13 +139,29 @@ class VectorDBClient:
         if filter_conditions:
             query_filter = models.Filter(must=filter_conditions)
         
+        use_mmr = mmr_lambda is not None
+        if use_mmr:
+            fetch_k = max(fetch_k or limit * settings.mmr_fetch_multiplier, limit)
+        
         results = self.client.search(
             collection_name=self.collection_name,
             query_vector=query_embedding,
-            limit=limit,
+            limit=fetch_k if use_mmr else limit,
             query_filter=query_filter,
+            with_vectors=use_mmr,
         )
         
+        if use_mmr and len(results) > limit:
+            # One float32 matrix up front; MMR on nested Python lists is several times slower
+            candidates = np.array([hit.vector for hit in results], dtype=np.float32)
+            selected = mmr_select(
+                np.asarray(query_embedding, dtype=np.float32),
+                candidates,
+                k=limit,
+                lambda_mult=mmr_lambda,
+            )
+            results = [results[i] for i in selected]
+        
         return [
             {
                 "id": str(hit.id),
@@ -131,6 +178,14 @@ class VectorDBClient:
             points_selector=models.PointIdsList(points=[content_id]),
         )
     
+    async def delete_contents(self, content_ids: List[str]) -> None:
+        """Delete many content items by ID in one request"""
+        await asyncio.to_thread(
+            self.client.delete,
+            collection_name=self.collection_name,
+            points_selector=models.PointIdsList(points=content_ids),
+        )
+    
     async def get_collection_info(self) -> dict:
         """Get collection statistics"""
         info = self.client.get_collection(self.collection_name)
@@ -0,0 +1,94 @@
+"""
+Ingestion checkpoints for resuming interrupted loads.
+Progress is tracked per source as the number of loader items that have
+been fully processed, and persisted to a small JSON file.
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class CheckpointStore:
+    """JSON-file store of per-source ingestion progress"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._state: Dict[str, dict] = self._read()
+
+    def _read(self) -> Dict[str, dict]:
+        if not self.path.exists():
+            return {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write(self) -> None:
+        """Write atomically so a crash never leaves a truncated file"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> Optional[dict]:
+        """Saved checkpoint for a source, if any"""
+        return self._state.get(key)
+
+    def position(self, key: str) -> int:
+        """Number of items already processed for a source"""
+        checkpoint = self._state.get(key)
+        return checkpoint["position"] if checkpoint else 0
+
+    def is_complete(self, key: str) -> bool:
+        """Whether the source finished in a previous run"""
+        checkpoint = self._state.get(key)
+        return bool(checkpoint and checkpoint.get("complete"))
+
+    def update(self, key: str, position: int, complete: bool = False) -> None:
+        """Record progress for a source"""
+        self._state[key] = {
+            "position": position,
+            "complete": complete,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        self._write()
+
+    def clear(self, key: str) -> None:
+        """Forget progress for a source"""
+        if self._state.pop(key, None) is not None:
+            self._write()
+
+
+class ProgressTracker:
+    """
+    Turns out-of-order batch completions into a safe resume position.
+
+    Batches finish in any order when the pipeline runs several workers,
+    so the checkpoint only advances past a batch once every batch before
+    it has finished too.
+    """
+
+    def __init__(self, start_position: int = 0):
+        self.position = start_position
+        self._next_seq = 0
+        self._finished: Dict[int, int] = {}
+
+    def finish(self, seq: int, end_position: int) -> bool:
+        """
+        Mark a batch as finished.
+
+        Args:
+            seq: Batch sequence number, starting at 0
+            end_position: Loader position just after the batch's last item
+
+        Returns:
+            True if the resume position advanced
+        """
+        self._finished[seq] = end_position
+        advanced = False
+        while self._next_seq in self._finished:
+            self.position = self._finished.pop(self._next_seq)
+            self._next_seq += 1
+            advanced = True
+        return advanced
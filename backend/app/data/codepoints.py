@@ -0,0 +1,106 @@
+"""
+Vectorized text helpers over Unicode code points.
+
+A batch of texts is concatenated into one uint32 array of code points
+with per-text start/end offsets, so character classes, Telugu word
+boundaries and word hashes are computed for the whole batch with numpy
+instead of character by character in Python.
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+TELUGU_FIRST = 0x0C00
+TELUGU_LAST_SIGN = 0x0C63  # Digits and fraction signs follow
+VIRAMA = 0x0C4D
+_JOINERS = (0x200C, 0x200D)  # ZWNJ and ZWJ occur inside Telugu words
+
+# Multiplier of the polynomial hash; odd, so it is invertible mod 2**64
+_HASH_BASE = 0x100000001B3
+_HASH_BASE_INVERSE = pow(_HASH_BASE, -1, 1 << 64)
+
+
+def codepoint_segments(texts: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Code points of a batch of texts concatenated into one array.
+
+    Returns:
+        (code points, start offset of each text, end offset of each text)
+    """
+    codepoints = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32)
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    ends = np.cumsum(lengths)
+    return codepoints, ends - lengths, ends
+
+
+def segment_counts(mask: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Number of True values in each [start, end) segment"""
+    cumulative = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)))
+    return cumulative[ends] - cumulative[starts]
+
+
+def segment_starts(starts: np.ndarray, size: int) -> np.ndarray:
+    """Mask of positions where a text begins"""
+    mask = np.zeros(size, dtype=bool)
+    mask[starts[starts < size]] = True
+    return mask
+
+
+def _powers(base: int, count: int) -> np.ndarray:
+    """base**0 .. base**(count-1), wrapping mod 2**64"""
+    if not count:
+        return np.zeros(0, dtype=np.uint64)
+    factors = np.full(count, base, dtype=np.uint64)
+    factors[0] = 1
+    return np.cumprod(factors, dtype=np.uint64)
+
+
+def segment_hashes(codepoints: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    64-bit polynomial hash of each codepoints[start:end] span.
+
+    hash = sum(c[i] * B**(i - start)), computed from prefix sums of
+    c[i] * B**i scaled back by B**-start; everything wraps mod 2**64. The
+    same text hashes the same wherever it sits in the array.
+    """
+    size = len(codepoints)
+    weighted = np.cumsum(codepoints.astype(np.uint64) * _powers(_HASH_BASE, size), dtype=np.uint64)
+    prefix = np.concatenate((np.zeros(1, dtype=np.uint64), weighted))
+    inverse = np.concatenate((_powers(_HASH_BASE_INVERSE, size), np.ones(1, dtype=np.uint64)))
+    return (prefix[ends] - prefix[starts]) * inverse[starts]
+
+
+def text_hashes(texts: List[str]) -> np.ndarray:
+    """Hash of each whole text; equal to its word hash for a single word"""
+    codepoints, starts, ends = codepoint_segments(texts)
+    return segment_hashes(codepoints, starts, ends)
+
+
+def telugu_letters(codepoints: np.ndarray) -> np.ndarray:
+    """Mask of Telugu letters, vowel signs and joiners (what Telugu words are made of)"""
+    return ((codepoints >= TELUGU_FIRST) & (codepoints <= TELUGU_LAST_SIGN)) | np.isin(
+        codepoints, _JOINERS
+    )
+
+
+def telugu_word_spans(
+    codepoints: np.ndarray,
+    starts: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Start and end offsets of every Telugu word (a run of Telugu letters),
+    in order. Words never continue across text boundaries.
+    """
+    size = len(codepoints)
+    text_start = segment_starts(starts, size)
+    letter = telugu_letters(codepoints)
+
+    after_letter = np.zeros(size, dtype=bool)
+    after_letter[1:] = letter[:-1]
+    after_letter &= ~text_start
+    before_letter = np.zeros(size, dtype=bool)
+    before_letter[:-1] = after_letter[1:] & letter[1:]
+
+    word_starts = np.flatnonzero(letter & ~after_letter)
+    word_ends = np.flatnonzero(letter & ~before_letter) + 1
+    return word_starts, word_ends
@@ -0,0 +1,106 @@
+"""
+Local content-hash index for delta ingestion.
+Remembers a hash of every stored item per source, so a refresh only
+embeds and uploads content that is new or changed, and can find items
+that disappeared from the source.
+"""
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from app.data.models import ProcessedContent
+
+# SQLite's default limit on host parameters is 999
+_LOOKUP_CHUNK = 500
+
+
+def content_hash(content: ProcessedContent) -> str:
+    """Hash of everything that ends up in the vector store for an item"""
+    data = content.model_dump(mode="json", exclude={"id"})
+    encoded = json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ContentIndex:
+    """SQLite-backed map of (source, content id) -> content hash"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS content_index (
+                source_key TEXT NOT NULL,
+                content_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                run_id TEXT NOT NULL,
+                PRIMARY KEY (source_key, content_id)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def lookup(self, source_key: str, content_ids: List[str]) -> Dict[str, str]:
+        """Stored hashes for the given IDs (missing IDs are omitted)"""
+        found = {}
+        for i in range(0, len(content_ids), _LOOKUP_CHUNK):
+            chunk = content_ids[i:i + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"""
+                SELECT content_id, content_hash FROM content_index
+                WHERE source_key = ? AND content_id IN ({placeholders})
+                """,
+                [source_key, *chunk],
+            )
+            found.update(rows)
+        return found
+
+    def record(
+        self,
+        source_key: str,
+        entries: Iterable[Tuple[str, str]],
+        run_id: str,
+    ) -> None:
+        """Store (content_id, hash) pairs and mark them seen in this run"""
+        self._conn.executemany(
+            """
+            INSERT INTO content_index (source_key, content_id, content_hash, run_id)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (source_key, content_id)
+            DO UPDATE SET content_hash = excluded.content_hash, run_id = excluded.run_id
+            """,
+            [(source_key, content_id, digest, run_id) for content_id, digest in entries],
+        )
+        self._conn.commit()
+
+    def touch(self, source_key: str, content_ids: List[str], run_id: str) -> None:
+        """Mark unchanged items as seen in this run"""
+        self._conn.executemany(
+            "UPDATE content_index SET run_id = ? WHERE source_key = ? AND content_id = ?",
+            [(run_id, source_key, content_id) for content_id in content_ids],
+        )
+        self._conn.commit()
+
+    def stale_ids(self, source_key: str, run_id: str) -> List[str]:
+        """IDs stored for a source that were not seen in the given run"""
+        rows = self._conn.execute(
+            "SELECT content_id FROM content_index WHERE source_key = ? AND run_id != ?",
+            (source_key, run_id),
+        )
+        return [row[0] for row in rows]
+
+    def remove(self, source_key: str, content_ids: List[str]) -> None:
+        """Forget deleted items"""
+        self._conn.executemany(
+            "DELETE FROM content_index WHERE source_key = ? AND content_id = ?",
+            [(source_key, content_id) for content_id in content_ids],
+        )
+        self._conn.commit()
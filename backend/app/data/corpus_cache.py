@@ -0,0 +1,215 @@
+"""
+Columnar cache of parsed corpus rows.
+
+Parsing CSV/TSV dumps and running the difficulty and domain heuristics
+is the slow part of every ingestion and dry run. `compile_corpus` runs a
+loader once and writes its filtered, annotated output to a Parquet file.
+`CorpusCacheLoader` then reads it back in large record batches, in a
+background thread.
+
+Requires the optional `pyarrow` package.
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
+from app.data.loaders.base import BaseLoader
+from app.data.loaders.readahead import read_ahead
+from app.data.models import ContentType, DifficultyLevel, ProcessedContent
+
+# Bump when the column layout changes; older caches are then rejected
+SCHEMA_VERSION = 1
+
+_META_PREFIX = b"ai_tutor."
+
+_STRING_COLUMNS = [
+    "id",
+    "content_type",
+    "text",
+    "telugu_text",
+    "english_text",
+    "transliteration",
+    "difficulty",
+    "source",
+    "license",
+    "metadata",  # JSON-encoded
+]
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("The corpus cache requires the 'pyarrow' package")
+    return pyarrow, pyarrow.parquet
+
+
+def cache_schema():
+    """Arrow schema of a compiled corpus"""
+    pa, _ = _require_pyarrow()
+    fields = [pa.field(name, pa.string(), nullable=name == "transliteration") for name in _STRING_COLUMNS]
+    fields.insert(7, pa.field("domains", pa.list_(pa.string())))
+    return pa.schema(fields)
+
+
+def _empty_columns() -> Dict[str, list]:
+    return {name: [] for name in cache_schema().names}
+
+
+def _append_row(columns: Dict[str, list], content: ProcessedContent) -> None:
+    columns["id"].append(content.id)
+    columns["content_type"].append(content.content_type.value)
+    columns["text"].append(content.text)
+    columns["telugu_text"].append(content.telugu_text)
+    columns["english_text"].append(content.english_text)
+    columns["transliteration"].append(content.transliteration)
+    columns["difficulty"].append(content.difficulty.value)
+    columns["domains"].append(list(content.domains))
+    columns["source"].append(content.source)
+    columns["license"].append(content.license)
+    columns["metadata"].append(json.dumps(content.metadata, ensure_ascii=False))
+
+
+async def compile_corpus(
+    loader: BaseLoader,
+    output_path: Path,
+    batch_size: int = 50_000,
+    compression: str = "zstd",
+) -> int:
+    """
+    Run a loader and write its output to a Parquet corpus cache.
+
+    Args:
+        loader: Any content loader
+        output_path: Parquet file to write; replaced atomically
+        batch_size: Rows per row group
+        compression: Parquet compression codec
+
+    Returns:
+        Number of rows written
+    """
+    pa, pq = _require_pyarrow()
+    schema = cache_schema().with_metadata({
+        _META_PREFIX + b"schema_version": str(SCHEMA_VERSION).encode(),
+        _META_PREFIX + b"source_name": loader.source_name.encode(),
+        _META_PREFIX + b"license": loader.license.encode(),
+        _META_PREFIX + b"source_path": str(loader.data_path).encode(),
+        _META_PREFIX + b"compiled_at": datetime.utcnow().isoformat().encode(),
+    })
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+
+    rows = 0
+    columns = _empty_columns()
+    try:
+        with pq.ParquetWriter(tmp_path, schema, compression=compression) as writer:
+            async for content in loader.load():
+                _append_row(columns, content)
+                rows += 1
+                if len(columns["id"]) >= batch_size:
+                    writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+                    columns = _empty_columns()
+            if columns["id"] or not rows:
+                writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return rows
+
+
+def read_cache_metadata(path: Path) -> Optional[Dict[str, str]]:
+    """Cache metadata (schema_version, source_name, ...), or None if not a corpus cache"""
+    _, pq = _require_pyarrow()
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+    except (OSError, ValueError):
+        return None
+    info = {
+        key[len(_META_PREFIX):].decode(): value.decode()
+        for key, value in metadata.items()
+        if key.startswith(_META_PREFIX)
+    }
+    return info or None
+
+
+class CorpusCacheLoader(BaseLoader):
+    """Loads content from a compiled Parquet corpus cache"""
+
+    def __init__(self, data_path: Path, batch_size: int = 65_536):
+        """
+        Args:
+            data_path: Parquet file written by compile_corpus
+            batch_size: Rows per record batch read from disk
+        """
+        super().__init__(data_path)
+        self.batch_size = batch_size
+        self._metadata: Optional[Dict[str, str]] = None
+
+    @property
+    def metadata(self) -> Dict[str, str]:
+        if self._metadata is None:
+            self._metadata = read_cache_metadata(self.data_path) or {}
+        return self._metadata
+
+    @property
+    def source_name(self) -> str:
+        # Same name as the original source, so content IDs and stats line up
+        return self.metadata.get("source_name", "Corpus cache")
+
+    @property
+    def license(self) -> str:
+        return self.metadata.get("license", "Unknown")
+
+    def validate_source(self) -> bool:
+        if not self.data_path.is_file():
+            return False
+        return self.metadata.get("schema_version") == str(SCHEMA_VERSION)
+
+    def estimate_total(self) -> Optional[int]:
+        _, pq = _require_pyarrow()
+        return pq.ParquetFile(self.data_path).metadata.num_rows
+
+    def iter_batches(self, columns: List[str] = None) -> Iterator:
+        """Arrow record batches, optionally only some columns (for analytics and sampling)"""
+        _, pq = _require_pyarrow()
+        parquet_file = pq.ParquetFile(self.data_path)
+        yield from parquet_file.iter_batches(batch_size=self.batch_size, columns=columns)
+
+    async def load(self) -> AsyncIterator[ProcessedContent]:
+        """Read and convert record batches in a background thread"""
+        batches = read_ahead(lambda: (self._batch_contents(batch) for batch in self.iter_batches()))
+        try:
+            async for contents in batches:
+                for content in contents:
+                    yield content
+        finally:
+            await batches.aclose()
+
+    @staticmethod
+    def _batch_contents(batch) -> List[ProcessedContent]:
+        """Content items of one Arrow record batch"""
+        content_types = {member.value: member for member in ContentType}
+        difficulties = {member.value: member for member in DifficultyLevel}
+        columns = batch.to_pydict()
+        return [
+            # Rows were validated when the cache was compiled
+            ProcessedContent.model_construct(
+                id=columns["id"][i],
+                content_type=content_types[columns["content_type"][i]],
+                text=columns["text"][i],
+                telugu_text=columns["telugu_text"][i],
+                english_text=columns["english_text"][i],
+                transliteration=columns["transliteration"][i],
+                metadata=json.loads(columns["metadata"][i]),
+                domains=columns["domains"][i],
+                difficulty=difficulties[columns["difficulty"][i]],
+                source=columns["source"][i],
+                license=columns["license"][i],
+            )
+            for i in range(batch.num_rows)
+        ]
@@ -0,0 +1,102 @@
+"""
+Dead-letter capture for content that failed to ingest.
+Failed items are appended to a JSONL file per run together with the
+error, so they can be retried later without re-running the whole load.
+"""
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from app.data.loaders.base import BaseLoader
+from app.data.loaders.readahead import iter_row_batches
+from app.data.models import ProcessedContent
+
+
+class DeadLetterWriter:
+    """Appends failed items to a JSONL file, created on first failure"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.count = 0
+        self._file: Optional[TextIO] = None
+
+    def write(
+        self,
+        items: List[ProcessedContent],
+        error: str,
+        stage: str,
+        source_key: str,
+    ) -> None:
+        """Record items that failed in a pipeline stage"""
+        if not items:
+            return
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+
+        failed_at = datetime.utcnow().isoformat()
+        for item in items:
+            record = {
+                "source_key": source_key,
+                "stage": stage,
+                "error": error,
+                "failed_at": failed_at,
+                "item": item.model_dump(mode="json"),
+            }
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.count += len(items)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class DeadLetterLoader(BaseLoader):
+    """
+    Loads failed items back from a dead-letter file for retrying.
+    Retried items are indexed under the source they originally came from,
+    so that source's delta and delete-missing bookkeeping stays correct.
+    """
+
+    def __init__(self, data_path: Path):
+        super().__init__(data_path)
+        self.source_keys: Dict[str, str] = {}  # Content ID -> original source key
+
+    @property
+    def source_name(self) -> str:
+        return f"Dead letters ({self.data_path.name})"
+
+    @property
+    def license(self) -> str:
+        # Each item keeps the license of its original source
+        return "Mixed"
+
+    def validate_source(self) -> bool:
+        return self.data_path.is_file()
+
+    def index_key(self, content: ProcessedContent) -> str:
+        return self.source_keys.get(content.id, self.checkpoint_key)
+
+    def _read_records(self) -> Iterator[Tuple[ProcessedContent, Optional[str]]]:
+        """(item, original source key) for each dead letter"""
+        with open(self.data_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    record = json.loads(line)
+                    yield ProcessedContent(**record["item"]), record.get("source_key")
+
+    async def load(self) -> AsyncIterator[ProcessedContent]:
+        """Read and decode the file in a background thread"""
+        batches = iter_row_batches(self._read_records)
+        try:
+            async for batch in batches:
+                for content, source_key in batch:
+                    if source_key:
+                        self.source_keys[content.id] = source_key
+                    yield content
+        finally:
+            await batches.aclose()
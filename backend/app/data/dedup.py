@@ -0,0 +1,156 @@
+"""
+Near-duplicate filtering for ingestion using MinHash and LSH.
+
+Each item is reduced to a MinHash signature over character shingles of
+its normalized Telugu and English text. Signatures are bucketed by
+locality-sensitive hashing bands, so candidates are found without
+comparing against every item seen so far. Memory is bounded by evicting
+the oldest remembered items once max_entries is reached.
+"""
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+import numpy as np
+
+from app.data.models import ProcessedContent, normalize_text
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_SHINGLE_BASE = np.uint64(1_000_003)
+
+
+class MinHashDeduplicator:
+    """Streaming near-duplicate detector shared across sources"""
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 5,
+        threshold: float = 0.8,
+        max_entries: int = 100_000,
+        seed: int = 1,
+    ):
+        """
+        Args:
+            num_perm: MinHash signature length
+            bands: LSH bands; num_perm must be divisible by it
+            shingle_size: Characters per shingle
+            threshold: Estimated Jaccard similarity at which items are duplicates
+            max_entries: Items remembered before the oldest are forgotten
+            seed: Seed for the hash permutations
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.max_entries = max_entries
+
+        rng = np.random.default_rng(seed)
+        self._perm_a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._perm_b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        # Per-band multipliers fold a band's rows into one bucket key; using
+        # different ones per band keeps keys of different bands apart
+        self._band_mult = rng.integers(1, 1 << 63, size=(bands, self.rows), dtype=np.uint64)
+
+        self._buckets: Dict[int, int] = {}
+        self._entries: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._order: Deque[int] = deque()
+        self._next_entry = 0
+        self.seen = 0
+        self.removed = 0
+
+    def _dedup_text(self, item: ProcessedContent) -> str:
+        return f"{normalize_text(item.telugu_text)} | {normalize_text(item.english_text)}"
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """
+        MinHash signatures for a batch of texts, shape (len(texts), num_perm).
+
+        All texts are concatenated into one code point array, so shingle
+        hashing and the min over every permutation run as a handful of
+        array operations for the whole batch.
+        """
+        k = self.shingle_size
+        # Pad so every text has at least one full shingle
+        texts = [text.ljust(k) for text in texts]
+        codepoints = np.frombuffer(
+            "".join(texts).encode("utf-32-le"), dtype=np.uint32
+        ).astype(np.uint64)
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+        # Polynomial hash of every k-gram in the concatenation
+        window = len(codepoints) - k + 1
+        shingles = np.zeros(window, dtype=np.uint64)
+        for offset in range(k):
+            shingles = shingles * _SHINGLE_BASE + codepoints[offset:offset + window]
+
+        # Keep only k-grams that lie entirely inside one text
+        per_text = lengths - k + 1
+        offsets = np.concatenate(([0], np.cumsum(per_text)[:-1]))
+        rank = np.arange(per_text.sum()) - np.repeat(offsets, per_text)
+        valid = np.repeat(starts, per_text) + rank
+        shingles = shingles[valid] & _MAX_HASH
+
+        hashed = self._perm_a[:, None] * shingles[None, :] + self._perm_b[:, None]
+        hashed = (hashed % _MERSENNE_PRIME) & _MAX_HASH
+        return np.minimum.reduceat(hashed, offsets, axis=1).T.astype(np.uint32)
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """LSH bucket keys, shape (n, bands)"""
+        banded = signatures.astype(np.uint64).reshape(len(signatures), self.bands, self.rows)
+        return (banded * self._band_mult[None, :, :]).sum(axis=2)
+
+    def filter(self, items: List[ProcessedContent]) -> List[ProcessedContent]:
+        """Return items that are not near-duplicates of anything seen before"""
+        if not items:
+            return items
+
+        signatures = self.signatures([self._dedup_text(item) for item in items])
+        band_keys = self._band_keys(signatures)
+
+        kept = []
+        for item, signature, keys in zip(items, signatures, band_keys):
+            self.seen += 1
+            if self._is_duplicate(signature, keys):
+                self.removed += 1
+                continue
+            self._remember(signature, keys)
+            kept.append(item)
+        return kept
+
+    def _is_duplicate(self, signature: np.ndarray, keys: np.ndarray) -> bool:
+        checked = set()
+        for key in keys.tolist():
+            entry_id = self._buckets.get(key)
+            if entry_id is None or entry_id in checked:
+                continue
+            checked.add(entry_id)
+            entry = self._entries.get(entry_id)
+            if entry is None:
+                continue
+            similarity = np.count_nonzero(entry[0] == signature) / self.num_perm
+            if similarity >= self.threshold:
+                return True
+        return False
+
+    def _remember(self, signature: np.ndarray, keys: np.ndarray) -> None:
+        entry_id = self._next_entry
+        self._next_entry += 1
+        self._entries[entry_id] = (signature, keys)
+        self._order.append(entry_id)
+        for key in keys.tolist():
+            self._buckets.setdefault(key, entry_id)
+
+        while len(self._entries) > self.max_entries:
+            self._forget(self._order.popleft())
+
+    def _forget(self, entry_id: int) -> None:
+        _, keys = self._entries.pop(entry_id)
+        for key in keys.tolist():
+            if self._buckets.get(key) == entry_id:
+                del self._buckets[key]
@@ -0,0 +1,278 @@
+"""
+Difficulty scoring for Telugu sentences, shared by all loaders.
+
+A sentence is harder when it uses rare words, when it is long, and when
+it is dense with conjunct consonants (ప్ర, స్త్ర). Length is counted in
+aksharas, the written syllables of Telugu, rather than in words: Telugu
+words agglutinate case markers and verb endings, so word counts say
+little about how much there is to read.
+
+Word rarity comes from a frequency lexicon built once from the corpora
+(scripts/build_lexicon.py). It is stored as two sorted arrays, 64-bit
+word hashes and their counts, and looked up with a binary search, so
+scoring a batch needs no Python-level dictionary lookups. Without a
+lexicon, scores use length and conjuncts only.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.data.codepoints import (
+    VIRAMA,
+    codepoint_segments,
+    segment_counts,
+    segment_hashes,
+    segment_starts,
+    telugu_word_spans,
+)
+from app.data.models import DifficultyLevel
+
+LEXICON_VERSION = 1
+
+_LEVELS = [DifficultyLevel.BEGINNER, DifficultyLevel.INTERMEDIATE, DifficultyLevel.ADVANCED]
+
+
+@dataclass
+class TextFeatures:
+    """Per-text counts for a batch, plus the hashes of every Telugu word"""
+    aksharas: np.ndarray
+    conjuncts: np.ndarray
+    words: np.ndarray
+    word_hashes: np.ndarray  # One per word, in text order
+    word_owners: np.ndarray  # Index of the text each word belongs to
+
+
+def analyze_texts(texts: List[str]) -> TextFeatures:
+    """
+    Segment a batch of texts into Telugu words and aksharas, all at once.
+
+    An akshara starts at every consonant or independent vowel that does
+    not follow a virama; a consonant after a virama joins the previous
+    akshara as a conjunct. Words are runs of Telugu letters and signs.
+    """
+    codepoints, starts, ends = codepoint_segments(texts)
+
+    consonant = ((codepoints >= 0x0C15) & (codepoints <= 0x0C39)) | (
+        (codepoints >= 0x0C58) & (codepoints <= 0x0C5A)
+    )
+    vowel = ((codepoints >= 0x0C05) & (codepoints <= 0x0C14)) | (
+        (codepoints >= 0x0C60) & (codepoints <= 0x0C61)
+    )
+    # Texts are concatenated, so no virama may carry over from the previous one
+    after_virama = np.zeros(len(codepoints), dtype=bool)
+    after_virama[1:] = codepoints[:-1] == VIRAMA
+    after_virama &= ~segment_starts(starts, len(codepoints))
+
+    akshara_start = (consonant | vowel) & ~after_virama
+    conjunct = consonant & after_virama
+
+    word_starts, word_ends = telugu_word_spans(codepoints, starts)
+    word_hashes = segment_hashes(codepoints, word_starts, word_ends)
+
+    word_owners = np.searchsorted(ends, word_starts, side="right")
+    return TextFeatures(
+        aksharas=segment_counts(akshara_start, starts, ends),
+        conjuncts=segment_counts(conjunct, starts, ends),
+        words=np.bincount(word_owners, minlength=len(texts)),
+        word_hashes=word_hashes,
+        word_owners=word_owners,
+    )
+
+
+class Lexicon:
+    """Telugu word frequencies as sorted hash and count arrays"""
+
+    def __init__(self, hashes: np.ndarray, counts: np.ndarray):
+        """
+        Args:
+            hashes: Sorted, unique word hashes
+            counts: Occurrences of each word
+        """
+        self.hashes = np.asarray(hashes, dtype=np.uint64)
+        self.counts = np.asarray(counts, dtype=np.uint32)
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    @classmethod
+    def build(cls, texts: Iterable[str], batch_size: int = 10_000) -> "Lexicon":
+        """Count the Telugu words in a stream of texts"""
+        builder = LexiconBuilder()
+        batch: List[str] = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) >= batch_size:
+                builder.add(batch)
+                batch = []
+        builder.add(batch)
+        return builder.finish()
+
+    @classmethod
+    def load(cls, path: Path) -> "Lexicon":
+        with np.load(path) as data:
+            if int(data["version"]) != LEXICON_VERSION:
+                raise ValueError(f"Unsupported lexicon version in {path}")
+            return cls(data["hashes"], data["counts"])
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(f, version=LEXICON_VERSION, hashes=self.hashes, counts=self.counts)
+
+    def lookup(self, hashes: np.ndarray) -> np.ndarray:
+        """Count of each word hash; 0 for words not in the lexicon"""
+        if not len(self.hashes):
+            return np.zeros(len(hashes), dtype=np.uint32)
+        index = np.minimum(np.searchsorted(self.hashes, hashes), len(self.hashes) - 1)
+        return np.where(self.hashes[index] == hashes, self.counts[index], 0)
+
+    def common_threshold(self, common_words: int) -> int:
+        """Smallest count among the `common_words` most frequent words"""
+        if not len(self.counts):
+            return 1
+        rank = min(common_words, len(self.counts))
+        return max(int(np.partition(self.counts, -rank)[-rank]), 1)
+
+
+class LexiconBuilder:
+    """Accumulates word counts batch by batch, merging into sorted arrays"""
+
+    def __init__(self, merge_every: int = 5_000_000):
+        """
+        Args:
+            merge_every: Unmerged per-batch entries held before merging
+        """
+        self._merge_every = merge_every
+        self._hashes: List[np.ndarray] = []
+        self._counts: List[np.ndarray] = []
+        self._pending = 0
+
+    def add(self, texts: List[str]) -> None:
+        """Count the Telugu words in a batch of texts"""
+        if not texts:
+            return
+        self.add_counts(*np.unique(analyze_texts(texts).word_hashes, return_counts=True))
+
+    def add_counts(self, hashes: np.ndarray, counts: np.ndarray) -> None:
+        """Add counts already tallied elsewhere, e.g. by a worker process"""
+        if not len(hashes):
+            return
+        self._hashes.append(hashes)
+        self._counts.append(counts)
+        self._pending += len(hashes)
+        if self._pending >= self._merge_every:
+            self._merge()
+
+    def _merge(self) -> Tuple[np.ndarray, np.ndarray]:
+        if not self._hashes:
+            return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.uint32)
+        hashes, inverse = np.unique(np.concatenate(self._hashes), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate(self._counts)).astype(np.uint32)
+        self._hashes, self._counts = [hashes], [counts]
+        self._pending = 0
+        return hashes, counts
+
+    def finish(self, min_count: int = 1) -> Lexicon:
+        """
+        Args:
+            min_count: Drop words seen fewer times (keeps huge corpora small)
+        """
+        hashes, counts = self._merge()
+        if min_count > 1:
+            keep = counts >= min_count
+            hashes, counts = hashes[keep], counts[keep]
+        return Lexicon(hashes, counts)
+
+
+@dataclass
+class DifficultyThresholds:
+    """Weights and cut-offs for combining features into a level"""
+    common_words: int = 5000  # Words outside the most frequent N count as rare
+    long_sentence_aksharas: int = 30  # Length at which the length score saturates
+    dense_conjuncts: float = 0.3  # Conjuncts per akshara at which that score saturates
+    rare_weight: float = 0.5
+    length_weight: float = 0.3
+    conjunct_weight: float = 0.2
+    intermediate_score: float = 0.3
+    advanced_score: float = 0.55
+
+
+class DifficultyScorer:
+    """Assigns difficulty levels to batches of Telugu sentences"""
+
+    def __init__(self, lexicon: Optional[Lexicon] = None, thresholds: Optional[DifficultyThresholds] = None):
+        """
+        Args:
+            lexicon: Word frequencies; without one, rarity is not scored
+            thresholds: Feature weights and level cut-offs
+        """
+        self.lexicon = lexicon if lexicon is not None and len(lexicon) else None
+        self.thresholds = thresholds or DifficultyThresholds()
+        self._common_count = (
+            self.lexicon.common_threshold(self.thresholds.common_words) if self.lexicon else 0
+        )
+
+    def features(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """Rare-word ratio, akshara count and conjunct density of each text"""
+        analysis = analyze_texts(texts)
+        aksharas = analysis.aksharas
+        features = {
+            "aksharas": aksharas,
+            "conjunct_density": analysis.conjuncts / np.maximum(aksharas, 1),
+        }
+        if self.lexicon is not None:
+            rare = self.lexicon.lookup(analysis.word_hashes) < self._common_count
+            rare_words = np.bincount(analysis.word_owners, weights=rare, minlength=len(texts))
+            features["rare_ratio"] = rare_words / np.maximum(analysis.words, 1)
+        return features
+
+    def scores(self, texts: List[str]) -> np.ndarray:
+        """Difficulty of each text between 0 (easiest) and 1"""
+        t = self.thresholds
+        features = self.features(texts)
+        length = np.minimum(features["aksharas"] / t.long_sentence_aksharas, 1.0)
+        conjuncts = np.minimum(features["conjunct_density"] / t.dense_conjuncts, 1.0)
+
+        if "rare_ratio" not in features:
+            # Spread the rarity weight over the remaining features
+            total = t.length_weight + t.conjunct_weight
+            return (t.length_weight * length + t.conjunct_weight * conjuncts) / total
+        return (
+            t.rare_weight * features["rare_ratio"]
+            + t.length_weight * length
+            + t.conjunct_weight * conjuncts
+        )
+
+    def score_batch(self, texts: List[str]) -> List[DifficultyLevel]:
+        """Difficulty level of each text"""
+        if not texts:
+            return []
+        t = self.thresholds
+        levels = np.digitize(self.scores(texts), [t.intermediate_score, t.advanced_score])
+        return [_LEVELS[level] for level in levels]
+
+    def score(self, text: str) -> DifficultyLevel:
+        """Difficulty level of a single text"""
+        return self.score_batch([text])[0]
+
+
+@lru_cache(maxsize=None)
+def get_difficulty_scorer(lexicon_path: Optional[str] = None) -> DifficultyScorer:
+    """
+    Shared scorer, built once per process.
+    Uses settings.difficulty_lexicon_path unless a path is given; a missing
+    lexicon file falls back to scoring without word rarity.
+    """
+    from app.core.config import settings
+
+    if lexicon_path is None:
+        lexicon_path = settings.difficulty_lexicon_path
+    lexicon = None
+    if lexicon_path and Path(lexicon_path).is_file():
+        lexicon = Lexicon.load(Path(lexicon_path))
+    thresholds = DifficultyThresholds(common_words=settings.difficulty_common_words)
+    return DifficultyScorer(lexicon, thresholds)
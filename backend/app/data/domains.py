@@ -0,0 +1,156 @@
+"""
+Keyword-based domain tagging shared by all loaders.
+
+A taxonomy maps each domain to English and Telugu keywords. All keywords
+are compiled into one regular expression, and a batch is classified by
+scanning the joined texts once and mapping each match back to its item.
+
+English keywords match whole words, optionally with a plural "s"/"es".
+Telugu keywords match at the start of a word, since case markers and
+postpositions attach to the stem (బస్సు matches బస్సులో).
+"""
+import bisect
+import itertools
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+Taxonomy = Dict[str, Dict[str, List[str]]]
+
+DEFAULT_DOMAIN = "general"
+
+DEFAULT_TAXONOMY: Taxonomy = {
+    "office": {
+        "en": ["office", "work", "meeting", "project", "manager", "employee", "company", "business"],
+        "te": ["ఆఫీసు", "ఆఫీస్", "కార్యాలయ", "ఉద్యోగ", "సమావేశ", "మీటింగ్", "ప్రాజెక్ట్", "మేనేజర్", "కంపెనీ", "వ్యాపార"],
+    },
+    "family": {
+        "en": ["mother", "father", "sister", "brother", "family", "home", "house", "children"],
+        "te": ["అమ్మ", "నాన్న", "అక్క", "చెల్లి", "అన్న", "తమ్ముడు", "కుటుంబ", "ఇల్లు", "ఇంటి", "పిల్లలు"],
+    },
+    "travel": {
+        "en": ["travel", "train", "bus", "airport", "hotel", "ticket", "station", "journey"],
+        "te": ["ప్రయాణ", "రైలు", "బస్సు", "విమానాశ్రయ", "హోటల్", "టికెట్", "స్టేషన్"],
+    },
+    "movies": {
+        "en": ["movie", "film", "actor", "song", "music", "cinema", "hero"],
+        "te": ["సినిమా", "చిత్రం", "నటుడు", "నటించ", "పాట", "సంగీత", "హీరో"],
+    },
+}
+
+_ITEM_SEPARATOR = "\n"
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_" or "\u0C00" <= char <= "\u0C7F"
+
+
+def _trie_pattern(words) -> str:
+    """
+    Regex alternation for a set of words, factored by common prefix
+    (office|offer -> of(?:fice|fer)) so matching follows one trie path.
+    Longer words are preferred where one word is a prefix of another.
+    """
+    root: dict = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(root)
+
+
+def load_taxonomy(path: Path) -> Taxonomy:
+    """Read a taxonomy from JSON: {"domain": {"en": [...], "te": [...]}, ...}"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class DomainClassifier:
+    """Tags text with domains using one compiled pattern for the whole taxonomy"""
+
+    def __init__(self, taxonomy: Optional[Taxonomy] = None, default: str = DEFAULT_DOMAIN):
+        """
+        Args:
+            taxonomy: Domain -> {"en": [...], "te": [...]} keywords
+            default: Domain given to texts that match nothing
+        """
+        self.taxonomy = taxonomy or DEFAULT_TAXONOMY
+        self.default = default
+        self._domain_order = {domain: index for index, domain in enumerate(self.taxonomy)}
+
+        self._keyword_domains: Dict[str, List[str]] = {}
+        english, telugu = set(), set()
+        for domain, keywords in self.taxonomy.items():
+            for keyword in keywords.get("en", []):
+                keyword = keyword.lower()
+                english.add(keyword)
+                self._keyword_domains.setdefault(keyword, []).append(domain)
+            for keyword in keywords.get("te", []):
+                keyword = keyword.lower()
+                telugu.add(keyword)
+                self._keyword_domains.setdefault(keyword, []).append(domain)
+
+        # One group over every keyword lets the regex engine skip quickly to
+        # positions that can start a keyword. Word boundaries are checked on
+        # the few matches afterwards instead of being asserted at every position.
+        self._english = english
+        pattern = _trie_pattern(english | telugu)
+        self._pattern = re.compile(rf"({pattern})(?:e?s)?") if pattern else None
+
+    def classify(self, english: str, telugu: str = "") -> List[str]:
+        """Domains of a single English/Telugu pair"""
+        return self.classify_batch([(english, telugu)])[0]
+
+    def classify_batch(self, pairs: Sequence[Tuple[str, str]]) -> List[List[str]]:
+        """Domains for each (english, telugu) pair, scanning the batch in one pass"""
+        if not pairs:
+            return []
+
+        texts = [f"{english} {_ITEM_SEPARATOR} {telugu}" for english, telugu in pairs]
+        found: List[set] = [set() for _ in texts]
+
+        if self._pattern is not None:
+            # Lowercased once for the whole batch; keywords are lowercase too
+            joined = _ITEM_SEPARATOR.join(texts).lower()
+            ends = list(itertools.accumulate(len(text) + 1 for text in texts))
+
+            for match in self._pattern.finditer(joined):
+                start, end = match.span()
+                if start and _is_word_char(joined[start - 1]):
+                    continue
+                keyword = match.group(1)
+                # English keywords are whole words (plus a plural); Telugu
+                # ones are stems that take suffixes
+                if keyword in self._english and end < len(joined) and _is_word_char(joined[end]):
+                    continue
+                item = bisect.bisect_right(ends, start)
+                found[item].update(self._keyword_domains[keyword])
+
+        return [
+            sorted(domains, key=self._domain_order.__getitem__) if domains else [self.default]
+            for domains in found
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_domain_classifier(taxonomy_path: Optional[str] = None) -> DomainClassifier:
+    """
+    Shared classifier, built once per process.
+    Uses settings.domain_taxonomy_path unless a path is given.
+    """
+    if taxonomy_path is None:
+        from app.core.config import settings
+        taxonomy_path = settings.domain_taxonomy_path
+    taxonomy = load_taxonomy(Path(taxonomy_path)) if taxonomy_path else None
+    return DomainClassifier(taxonomy)
@@ -0,0 +1,280 @@
+"""
+Streaming, resumable file downloads for the data scripts.
+
+Files are streamed to disk in chunks (never held in memory) through a
+`<name>.part` file that is renamed into place only once the download is
+complete and verified. An interrupted download leaves the .part file
+plus a small `<name>.part.json` with the server's validators (ETag,
+Last-Modified); the next attempt resumes with an HTTP Range request,
+guarded by If-Range so a file that changed on the server is fetched
+again from the start instead of being spliced together.
+
+Bytes are stored exactly as sent: identity encoding is requested and the
+raw body is written, so sizes, Range offsets and checksums all refer to
+the same bytes. Each download is checked against the server's
+Content-Length and, when
+one is given, an expected SHA-256. Independent files are downloaded
+concurrently. remote_info fetches a file's validators without its body,
+so callers can tell whether it changed since an earlier download.
+"""
+import asyncio
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import httpx
+
+DEFAULT_CHUNK_BYTES = 1 << 20
+
+_HASH_BLOCK = 4 << 20
+
+
+class DownloadError(Exception):
+    """A download failed after all retries"""
+
+
+class ChecksumError(DownloadError):
+    """A completed download doesn't match its expected SHA-256"""
+
+
+@dataclass
+class DownloadSpec:
+    """A file to fetch"""
+    url: str
+    path: Path
+    sha256: Optional[str] = None  # Expected hex digest, if published
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of one download"""
+    url: str
+    path: Path
+    size: int
+    sha256: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    downloaded_bytes: int = 0  # Transferred in this run (less than size when resumed)
+    resumed: bool = False
+
+
+@dataclass
+class RemoteInfo:
+    """Validators of a remote file, from a HEAD request"""
+    url: str
+    etag: Optional[str] = None
+    size: Optional[int] = None
+    last_modified: Optional[str] = None
+
+
+def _hash_file(path: Path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(_HASH_BLOCK):
+            digest.update(block)
+    return digest
+
+
+def file_sha256(path: Path) -> str:
+    return _hash_file(path).hexdigest()
+
+
+def _part_paths(path: Path):
+    return path.with_name(path.name + ".part"), path.with_name(path.name + ".part.json")
+
+
+def _read_validators(meta_path: Path, url: str) -> dict:
+    """Validators saved for a partial download of the same URL"""
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return meta if meta.get("url") == url else {}
+
+
+def _total_size(response: httpx.Response, offset: int) -> Optional[int]:
+    """Full file size from Content-Range or Content-Length"""
+    content_range = response.headers.get("content-range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+    length = response.headers.get("content-length")
+    return offset + int(length) if length and length.isdigit() else None
+
+
+async def _fetch(
+    client: httpx.AsyncClient,
+    spec: DownloadSpec,
+    chunk_bytes: int,
+) -> DownloadResult:
+    """One attempt: resume or start the .part file and stream to its end"""
+    part_path, meta_path = _part_paths(spec.path)
+    validators = _read_validators(meta_path, spec.url)
+    offset = part_path.stat().st_size if part_path.exists() and validators else 0
+
+    # Content-Encoding would make Content-Length and Range offsets refer to other bytes
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        validator = validators.get("etag") or validators.get("last_modified")
+        if validator:
+            headers["If-Range"] = validator
+
+    async with client.stream("GET", spec.url, headers=headers) as response:
+        if response.status_code == 416 and offset:
+            # Nothing left to fetch if the part file is already complete
+            if _total_size(response, 0) != offset:
+                # The part file doesn't belong to the remote file; start over
+                part_path.unlink(missing_ok=True)
+                meta_path.unlink(missing_ok=True)
+                return await _fetch(client, spec, chunk_bytes)
+            digest = await asyncio.to_thread(_hash_file, part_path)
+            return _finish(spec, digest, offset, validators, 0, resumed=True)
+
+        response.raise_for_status()
+        resumed = offset > 0 and response.status_code == 206
+        if not resumed:
+            offset = 0
+        validators = {
+            "url": spec.url,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+        }
+        meta_path.write_text(json.dumps(validators), encoding="utf-8")
+        total = _total_size(response, offset)
+
+        digest = await asyncio.to_thread(_hash_file, part_path) if resumed else hashlib.sha256()
+        downloaded = 0
+        buffer = bytearray()
+        with open(part_path, "ab" if resumed else "wb") as f:
+            try:
+                async for data in response.aiter_raw():
+                    buffer += data
+                    if len(buffer) >= chunk_bytes:
+                        await asyncio.to_thread(f.write, buffer)
+                        digest.update(buffer)
+                        downloaded += len(buffer)
+                        buffer = bytearray()
+            finally:
+                # Keep whatever arrived before a dropped connection, so it isn't fetched again
+                f.write(buffer)
+                digest.update(buffer)
+                downloaded += len(buffer)
+
+    size = offset + downloaded
+    if total is not None and size != total:
+        # Connection dropped early; keep the part file for the next attempt
+        raise httpx.RemoteProtocolError(f"Received {size} of {total} bytes from {spec.url}")
+    return _finish(spec, digest, size, validators, downloaded, resumed)
+
+
+def _finish(spec: DownloadSpec, digest, size: int, validators: dict, downloaded: int, resumed: bool) -> DownloadResult:
+    """Verify the part file and move it into place"""
+    part_path, meta_path = _part_paths(spec.path)
+    sha256 = digest.hexdigest()
+    if spec.sha256 and sha256 != spec.sha256.lower():
+        part_path.unlink(missing_ok=True)
+        meta_path.unlink(missing_ok=True)
+        raise ChecksumError(f"SHA-256 mismatch for {spec.url}: expected {spec.sha256}, got {sha256}")
+    os.replace(part_path, spec.path)
+    meta_path.unlink(missing_ok=True)
+    return DownloadResult(
+        url=spec.url,
+        path=spec.path,
+        size=size,
+        sha256=sha256,
+        etag=validators.get("etag"),
+        last_modified=validators.get("last_modified"),
+        downloaded_bytes=downloaded,
+        resumed=resumed,
+    )
+
+
+async def download_file(
+    client: httpx.AsyncClient,
+    spec: DownloadSpec,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    retries: int = 3,
+    backoff: float = 1.0,
+) -> DownloadResult:
+    """
+    Download one file, resuming its .part file if there is one.
+
+    Network errors and server errors are retried (resuming from what was
+    received) with exponential backoff. A checksum mismatch is not retried.
+    """
+    spec.path.parent.mkdir(parents=True, exist_ok=True)
+    attempt = 0
+    while True:
+        try:
+            return await _fetch(client, spec, chunk_bytes)
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500:
+                raise DownloadError(f"Could not download {spec.url}: {e}") from e
+            if attempt >= retries:
+                raise DownloadError(f"Could not download {spec.url} after {attempt + 1} attempts: {e}") from e
+        await asyncio.sleep(backoff * 2 ** attempt)
+        attempt += 1
+
+
+async def download_files(
+    specs: List[DownloadSpec],
+    concurrency: int = 3,
+    client: Optional[httpx.AsyncClient] = None,
+    **kwargs,
+) -> List[DownloadResult]:
+    """
+    Download independent files concurrently, at most `concurrency` at a time.
+
+    Every download runs to completion (or failure) before the first error
+    is raised, so finished files are kept and failed ones stay resumable.
+    Results are in the order of specs.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(http: httpx.AsyncClient, spec: DownloadSpec) -> DownloadResult:
+        async with semaphore:
+            return await download_file(http, spec, **kwargs)
+
+    async def run(http: httpx.AsyncClient) -> list:
+        return await asyncio.gather(*(limited(http, spec) for spec in specs), return_exceptions=True)
+
+    if client is None:
+        async with httpx.AsyncClient(timeout=httpx.Timeout(60.0, connect=10.0), follow_redirects=True) as http:
+            outcomes = await run(http)
+    else:
+        outcomes = await run(client)
+
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return outcomes
+
+
+async def remote_info(client: httpx.AsyncClient, url: str) -> Optional[RemoteInfo]:
+    """ETag, size and Last-Modified of a remote file, or None if the server can't tell"""
+    try:
+        response = await client.head(url, headers={"Accept-Encoding": "identity"})
+        response.raise_for_status()
+    except httpx.HTTPError:
+        return None
+    length = response.headers.get("content-length")
+    return RemoteInfo(
+        url=url,
+        etag=response.headers.get("etag"),
+        size=int(length) if length and length.isdigit() else None,
+        last_modified=response.headers.get("last-modified"),
+    )
+
+
+def huggingface_dataset_revision(dataset: str, timeout: float = 30.0) -> Optional[str]:
+    """Current commit of a Hugging Face dataset repository, or None if unavailable"""
+    try:
+        response = httpx.get(f"https://huggingface.co/api/datasets/{dataset}", timeout=timeout)
+        response.raise_for_status()
+        return response.json().get("sha")
+    except (httpx.HTTPError, ValueError):
+        return None
@@ -1,28 +1,136 @@
 """
 Data ingestion service for loading Telugu content into the vector database.
 """
+import asyncio
 import logging
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import AsyncIterator, Dict, List, Optional, Set
 
 from app.data.loaders.base import BaseLoader
 from app.data.loaders.tatoeba import TatoebaLoader
 from app.data.loaders.custom import CustomLoader
 from app.data.loaders.samanantar import SamanantatLoader
+from app.data.loaders.dakshina import DakshinaLoader
+from app.data.loaders.aksharantar import AksharantarLoader
+from app.data.loaders.indiccorp import IndicCorpLoader
+from app.data.checkpoint import CheckpointStore, ProgressTracker
+from app.data.corpus_cache import CorpusCacheLoader
+from app.data.content_index import ContentIndex, content_hash
+from app.data.dead_letter import DeadLetterLoader, DeadLetterWriter
+from app.data.dedup import MinHashDeduplicator
+from app.data.metrics import IngestionMetrics
 from app.data.models import ProcessedContent
+from app.data.quality import REJECT_REASONS, QualityFilter, QualityThresholds
+from app.data.pipeline import FairLimiter, Pipeline, PipelineStage
+from app.data.transliteration import TransliterationIndex, get_transliteration_index
+from app.core.config import settings
 from app.core.vector_db import vector_db
 from app.services.embedding import embedding_service
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SourceRun:
+    """State of one source's ingestion run"""
+    loader: BaseLoader
+    tracker: ProgressTracker
+    delta: bool = False
+    delete_missing: bool = False  # Mark every item read as seen, for _delete_missing
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    stats: dict = field(
+        default_factory=lambda: {
+            "processed": 0,
+            "stored": 0,
+            "errors": 0,
+            "added": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "deleted": 0,
+            "duplicates": 0,
+            "rejected": {reason: 0 for reason in REJECT_REASONS},
+            "transliterated": 0,
+        }
+    )
+    last_checkpoint: float = 0.0
+
+
+@dataclass
+class IngestBatch:
+    """A batch of content moving through the ingestion pipeline"""
+    run: SourceRun
+    seq: int
+    end_position: int  # Loader position just after the last item
+    items: List[ProcessedContent]
+    nbytes: int = 0  # UTF-8 size of the items' embedding text
+    embeddings: Optional[List[List[float]]] = None
+    hashes: Optional[List[str]] = None
+    known_ids: Set[str] = field(default_factory=set)  # Already in the content index
+    error: Optional[str] = None
+    failed_stage: Optional[str] = None
+
+
 class IngestionService:
     """Service for ingesting Telugu learning content into vector storage"""
     
-    BATCH_SIZE = 100  # Process embeddings in batches
-    
     def __init__(self):
         self.loaders: List[BaseLoader] = []
+        self._content_index: Optional[ContentIndex] = None
+        self.metrics = IngestionMetrics()
+        self.dead_letters: Optional[DeadLetterWriter] = None
+        self.deduplicator: Optional[MinHashDeduplicator] = None
+        self.quality_filter: Optional[QualityFilter] = None
+        self.transliteration_index: Optional[TransliterationIndex] = None
+        self.configure()
+    
+    def configure(
+        self,
+        batch_size: Optional[int] = None,
+        embed_workers: Optional[int] = None,
+        upsert_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        state_dir: Optional[Path] = None,
+        max_concurrent_sources: Optional[int] = None,
+        embed_budget: Optional[int] = None,
+    ) -> None:
+        """
+        Tune the ingestion pipeline. Unset values fall back to settings.
+        
+        Args:
+            batch_size: Items per embedding/upsert batch
+            embed_workers: Concurrent embedding calls per source
+            upsert_workers: Concurrent vector DB uploads per source
+            queue_size: Batches buffered between stages (bounds memory)
+            state_dir: Directory for checkpoints and other run state
+            max_concurrent_sources: Sources ingested at the same time
+            embed_budget: Concurrent embedding calls across all sources
+        """
+        self.batch_size = batch_size or settings.ingest_batch_size
+        self.embed_workers = embed_workers or settings.ingest_embed_workers
+        self.upsert_workers = upsert_workers or settings.ingest_upsert_workers
+        self.queue_size = queue_size or settings.ingest_queue_size
+        self.max_concurrent_sources = (
+            max_concurrent_sources or settings.ingest_max_concurrent_sources
+        )
+        self.embed_budget = embed_budget or settings.ingest_embed_budget
+        self._embed_limiter = FairLimiter(self.embed_budget)
+        self.state_dir = Path(state_dir or settings.ingest_state_dir)
+        self.checkpoints = CheckpointStore(self.state_dir / "checkpoints.json")
+        if self._content_index is not None:
+            self._content_index.close()
+            self._content_index = None
+    
+    @property
+    def content_index(self) -> ContentIndex:
+        """Hash index of stored content, opened on first use"""
+        if self._content_index is None:
+            self._content_index = ContentIndex(self.state_dir / "content_index.sqlite3")
+        return self._content_index
     
     def add_tatoeba_source(self, data_path: Path) -> bool:
         """Add Tatoeba as a data source"""
@@ -34,18 +142,37 @@ class IngestionService:
         logger.warning(f"Invalid Tatoeba source at {data_path}")
         return False
     
-    def add_samanantar_source(self, data_path: Path, max_items: int = None) -> bool:
+    def add_samanantar_source(
+        self,
+        data_path: Path,
+        max_items: int = None,
+        parse_workers: int = None,
+        sampling: str = None,
+        seed: int = None,
+    ) -> bool:
         """
         Add AI4Bharat Samanantar as a data source.
         
         Args:
             data_path: Path to samanantar data
             max_items: Limit number of items (useful for testing)
+            parse_workers: Processes for parallel parsing (default from settings)
+            sampling: How max_items are chosen: "head", "reservoir" or
+                "stratified" (default from settings)
+            seed: Random seed for sampling (default from settings)
         """
-        loader = SamanantatLoader(data_path, max_items=max_items)
+        loader = SamanantatLoader(
+            data_path,
+            max_items=max_items,
+            parse_workers=settings.ingest_parse_workers if parse_workers is None else parse_workers,
+            chunk_bytes=settings.ingest_parse_chunk_bytes,
+            sampling=sampling or settings.ingest_sample_mode,
+            seed=settings.ingest_sample_seed if seed is None else seed,
+        )
         if loader.validate_source():
             self.loaders.append(loader)
-            logger.info(f"Added Samanantar source from {data_path} (max: {max_items or 'all'})")
+            sample = f", {loader.sampling} sample" if max_items is not None else ""
+            logger.info(f"Added Samanantar source from {data_path} (max: {max_items or 'all'}{sample})")
             return True
         logger.warning(f"Invalid Samanantar source at {data_path}")
         return False
@@ -65,94 +192,507 @@ class IngestionService:
         logger.warning(f"Invalid custom source at {data_path}")
         return False
     
-    async def ingest_all(self) -> dict:
+    def add_dakshina_source(self, data_path: Path, max_items: int = None) -> bool:
+        """Add the Dakshina romanization lexicons as a data source"""
+        loader = DakshinaLoader(data_path, max_items=max_items)
+        if loader.validate_source():
+            self.loaders.append(loader)
+            logger.info(f"Added Dakshina source from {data_path}")
+            return True
+        logger.warning(f"Invalid Dakshina source at {data_path}")
+        return False
+    
+    def add_aksharantar_source(self, data_path: Path, max_items: int = None) -> bool:
+        """Add AI4Bharat Aksharantar transliteration pairs as a data source"""
+        loader = AksharantarLoader(data_path, max_items=max_items)
+        if loader.validate_source():
+            self.loaders.append(loader)
+            logger.info(f"Added Aksharantar source from {data_path}")
+            return True
+        logger.warning(f"Invalid Aksharantar source at {data_path}")
+        return False
+    
+    def add_indiccorp_source(
+        self,
+        data_path: Path,
+        max_items: int = None,
+        parse_workers: int = None,
+    ) -> bool:
+        """
+        Add IndicCorp Telugu monolingual sentences as a data source.
+        
+        Args:
+            data_path: Directory with te.txt (plain or compressed)
+            max_items: Limit number of sentences
+            parse_workers: Processes parsing shards (default from settings)
+        """
+        loader = IndicCorpLoader(
+            data_path,
+            max_items=max_items,
+            parse_workers=settings.ingest_parse_workers if parse_workers is None else parse_workers,
+            chunk_bytes=settings.ingest_parse_chunk_bytes,
+        )
+        if loader.validate_source():
+            self.loaders.append(loader)
+            logger.info(f"Added IndicCorp source from {data_path} (max: {max_items or 'all'})")
+            return True
+        logger.warning(f"Invalid IndicCorp source at {data_path}")
+        return False
+    
+    def add_corpus_cache_source(self, filepath: Path) -> bool:
+        """Add a compiled Parquet corpus cache (see scripts/compile_corpus.py)"""
+        loader = CorpusCacheLoader(filepath)
+        if loader.validate_source():
+            self.loaders.append(loader)
+            logger.info(f"Added corpus cache '{loader.source_name}' from {filepath}")
+            return True
+        logger.warning(f"Invalid or outdated corpus cache at {filepath}")
+        return False
+    
+    def add_dead_letter_source(self, filepath: Path) -> bool:
+        """Add a dead-letter file from an earlier run, to retry its items"""
+        loader = DeadLetterLoader(filepath)
+        if loader.validate_source():
+            self.loaders.append(loader)
+            logger.info(f"Added dead-letter source from {filepath}")
+            return True
+        logger.warning(f"Invalid dead-letter file at {filepath}")
+        return False
+    
+    async def ingest_all(
+        self,
+        resume: bool = False,
+        delta: bool = False,
+        delete_missing: bool = False,
+        dedup: bool = False,
+        quality_filter: bool = False,
+        transliterate: bool = False,
+    ) -> dict:
         """
         Ingest content from all registered sources.
-        Returns statistics about the ingestion.
+        Returns statistics about the ingestion; per-source stats are keyed
+        by the loader's checkpoint key, with its name under "source".
+        
+        Args:
+            resume: Continue each source from its last checkpoint and skip
+                sources that already completed
+            delta: Only embed and upload items that are new or changed
+                since they were last stored
+            delete_missing: Delete stored items that no longer appear in
+                their source (full, non-resumed runs only)
+            dedup: Drop near-duplicate items across all sources before
+                embedding (MinHash/LSH)
+            quality_filter: Drop low-quality pairs (wrong script, misaligned,
+                mostly digits or punctuation) before embedding
+            transliterate: Fill in missing transliterations from the
+                transliteration index (see scripts/build_transliteration_index.py)
         """
         stats = {
             "total_processed": 0,
             "total_stored": 0,
             "errors": 0,
+            "total_deleted": 0,
+            "total_duplicates": 0,
+            "total_rejected": 0,
+            "rejected": {reason: 0 for reason in REJECT_REASONS},
+            "total_transliterated": 0,
+            "failed_sources": [],
+            "dead_letters": 0,
+            "dead_letter_file": None,
             "sources": {},
         }
         
+        self.metrics = IngestionMetrics()
+        # One deduplicator for the whole run, so duplicates across sources are caught
+        self.deduplicator = MinHashDeduplicator(
+            num_perm=settings.dedup_num_perm,
+            bands=settings.dedup_bands,
+            shingle_size=settings.dedup_shingle_size,
+            threshold=settings.dedup_threshold,
+            max_entries=settings.dedup_max_entries,
+        ) if dedup else None
+        self.quality_filter = QualityFilter(QualityThresholds(
+            min_telugu_ratio=settings.quality_min_telugu_ratio,
+            min_length_ratio=settings.quality_min_length_ratio,
+            max_length_ratio=settings.quality_max_length_ratio,
+            max_digit_density=settings.quality_max_digit_density,
+            max_punct_density=settings.quality_max_punct_density,
+        )) if quality_filter else None
+        self.transliteration_index = get_transliteration_index() if transliterate else None
+        if transliterate and self.transliteration_index is None:
+            logger.warning(
+                f"No transliteration index at {settings.transliteration_index_path}; "
+                "transliterations will not be filled in"
+            )
+        run_stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        self.dead_letters = DeadLetterWriter(
+            self.state_dir / "dead_letter" / f"ingest-{run_stamp}-{uuid.uuid4().hex[:6]}.jsonl"
+        )
+        loaders = []
         for loader in self.loaders:
-            source_stats = await self._ingest_source(loader)
-            stats["sources"][loader.source_name] = source_stats
+            if resume and self.checkpoints.is_complete(loader.checkpoint_key):
+                logger.info(f"Skipping {loader.source_name}: completed in a previous run")
+                continue
+            loaders.append(loader)
+        
+        # Sources run side by side; the embed limiter shares embedding
+        # capacity between them round-robin so a huge corpus can't starve
+        # the small ones
+        source_slots = asyncio.Semaphore(self.max_concurrent_sources)
+        
+        async def run_source(loader: BaseLoader) -> dict:
+            async with source_slots:
+                return await self._ingest_source(
+                    loader,
+                    resume=resume,
+                    delta=delta,
+                    delete_missing=delete_missing,
+                )
+        
+        try:
+            results = await asyncio.gather(
+                *[run_source(loader) for loader in loaders],
+                return_exceptions=True,
+            )
+        finally:
+            self.dead_letters.close()
+        
+        if self.dead_letters.count:
+            stats["dead_letters"] = self.dead_letters.count
+            stats["dead_letter_file"] = str(self.dead_letters.path)
+            logger.warning(
+                f"{self.dead_letters.count} items failed; written to {self.dead_letters.path}"
+            )
+        
+        for loader, source_stats in zip(loaders, results):
+            if isinstance(source_stats, BaseException):
+                logger.error(f"Ingestion from {loader.source_name} failed: {source_stats}")
+                stats["failed_sources"].append(loader.checkpoint_key)
+                continue
+            
+            # Keyed like checkpoints, so sources sharing a name don't collide
+            stats["sources"][loader.checkpoint_key] = {"source": loader.source_name, **source_stats}
             stats["total_processed"] += source_stats["processed"]
             stats["total_stored"] += source_stats["stored"]
             stats["errors"] += source_stats["errors"]
+            stats["total_deleted"] += source_stats["deleted"]
+            stats["total_duplicates"] += source_stats["duplicates"]
+            stats["total_transliterated"] += source_stats["transliterated"]
+            for reason, count in source_stats["rejected"].items():
+                stats["rejected"][reason] += count
+                stats["total_rejected"] += count
         
         logger.info(f"Ingestion complete: {stats}")
         return stats
     
-    async def _ingest_source(self, loader: BaseLoader) -> dict:
-        """Ingest content from a single source"""
-        stats = {"processed": 0, "stored": 0, "errors": 0}
-        batch: List[ProcessedContent] = []
+    async def _ingest_source(
+        self,
+        loader: BaseLoader,
+        resume: bool = False,
+        delta: bool = False,
+        delete_missing: bool = False,
+    ) -> dict:
+        """
+        Ingest content from a single source.
         
-        logger.info(f"Starting ingestion from {loader.source_name}")
+        Loading, embedding and upserting run as overlapping pipeline stages
+        connected by bounded queues, so the loader keeps parsing while
+        earlier batches are embedded and uploaded.
+        """
+        start = self.checkpoints.position(loader.checkpoint_key) if resume else 0
+        run = SourceRun(
+            loader=loader,
+            tracker=ProgressTracker(start),
+            delta=delta,
+            delete_missing=delete_missing,
+        )
+        run.stats["resumed_from"] = start
         
-        async for content in loader.load():
+        if start:
+            logger.info(f"Resuming {loader.source_name} after {start} items")
+        else:
+            logger.info(f"Starting ingestion from {loader.source_name}")
+        
+        started = time.monotonic()
+        estimate = loader.estimate_total()
+        self.metrics.start_source(
+            loader.checkpoint_key,
+            loader.source_name,
+            max(estimate - start, 0) if estimate is not None else None,
+        )
+        
+        stages = []
+        if self.quality_filter is not None:
+            stages.append(PipelineStage("quality", self._filter_low_quality))
+        if self.deduplicator is not None:
+            stages.append(PipelineStage("dedup", self._filter_duplicates))
+        if self.transliteration_index is not None:
+            stages.append(PipelineStage("transliterate", self._fill_transliterations))
+        if delta:
+            stages.append(PipelineStage("delta", self._filter_unchanged))
+        pipeline = Pipeline(
+            stages=stages + [
+                PipelineStage("embed", self._embed_batch, self.embed_workers),
+                PipelineStage("upsert", self._upsert_batch, self.upsert_workers),
+            ],
+            queue_size=self.queue_size,
+        )
+        self.metrics.watch_queues(loader.checkpoint_key, pipeline.queue_depths)
+        try:
+            await pipeline.run(self._read_batches(run, start))
+        except BaseException:
+            # Keep whatever finished so an interrupted run can be resumed
+            self.checkpoints.update(loader.checkpoint_key, run.tracker.position)
+            raise
+        finally:
+            self.metrics.finish_source(loader.checkpoint_key)
+        
+        self.checkpoints.update(loader.checkpoint_key, run.tracker.position, complete=True)
+        run.stats["elapsed_seconds"] = round(time.monotonic() - started, 2)
+        
+        if delete_missing:
+            if start or loader.is_partial:
+                logger.warning(
+                    f"Not deleting missing items for {loader.source_name}: "
+                    "the run did not cover the whole source"
+                )
+            elif run.stats["errors"]:
+                # Failed batches were dead-lettered, not stored; keep everything until they are retried
+                logger.warning(
+                    f"Not deleting missing items for {loader.source_name}: "
+                    f"{run.stats['errors']} items failed in this run"
+                )
+            else:
+                await self._delete_missing(run)
+        
+        logger.info(f"Completed {loader.source_name}: {run.stats}")
+        return run.stats
+    
+    async def _read_batches(self, run: SourceRun, start: int = 0) -> AsyncIterator[IngestBatch]:
+        """
+        Group loader output into fixed-size batches.
+        The first `start` items were stored by an earlier run and are skipped.
+        """
+        source = run.loader.checkpoint_key
+        batch: List[ProcessedContent] = []
+        nbytes = 0
+        position = 0
+        seq = 0
+        load_seconds = 0.0
+        
+        contents = run.loader.load().__aiter__()
+        while True:
+            # Time only the loader itself, not downstream backpressure
+            load_start = time.perf_counter()
+            try:
+                content = await contents.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                load_seconds += time.perf_counter() - load_start
+            
+            position += 1
+            if position <= start:
+                continue
+            
             batch.append(content)
-            stats["processed"] += 1
+            nbytes += len(content.text.encode("utf-8"))
+            run.stats["processed"] += 1
             
-            if len(batch) >= self.BATCH_SIZE:
-                stored = await self._store_batch(batch)
-                stats["stored"] += stored
-                stats["errors"] += len(batch) - stored
+            if len(batch) >= self.batch_size:
+                self.metrics.add_stage_time("load", load_seconds, len(batch), nbytes)
+                self.metrics.record_loaded(source, len(batch), nbytes)
+                self._mark_seen(run, batch)
+                yield IngestBatch(run=run, seq=seq, end_position=position, items=batch, nbytes=nbytes)
+                seq += 1
                 batch = []
+                nbytes = 0
+                load_seconds = 0.0
             
-            if stats["processed"] % 1000 == 0:
-                logger.info(f"Processed {stats['processed']} items from {loader.source_name}")
+            if run.stats["processed"] % 10000 == 0:
+                logger.info(f"Processed {run.stats['processed']} items from {source}")
         
-        # Store remaining items
+        # Flush remaining items
         if batch:
-            stored = await self._store_batch(batch)
-            stats["stored"] += stored
-            stats["errors"] += len(batch) - stored
-        
-        logger.info(f"Completed {loader.source_name}: {stats}")
-        return stats
+            self.metrics.add_stage_time("load", load_seconds, len(batch), nbytes)
+            self.metrics.record_loaded(source, len(batch), nbytes)
+            self._mark_seen(run, batch)
+            yield IngestBatch(run=run, seq=seq, end_position=position, items=batch, nbytes=nbytes)
+    
+    def _mark_seen(self, run: SourceRun, items: List[ProcessedContent]) -> None:
+        """
+        Record that items are still in the source, before any stage can
+        drop or fail them, so _delete_missing only removes items the
+        source no longer contains.
+        """
+        if run.delete_missing:
+            self.content_index.touch(run.loader.checkpoint_key, [item.id for item in items], run.run_id)
     
-    async def _store_batch(self, batch: List[ProcessedContent]) -> int:
-        """Store a batch of content items with embeddings"""
-        stored = 0
+    async def _filter_low_quality(self, batch: IngestBatch) -> IngestBatch:
+        """Drop pairs that fail the quality checks"""
+        with self.metrics.time_stage("quality", len(batch.items)):
+            kept, rejected = self.quality_filter.filter(batch.items)
+        for reason, count in rejected.items():
+            batch.run.stats["rejected"][reason] += count
+        batch.items = kept
+        return batch
+    
+    async def _filter_duplicates(self, batch: IngestBatch) -> IngestBatch:
+        """Drop near-duplicates of content already seen in this run"""
+        with self.metrics.time_stage("dedup", len(batch.items)):
+            kept = self.deduplicator.filter(batch.items)
+        batch.run.stats["duplicates"] += len(batch.items) - len(kept)
+        batch.items = kept
+        return batch
+    
+    async def _fill_transliterations(self, batch: IngestBatch) -> IngestBatch:
+        """Romanize items that have no transliteration, the whole batch at once"""
+        missing = [item for item in batch.items if not item.transliteration]
+        if not missing:
+            return batch
+        with self.metrics.time_stage("transliterate", len(missing)):
+            romanized = self.transliteration_index.romanize_batch(
+                [item.telugu_text for item in missing],
+                min_coverage=settings.transliteration_min_coverage,
+            )
+        for item, transliteration in zip(missing, romanized):
+            if transliteration is not None:
+                item.transliteration = transliteration
+                batch.run.stats["transliterated"] += 1
+        return batch
+    
+    async def _filter_unchanged(self, batch: IngestBatch) -> IngestBatch:
+        """Drop items whose stored hash matches, so they skip embedding"""
+        with self.metrics.time_stage("delta", len(batch.items)):
+            hashes = [content_hash(item) for item in batch.items]
+            stored = {}
+            for key, items in self._group_by_index_key(batch.run, batch.items).items():
+                stored.update(self.content_index.lookup(key, [item.id for item in items]))
+            batch.known_ids = set(stored)
         
+        changed = [
+            (item, digest)
+            for item, digest in zip(batch.items, hashes)
+            if stored.get(item.id) != digest
+        ]
+        batch.run.stats["unchanged"] += len(batch.items) - len(changed)
+        batch.items = [item for item, _ in changed]
+        batch.hashes = [digest for _, digest in changed]
+        return batch
+    
+    async def _embed_batch(self, batch: IngestBatch) -> IngestBatch:
+        """Generate embeddings for all texts in a batch"""
+        if not batch.items:
+            return batch
         try:
-            # Generate embeddings for all texts in batch
-            texts = [item.text for item in batch]
-            embeddings = await embedding_service.embed_texts(texts)
-            
-            # Store each item with its embedding
-            for content, embedding in zip(batch, embeddings):
-                try:
-                    payload = {
-                        "content_type": content.content_type.value,
-                        "telugu_text": content.telugu_text,
-                        "english_text": content.english_text,
-                        "transliteration": content.transliteration,
-                        "difficulty": content.difficulty.value,
-                        "domains": content.domains,
-                        "source": content.source,
-                        "license": content.license,
-                        "metadata": content.metadata,
-                    }
-                    
-                    await vector_db.upsert_content(
-                        content_id=content.id,
-                        embedding=embedding,
-                        payload=payload,
-                    )
-                    stored += 1
-                except Exception as e:
-                    logger.error(f"Failed to store content {content.id}: {e}")
-        
+            texts = [item.text for item in batch.items]
+            async with self._embed_limiter.slot(batch.run.loader.checkpoint_key):
+                with self.metrics.time_stage("embed", len(texts), batch.nbytes):
+                    batch.embeddings = await embedding_service.embed_texts(texts)
         except Exception as e:
             logger.error(f"Failed to generate embeddings for batch: {e}")
+            batch.error = str(e)
+            batch.failed_stage = "embed"
+        return batch
+    
+    async def _upsert_batch(self, batch: IngestBatch) -> None:
+        """Store an embedded batch in the vector database"""
+        stats = batch.run.stats
+        if batch.error is None and batch.items:
+            try:
+                with self.metrics.time_stage("upsert", len(batch.items)):
+                    await vector_db.upsert_contents([
+                        (content.id, embedding, self._build_payload(content))
+                        for content, embedding in zip(batch.items, batch.embeddings)
+                    ])
+                stats["stored"] += len(batch.items)
+                self._record_stored(batch)
+            except Exception as e:
+                logger.error(f"Failed to store batch from {batch.run.loader.source_name}: {e}")
+                batch.error = str(e)
+                batch.failed_stage = "upsert"
+        
+        if batch.error is not None:
+            stats["errors"] += len(batch.items)
+            for key, items in self._group_by_index_key(batch.run, batch.items).items():
+                self.dead_letters.write(
+                    items,
+                    error=batch.error,
+                    stage=batch.failed_stage,
+                    source_key=key,
+                )
+        
+        self._finish_batch(batch)
+    
+    def _record_stored(self, batch: IngestBatch) -> None:
+        """Remember hashes of stored items for later delta runs"""
+        run = batch.run
+        hashes = batch.hashes or [content_hash(item) for item in batch.items]
+        digests = {item.id: digest for item, digest in zip(batch.items, hashes)}
+        for key, items in self._group_by_index_key(run, batch.items).items():
+            self.content_index.record(
+                key,
+                [(item.id, digests[item.id]) for item in items],
+                run.run_id,
+            )
+        if run.delta:
+            updated = sum(1 for item in batch.items if item.id in batch.known_ids)
+            run.stats["updated"] += updated
+            run.stats["added"] += len(batch.items) - updated
+    
+    def _group_by_index_key(
+        self,
+        run: SourceRun,
+        items: List[ProcessedContent],
+    ) -> Dict[str, List[ProcessedContent]]:
+        """Items grouped by the source key they are indexed under (see BaseLoader.index_key)"""
+        groups = defaultdict(list)
+        for item in items:
+            groups[run.loader.index_key(item)].append(item)
+        return groups
+    
+    async def _delete_missing(self, run: SourceRun) -> None:
+        """Delete stored items that the source no longer contains"""
+        key = run.loader.checkpoint_key
+        stale = self.content_index.stale_ids(key, run.run_id)
+        
+        for i in range(0, len(stale), self.batch_size):
+            chunk = stale[i:i + self.batch_size]
+            try:
+                await vector_db.delete_contents(chunk)
+            except Exception as e:
+                logger.error(f"Failed to delete {len(chunk)} items from {run.loader.source_name}: {e}")
+                continue
+            self.content_index.remove(key, chunk)
+            run.stats["deleted"] += len(chunk)
+        
+        if stale:
+            logger.info(f"Deleted {run.stats['deleted']} missing items from {run.loader.source_name}")
+    
+    def _finish_batch(self, batch: IngestBatch) -> None:
+        """Advance the source checkpoint once a batch has left the pipeline"""
+        run = batch.run
+        if not run.tracker.finish(batch.seq, batch.end_position):
+            return
         
-        return stored
+        now = time.monotonic()
+        if now - run.last_checkpoint >= settings.ingest_checkpoint_interval:
+            self.checkpoints.update(run.loader.checkpoint_key, run.tracker.position)
+            run.last_checkpoint = now
+    
+    def _build_payload(self, content: ProcessedContent) -> dict:
+        """Vector DB payload for a content item"""
+        return {
+            "content_type": content.content_type.value,
+            "telugu_text": content.telugu_text,
+            "english_text": content.english_text,
+            "transliteration": content.transliteration,
+            "difficulty": content.difficulty.value,
+            "domains": content.domains,
+            "source": content.source,
+            "license": content.license,
+            "metadata": content.metadata,
+        }
 
 
 # Singleton instance
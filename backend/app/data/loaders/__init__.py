@@ -3,5 +3,16 @@ from app.data.loaders.base import BaseLoader
 from app.data.loaders.tatoeba import TatoebaLoader
 from app.data.loaders.custom import CustomLoader
 from app.data.loaders.samanantar import SamanantatLoader
+from app.data.loaders.dakshina import DakshinaLoader
+from app.data.loaders.aksharantar import AksharantarLoader
+from app.data.loaders.indiccorp import IndicCorpLoader
 
-__all__ = ["BaseLoader", "TatoebaLoader", "CustomLoader", "SamanantatLoader"]
+__all__ = [
+    "BaseLoader",
+    "TatoebaLoader",
+    "CustomLoader",
+    "SamanantatLoader",
+    "DakshinaLoader",
+    "AksharantarLoader",
+    "IndicCorpLoader",
+]
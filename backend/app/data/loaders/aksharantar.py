@@ -0,0 +1,131 @@
+"""
+Loader for AI4Bharat Aksharantar transliteration pairs.
+Aksharantar pairs Telugu words with romanized (English-script) spellings
+mined from many sources.
+
+Expected files, JSON Lines despite the .json extension:
+- tel_train.json, tel_valid.json, tel_test.json
+  {"unique_identifier": ..., "native word": ..., "english word": ...,
+   "source": ..., "score": ...}
+
+The files can stay inside the downloaded tel.zip, or be compressed
+(.gz, .bz2, .xz, .zst). Every line becomes one item; files are read and
+decoded in chunks in a background thread.
+
+Download from: https://github.com/AI4Bharat/IndicXlit
+"""
+import unicodedata
+from functools import partial
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Tuple
+
+from app.data.difficulty import get_difficulty_scorer
+from app.data.domains import get_domain_classifier
+from app.data.loaders.base import BaseLoader
+from app.data.loaders.readahead import iter_parsed_chunks
+from app.data.models import ContentType, ProcessedContent
+from app.data.readers import DataFile, find_data_file, find_zip_member, parse_json_lines
+
+SPLITS = ["train", "valid", "test"]
+
+# Bytes of JSON Lines decoded (and pairs scored and tagged) together
+_CHUNK_BYTES = 256 << 10
+
+# (native, romanized, record) for one line
+Record = Tuple[str, str, dict]
+
+
+class AksharantarLoader(BaseLoader):
+    """Loader for Aksharantar Telugu-romanized word pairs"""
+
+    def __init__(self, data_path: Path, max_items: int = None):
+        """
+        Args:
+            data_path: Directory with tel_*.json files or tel.zip
+            max_items: Maximum pairs to load (None for all)
+        """
+        super().__init__(data_path)
+        self.max_items = max_items
+        self._domains = get_domain_classifier()
+        self._difficulty = get_difficulty_scorer()
+
+    @property
+    def source_name(self) -> str:
+        return "AI4Bharat Aksharantar"
+
+    @property
+    def license(self) -> str:
+        return "CC BY 4.0"
+
+    @property
+    def is_partial(self) -> bool:
+        return self.max_items is not None
+
+    def validate_source(self) -> bool:
+        """Check for at least one split"""
+        return bool(self._split_files())
+
+    def _split_files(self) -> List[Tuple[str, DataFile]]:
+        """(split, file) for each split found, extracted or inside tel.zip"""
+        files = []
+        for split in SPLITS:
+            name = f"tel_{split}.json"
+            data_file = find_data_file(self.data_path, name) or find_zip_member(
+                self.data_path / "tel.zip", name
+            )
+            if data_file:
+                files.append((split, data_file))
+        return files
+
+    async def load(self) -> AsyncIterator[ProcessedContent]:
+        """Load Telugu-romanized word pairs"""
+        count = 0
+        for split, split_file in self._split_files():
+            parse = partial(_parse_records, name=split_file.name)
+            batches = iter_parsed_chunks(split_file, parse, _CHUNK_BYTES)
+            try:
+                async for batch in batches:
+                    natives = [native for native, _, _ in batch]
+                    difficulties = self._difficulty.score_batch(natives)
+                    domains = self._domains.classify_batch([("", native) for native in natives])
+
+                    for (native, romanized, record), difficulty, item_domains in zip(batch, difficulties, domains):
+                        if self.max_items is not None and count >= self.max_items:
+                            return
+                        yield ProcessedContent.model_construct(
+                            id=self.content_id(native, romanized),
+                            content_type=ContentType.TRANSLITERATION,
+                            text=f"{native} | {romanized}",
+                            telugu_text=native,
+                            english_text=romanized,
+                            transliteration=romanized,
+                            difficulty=difficulty,
+                            domains=item_domains,
+                            source=self.source_name,
+                            license=self.license,
+                            metadata={
+                                "split": split,
+                                "aksharantar_id": record.get("unique_identifier"),
+                                "corpus_source": record.get("source"),
+                                "score": record.get("score"),
+                            },
+                        )
+                        count += 1
+            finally:
+                await batches.aclose()
+
+
+def _parse_records(chunk: bytes, name: str) -> List[Record]:
+    """(native, romanized, record) for each line of a JSON Lines chunk, skipping bad lines"""
+    records = []
+    for record in parse_json_lines(chunk, name):
+        native = _field(record, "native word")
+        romanized = _field(record, "english word")
+        if native and romanized:
+            records.append((unicodedata.normalize("NFC", native), romanized.lower(), record))
+    return records
+
+
+def _field(record: dict, name: str) -> Optional[str]:
+    value = record.get(name)
+    return value.strip() if isinstance(value, str) else None
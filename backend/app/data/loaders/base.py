@@ -2,10 +2,10 @@
 Base loader interface for data sources.
 """
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, List
+from typing import AsyncIterator, List, Optional
 from pathlib import Path
 
-from app.data.models import ProcessedContent
+from app.data.models import ProcessedContent, make_content_id
 
 
 class BaseLoader(ABC):
@@ -38,3 +38,39 @@ class BaseLoader(ABC):
     def license(self) -> str:
         """License of the data source"""
         pass
+    
+    @property
+    def is_partial(self) -> bool:
+        """True when the loader is configured to yield only part of the source"""
+        return False
+    
+    def estimate_total(self) -> Optional[int]:
+        """
+        Rough number of items load() will yield, used for progress ETAs.
+        None when the loader can't tell cheaply.
+        """
+        return None
+    
+    @property
+    def checkpoint_key(self) -> str:
+        """Key identifying this source's ingestion progress across runs"""
+        return f"{self.source_name}:{self.data_path}"
+    
+    def index_key(self, content: ProcessedContent) -> str:
+        """Source key an item's content-index entry is recorded under"""
+        return self.checkpoint_key
+    
+    def content_id(self, telugu: str, english: str) -> str:
+        """Deterministic ID for a content item from this source"""
+        return make_content_id(self.source_name, telugu, english)
+
+
+def estimate_line_count(filepath: Path, sample_bytes: int = 1 << 20) -> int:
+    """Estimate lines in a text file from the average length of its first lines"""
+    size = filepath.stat().st_size
+    with open(filepath, "rb") as f:
+        sample = f.read(sample_bytes)
+    lines = sample.count(b"\n")
+    if not lines or len(sample) >= size:
+        return max(lines, 1 if sample else 0)
+    return int(size / (len(sample) / lines))
@@ -0,0 +1,172 @@
+"""
+Helpers for parsing large line-oriented files in parallel.
+
+Files are split at line boundaries into byte ranges that worker
+processes read and parse independently; compressed streams are cut into
+line-aligned chunks that are sent to the workers instead. Results come back in file
+order, so loaders keep yielding items in the same sequence as a
+sequential read and checkpoint positions stay valid.
+"""
+import asyncio
+import mmap
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Callable, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+ByteRange = Tuple[int, int]
+
+_SCAN_BLOCK = 16 << 20
+
+
+def line_ranges(filepath: Path, chunk_bytes: int) -> List[ByteRange]:
+    """Split a file into ranges of about chunk_bytes that end on a newline"""
+    size = filepath.stat().st_size
+    if not size:
+        return []
+
+    ranges = []
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            newline = mm.find(b"\n", min(start + chunk_bytes, size) - 1)
+            end = size if newline < 0 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _newline_offsets(mm: mmap.mmap, targets: List[int]) -> List[int]:
+    """Offset just past the n-th newline for each ascending n in targets"""
+    offsets = []
+    position = 0
+    seen = 0
+    for target in targets:
+        while True:
+            needed = target - seen
+            if needed <= 0:
+                offsets.append(position)
+                break
+            block = mm[position:position + _SCAN_BLOCK]
+            if not block:
+                # File has fewer lines than the target
+                offsets.append(position)
+                break
+            found = block.count(b"\n")
+            if found < needed:
+                seen += found
+                position += len(block)
+                continue
+            newlines = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == 0x0A)
+            position += int(newlines[needed - 1]) + 1
+            seen = target
+            offsets.append(position)
+            break
+    return offsets
+
+
+def aligned_line_ranges(
+    first: Path,
+    second: Path,
+    chunk_bytes: int,
+) -> List[Tuple[ByteRange, ByteRange]]:
+    """
+    Split two line-aligned files (line i of one pairs with line i of the
+    other) into chunks that cover the same lines in both.
+    """
+    first_ranges = line_ranges(first, chunk_bytes)
+    second_size = second.stat().st_size
+    if not first_ranges or not second_size:
+        return []
+
+    # Cumulative line count at the end of each chunk of the first file
+    targets = []
+    lines = 0
+    with open(first, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start, end in first_ranges[:-1]:
+            lines += mm[start:end].count(b"\n")
+            targets.append(lines)
+
+    with open(second, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        boundaries = _newline_offsets(mm, targets)
+
+    starts = [0] + boundaries
+    ends = boundaries + [second_size]
+    return list(zip(first_ranges, zip(starts, ends)))
+
+
+def read_lines(filepath: Path, byte_range: ByteRange) -> List[str]:
+    """Decode the lines in a byte range, without line endings"""
+    start, end = byte_range
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    lines = data.decode("utf-8").split("\n")
+    if lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def read_line_chunks(stream: BinaryIO, chunk_bytes: int) -> Iterator[bytes]:
+    """
+    Cut a byte stream (e.g. a decompressing reader) into chunks of about
+    chunk_bytes that end on a newline, for inputs that can't be split by
+    byte range.
+    """
+    carry = b""
+    while True:
+        block = stream.read(chunk_bytes)
+        if not block:
+            break
+        data = carry + block
+        newline = data.rfind(b"\n")
+        if newline < 0:
+            carry = data
+            continue
+        carry = data[newline + 1:]
+        yield data[:newline + 1]
+    if carry:
+        yield carry
+
+
+async def map_ordered(
+    func: Callable[..., Any],
+    tasks: Iterable[tuple],
+    workers: int,
+    prefetch: int = None,
+) -> AsyncIterator[Any]:
+    """
+    Run func(*task) for each task in a process pool, yielding results in
+    task order. At most prefetch tasks are in flight, bounding memory.
+
+    Tasks are drawn from the iterable in a worker thread, so a lazy task
+    generator may scan or decompress the input without blocking the
+    event loop.
+    """
+    loop = asyncio.get_running_loop()
+    # Spawned workers don't inherit the event loop or its threads
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    limit = prefetch or workers * 2
+    pending: deque = deque()
+    task_iter = iter(tasks)
+    try:
+        while True:
+            task = await asyncio.to_thread(next, task_iter, None)
+            if task is None:
+                break
+            pending.append(loop.run_in_executor(executor, func, *task))
+            if len(pending) >= limit:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+        # Wait for the workers to exit, so closing early doesn't leak them
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
@@ -1,28 +1,36 @@
 """
 Loader for custom JSON/CSV content files.
 Supports flexible formats for user-provided Telugu learning content.
+Files may be compressed (.gz, .bz2, .xz, .zst). JSON and JSON Lines
+files are streamed item by item, so they can be larger than memory, and
+all files are read in a background thread so the event loop stays free.
 """
 import csv
-import json
-import uuid
+from functools import partial
 from pathlib import Path
-from typing import AsyncIterator, List
+from typing import AsyncIterator, Callable, Iterator, List
 
+from app.data.difficulty import get_difficulty_scorer
+from app.data.domains import get_domain_classifier
 from app.data.loaders.base import BaseLoader
+from app.data.loaders.readahead import iter_parsed_chunks, iter_row_batches
 from app.data.models import (
     ProcessedContent,
     ContentType,
     DifficultyLevel,
 )
+from app.data.readers import DataFile, find_data_files, iter_json_items, parse_json_lines
 
 
 class CustomLoader(BaseLoader):
-    """Loader for custom content files (JSON/CSV)"""
+    """Loader for custom content files (JSON/JSONL/CSV)"""
     
     def __init__(self, data_path: Path, source_name: str = "Custom", license_info: str = "Custom"):
         super().__init__(data_path)
         self._source_name = source_name
         self._license = license_info
+        self._domains = get_domain_classifier()
+        self._difficulty = get_difficulty_scorer()
     
     @property
     def source_name(self) -> str:
@@ -37,25 +45,31 @@ class CustomLoader(BaseLoader):
         if not self.data_path.exists():
             return False
         
-        # Check for JSON or CSV files
-        json_files = list(self.data_path.glob("*.json"))
-        csv_files = list(self.data_path.glob("*.csv"))
+        # Check for JSON, JSON Lines or CSV files
+        json_files = find_data_files(self.data_path, ".json")
+        jsonl_files = find_data_files(self.data_path, ".jsonl")
+        csv_files = find_data_files(self.data_path, ".csv")
         
-        return len(json_files) > 0 or len(csv_files) > 0
+        return len(json_files) > 0 or len(jsonl_files) > 0 or len(csv_files) > 0
     
     async def load(self) -> AsyncIterator[ProcessedContent]:
-        """Load content from all JSON and CSV files in the data path"""
+        """Load content from all JSON, JSON Lines and CSV files in the data path"""
         # Load JSON files
-        for json_file in self.data_path.glob("*.json"):
+        for json_file in find_data_files(self.data_path, ".json"):
             async for content in self._load_json(json_file):
                 yield content
         
+        # Load JSON Lines files
+        for jsonl_file in find_data_files(self.data_path, ".jsonl"):
+            async for content in self._load_jsonl(jsonl_file):
+                yield content
+        
         # Load CSV files
-        for csv_file in self.data_path.glob("*.csv"):
+        for csv_file in find_data_files(self.data_path, ".csv"):
             async for content in self._load_csv(csv_file):
                 yield content
     
-    async def _load_json(self, filepath: Path) -> AsyncIterator[ProcessedContent]:
+    async def _load_json(self, json_file: DataFile) -> AsyncIterator[ProcessedContent]:
         """
         Load from JSON file.
         
@@ -68,91 +82,133 @@ class CustomLoader(BaseLoader):
                     "english": "English text",
                     "transliteration": "telugu text" (optional),
                     "difficulty": "beginner|intermediate|advanced" (optional),
-                    "domains": ["office", "family"] (optional),
+                    "domains": ["office", "family"] (optional; detected if missing),
                     "metadata": {} (optional)
                 }
             ]
         }
-        """
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
         
-        items = data.get("content", data) if isinstance(data, dict) else data
+        A top-level array of items also works. Items are decoded as the
+        file is read.
+        """
+        def read_items() -> Iterator[dict]:
+            with json_file.open_text() as f:
+                for item in iter_json_items(f, key="content"):
+                    if isinstance(item, dict):
+                        yield item
         
-        for item in items:
-            if isinstance(item, dict):
-                content = self._parse_item(item)
-                if content:
-                    yield content
+        async for content in self._load_batches(iter_row_batches(read_items), self._parse_item):
+            yield content
     
-    async def _load_csv(self, filepath: Path) -> AsyncIterator[ProcessedContent]:
+    async def _load_jsonl(self, jsonl_file: DataFile) -> AsyncIterator[ProcessedContent]:
+        """
+        Load from a JSON Lines file: one item object (as in _load_json) per
+        line. Malformed lines are skipped and logged.
+        """
+        batches = iter_parsed_chunks(jsonl_file, partial(parse_json_lines, name=jsonl_file.name))
+        async for content in self._load_batches(batches, self._parse_item):
+            yield content
+    
+    async def _load_csv(self, csv_file: DataFile) -> AsyncIterator[ProcessedContent]:
         """
         Load from CSV file.
         
         Expected columns: telugu, english, transliteration (optional), 
                          type (optional), difficulty (optional), domains (optional)
         """
-        with open(filepath, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                content = self._parse_csv_row(row)
-                if content:
+        def read_rows() -> Iterator[dict]:
+            with csv_file.open_text(newline="") as f:
+                yield from csv.DictReader(f)
+        
+        async for content in self._load_batches(iter_row_batches(read_rows), self._parse_csv_row):
+            yield content
+    
+    async def _load_batches(
+        self,
+        batches: AsyncIterator[List[dict]],
+        read_fields: Callable[[dict], dict | None],
+    ) -> AsyncIterator[ProcessedContent]:
+        """Build content from batches of raw items read in the background"""
+        try:
+            async for batch in batches:
+                rows = [fields for fields in map(read_fields, batch) if fields]
+                for content in self._build_contents(rows):
                     yield content
+        finally:
+            await batches.aclose()
     
-    def _parse_item(self, item: dict) -> ProcessedContent | None:
-        """Parse a JSON item into ProcessedContent"""
+    def _build_contents(self, rows: List[dict]) -> List[ProcessedContent]:
+        """
+        Content for a batch of item fields. Items without a difficulty or
+        domains are scored and tagged together, one batch call each.
+        """
+        unscored = [i for i, row in enumerate(rows) if row["difficulty"] is None]
+        untagged = [i for i, row in enumerate(rows) if not row["domains"]]
+        difficulties = dict(zip(
+            unscored,
+            self._difficulty.score_batch([rows[i]["telugu"] for i in unscored]),
+        ))
+        domains = dict(zip(
+            untagged,
+            self._domains.classify_batch([(rows[i]["english"], rows[i]["telugu"]) for i in untagged]),
+        ))
+        
+        return [
+            ProcessedContent(
+                id=self.content_id(row["telugu"], row["english"]),
+                content_type=row["content_type"],
+                text=f"{row['telugu']} | {row['english']}",
+                telugu_text=row["telugu"],
+                english_text=row["english"],
+                transliteration=row["transliteration"],
+                difficulty=difficulties.get(i, row["difficulty"]),
+                domains=domains.get(i, row["domains"]),
+                source=self.source_name,
+                license=self.license,
+                metadata=row["metadata"],
+            )
+            for i, row in enumerate(rows)
+        ]
+    
+    def _parse_item(self, item: dict) -> dict | None:
+        """Fields of a JSON item, or None if it lacks either text"""
         telugu = item.get("telugu", "").strip()
         english = item.get("english", "").strip()
         
         if not telugu or not english:
             return None
         
-        content_type = self._parse_content_type(item.get("type", "sentence"))
-        difficulty = self._parse_difficulty(item.get("difficulty", "intermediate"))
-        domains = item.get("domains", [])
-        
-        return ProcessedContent(
-            id=str(uuid.uuid4()),
-            content_type=content_type,
-            text=f"{telugu} | {english}",
-            telugu_text=telugu,
-            english_text=english,
-            transliteration=item.get("transliteration"),
-            difficulty=difficulty,
-            domains=domains,
-            source=self.source_name,
-            license=self.license,
-            metadata=item.get("metadata", {}),
-        )
+        return {
+            "telugu": telugu,
+            "english": english,
+            "content_type": self._parse_content_type(item.get("type", "sentence")),
+            "difficulty": self._given_difficulty(item.get("difficulty")),
+            "domains": item.get("domains") or None,
+            "transliteration": item.get("transliteration"),
+            "metadata": item.get("metadata", {}),
+        }
     
-    def _parse_csv_row(self, row: dict) -> ProcessedContent | None:
-        """Parse a CSV row into ProcessedContent"""
+    def _parse_csv_row(self, row: dict) -> dict | None:
+        """Fields of a CSV row, or None if it lacks either text"""
         telugu = row.get("telugu", "").strip()
         english = row.get("english", "").strip()
         
         if not telugu or not english:
             return None
         
-        content_type = self._parse_content_type(row.get("type", "sentence"))
-        difficulty = self._parse_difficulty(row.get("difficulty", "intermediate"))
-        
         # Parse domains from comma-separated string
         domains_str = row.get("domains", "")
         domains = [d.strip() for d in domains_str.split(",") if d.strip()]
         
-        return ProcessedContent(
-            id=str(uuid.uuid4()),
-            content_type=content_type,
-            text=f"{telugu} | {english}",
-            telugu_text=telugu,
-            english_text=english,
-            transliteration=row.get("transliteration"),
-            difficulty=difficulty,
-            domains=domains,
-            source=self.source_name,
-            license=self.license,
-        )
+        return {
+            "telugu": telugu,
+            "english": english,
+            "content_type": self._parse_content_type(row.get("type", "sentence")),
+            "difficulty": self._given_difficulty(row.get("difficulty")),
+            "domains": domains or None,
+            "transliteration": row.get("transliteration"),
+            "metadata": {},
+        }
     
     def _parse_content_type(self, type_str: str) -> ContentType:
         """Parse content type string"""
@@ -179,3 +235,9 @@ class CustomLoader(BaseLoader):
             "hard": DifficultyLevel.ADVANCED,
         }
         return diff_map.get(diff_str.lower(), DifficultyLevel.INTERMEDIATE)
+    
+    def _given_difficulty(self, diff_str: str | None) -> DifficultyLevel | None:
+        """Difficulty given in the file, or None to score it from the Telugu text"""
+        if diff_str and diff_str.strip():
+            return self._parse_difficulty(diff_str.strip())
+        return None
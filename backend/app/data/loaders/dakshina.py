@@ -0,0 +1,134 @@
+"""
+Loader for the Dakshina transliteration lexicons.
+Dakshina pairs native-script Telugu words with their romanizations, as
+attested by native speakers.
+
+Expected layout (the extracted dataset, or any directory below it):
+- te/lexicons/te.translit.sampled.{train,dev,test}.tsv
+  Columns: native word, romanization, attestation count
+
+Lines for the same native word are consecutive; each native word becomes
+one item with its most attested romanization, and the alternatives are
+kept in the metadata. Files may also be compressed (.gz, .bz2, .xz, .zst).
+
+Download from: https://github.com/google-research-datasets/dakshina
+"""
+import csv
+import itertools
+import unicodedata
+from pathlib import Path
+from typing import AsyncIterator, Iterator, List, Tuple
+
+from app.data.difficulty import get_difficulty_scorer
+from app.data.domains import get_domain_classifier
+from app.data.loaders.base import BaseLoader
+from app.data.loaders.readahead import iter_row_batches
+from app.data.models import ContentType, ProcessedContent
+from app.data.readers import DataFile, find_data_file
+
+SPLITS = ["train", "dev", "test"]
+
+# (native word, [(romanization, attestations), ...] most attested first)
+LexiconEntry = Tuple[str, List[Tuple[str, int]]]
+
+
+class DakshinaLoader(BaseLoader):
+    """Loader for Dakshina Telugu romanization lexicons"""
+
+    def __init__(self, data_path: Path, max_items: int = None):
+        """
+        Args:
+            data_path: Dakshina dataset directory (or its te/ or lexicons/ subdirectory)
+            max_items: Maximum native words to load (None for all)
+        """
+        super().__init__(data_path)
+        self.max_items = max_items
+        self._domains = get_domain_classifier()
+        self._difficulty = get_difficulty_scorer()
+
+    @property
+    def source_name(self) -> str:
+        return "Dakshina"
+
+    @property
+    def license(self) -> str:
+        return "CC BY-SA 4.0"
+
+    @property
+    def is_partial(self) -> bool:
+        return self.max_items is not None
+
+    def validate_source(self) -> bool:
+        """Check for at least one lexicon file"""
+        return bool(self._lexicon_files())
+
+    def _lexicon_files(self) -> List[Tuple[str, DataFile]]:
+        """(split, file) for each lexicon found"""
+        for directory in [self.data_path / "te" / "lexicons", self.data_path / "lexicons", self.data_path]:
+            files = [
+                (split, data_file)
+                for split in SPLITS
+                if (data_file := find_data_file(directory, f"te.translit.sampled.{split}.tsv"))
+            ]
+            if files:
+                return files
+        return []
+
+    async def load(self) -> AsyncIterator[ProcessedContent]:
+        """Load one item per native Telugu word"""
+        count = 0
+        for split, lexicon_file in self._lexicon_files():
+            # Read in a background thread; batches are scored and tagged together
+            batches = iter_row_batches(lambda: self._read_lexicon(lexicon_file))
+            try:
+                async for batch in batches:
+                    natives = [native for native, _ in batch]
+                    difficulties = self._difficulty.score_batch(natives)
+                    domains = self._domains.classify_batch([("", native) for native in natives])
+
+                    for (native, romanizations), difficulty, item_domains in zip(batch, difficulties, domains):
+                        if self.max_items is not None and count >= self.max_items:
+                            return
+                        romanized, attestations = romanizations[0]
+                        yield ProcessedContent.model_construct(
+                            id=self.content_id(native, romanized),
+                            content_type=ContentType.TRANSLITERATION,
+                            text=f"{native} | {romanized}",
+                            telugu_text=native,
+                            english_text=romanized,
+                            transliteration=romanized,
+                            difficulty=difficulty,
+                            domains=item_domains,
+                            source=self.source_name,
+                            license=self.license,
+                            metadata={
+                                "split": split,
+                                "attestations": attestations,
+                                "romanizations": [
+                                    {"romanized": roman, "attestations": n} for roman, n in romanizations
+                                ],
+                            },
+                        )
+                        count += 1
+            finally:
+                await batches.aclose()
+
+    @staticmethod
+    def _read_lexicon(lexicon_file: DataFile) -> Iterator[LexiconEntry]:
+        """Stream a lexicon, grouping the consecutive lines of each native word"""
+        with lexicon_file.open_text(newline="") as f:
+            rows = (
+                row for row in csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE)
+                if len(row) >= 2 and row[0].strip() and row[1].strip()
+            )
+            for native, group in itertools.groupby(rows, key=lambda row: row[0].strip()):
+                romanizations = [
+                    (row[1].strip().lower(), _attestations(row)) for row in group
+                ]
+                # Most attested first; stable, so file order breaks ties
+                romanizations.sort(key=lambda pair: -pair[1])
+                yield unicodedata.normalize("NFC", native), romanizations
+
+
+def _attestations(row: List[str]) -> int:
+    return int(row[2]) if len(row) >= 3 and row[2].strip().isdigit() else 1
@@ -0,0 +1,270 @@
+"""
+Loader for the AI4Bharat IndicCorp Telugu monolingual corpus.
+
+IndicCorp is tens of gigabytes of Telugu text, one sentence per line. The
+file is processed as independent shards: byte ranges of a plain file,
+which worker processes read themselves, or line-aligned chunks cut from
+a compressed stream (.xz, .gz, ... or te.tar.xz), which are sent to the
+workers. Each shard returns
+
+- sentence candidates: lines of learner-friendly length that are almost
+  entirely Telugu script, de-duplicated within the shard, and
+- token frequency counts: hashes and counts of every Telugu word in the
+  shard, not just the candidates.
+
+Candidates are yielded in file order as monolingual sentences (empty
+english_text, which --quality-filter passes through).
+Token counts are merged as shards finish into `token_counts`, a
+difficulty Lexicon, available once a full pass has completed.
+
+Expected file: te.txt (plain, compressed, or inside te.tar.*)
+
+Download from: https://indicnlp.ai4bharat.org/corpora/
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.data.codepoints import (
+    codepoint_segments,
+    segment_counts,
+    segment_hashes,
+    telugu_letters,
+    telugu_word_spans,
+)
+from app.data.difficulty import Lexicon, LexiconBuilder, get_difficulty_scorer
+from app.data.domains import get_domain_classifier
+from app.data.loaders.base import BaseLoader, estimate_line_count
+from app.data.loaders.chunked import ByteRange, line_ranges, map_ordered, read_line_chunks
+from app.data.loaders.readahead import read_ahead
+from app.data.models import ContentType, DifficultyLevel, ProcessedContent, make_content_id
+from app.data.readers import DataFile, find_data_file
+
+# (id, telugu, difficulty, domains) for a sentence candidate
+CandidateFields = Tuple[str, str, DifficultyLevel, List[str]]
+
+
+@dataclass
+class CandidateRules:
+    """What makes a corpus line a usable learning sentence"""
+    min_chars: int = 10
+    max_chars: int = 200
+    min_telugu_ratio: float = 0.85  # Telugu letters per non-space character
+    max_digits: int = 0
+
+
+@dataclass
+class ShardResult:
+    """Output of parsing one shard"""
+    candidates: List[CandidateFields]
+    token_hashes: np.ndarray  # Unique word hashes in the shard
+    token_counts: np.ndarray  # Occurrences of each
+    lines: int
+
+
+class IndicCorpLoader(BaseLoader):
+    """Sharded loader for IndicCorp Telugu monolingual text"""
+
+    def __init__(
+        self,
+        data_path: Path,
+        max_items: int = None,
+        parse_workers: int = 0,
+        chunk_bytes: int = 16 << 20,
+        rules: Optional[CandidateRules] = None,
+        emit_candidates: bool = True,
+    ):
+        """
+        Args:
+            data_path: Directory with te.txt (or a compressed/archived te.txt)
+            max_items: Maximum sentence candidates to yield (None for all)
+            parse_workers: Processes parsing shards in parallel
+                (0 parses sequentially in a background thread)
+            chunk_bytes: Approximate shard size; bounds memory per worker
+            rules: Sentence candidate filter
+            emit_candidates: False to only count tokens (e.g. for a lexicon)
+        """
+        super().__init__(data_path)
+        self.max_items = max_items
+        self.parse_workers = parse_workers
+        self.chunk_bytes = chunk_bytes
+        self.rules = rules or CandidateRules()
+        self.emit_candidates = emit_candidates
+        self.token_counts: Optional[Lexicon] = None
+        self.lines_read = 0
+
+    @property
+    def source_name(self) -> str:
+        return "AI4Bharat IndicCorp"
+
+    @property
+    def license(self) -> str:
+        return "CC0"
+
+    @property
+    def is_partial(self) -> bool:
+        return self.max_items is not None
+
+    def validate_source(self) -> bool:
+        return self._corpus_file() is not None
+
+    def _corpus_file(self) -> Optional[DataFile]:
+        return find_data_file(self.data_path, "te.txt")
+
+    def estimate_total(self) -> Optional[int]:
+        """Line count of a plain input (an upper bound on candidates), capped by max_items"""
+        corpus_file = self._corpus_file()
+        if corpus_file is None or not corpus_file.is_plain:
+            return self.max_items
+        total = estimate_line_count(corpus_file.path)
+        return min(total, self.max_items) if self.max_items else total
+
+    def _shard_tasks(self, corpus_file: DataFile) -> Tuple[Callable[..., ShardResult], Iterable[tuple]]:
+        """
+        Worker function and its tasks: byte ranges if seekable, else streamed
+        chunks. Both are lazy, so the range scan and decompression happen in
+        whichever thread draws the tasks, not on the event loop.
+        """
+        options = (self.source_name, self.rules, self.emit_candidates)
+        if corpus_file.is_plain:
+            filepath = corpus_file.path
+
+            def ranges():
+                for byte_range in line_ranges(filepath, self.chunk_bytes):
+                    yield (filepath, byte_range, *options)
+
+            return _parse_range, ranges()
+
+        def chunks():
+            with corpus_file.open_binary() as stream:
+                for chunk in read_line_chunks(stream, self.chunk_bytes):
+                    yield (chunk, *options)
+
+        return parse_shard, chunks()
+
+    async def _shard_results(self, parse, tasks) -> AsyncIterator[ShardResult]:
+        if self.parse_workers:
+            results = map_ordered(parse, tasks, self.parse_workers)
+        else:
+            # Read and parse shards in a background thread
+            results = read_ahead(lambda: (parse(*task) for task in tasks), prefetch=2)
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
+
+    async def load(self) -> AsyncIterator[ProcessedContent]:
+        """Yield sentence candidates in file order while tallying token counts"""
+        corpus_file = self._corpus_file()
+        if corpus_file is None:
+            return
+
+        counts = LexiconBuilder()
+        self.token_counts = None
+        self.lines_read = 0
+        yielded = 0
+        results = self._shard_results(*self._shard_tasks(corpus_file))
+        try:
+            async for result in results:
+                counts.add_counts(result.token_hashes, result.token_counts)
+                self.lines_read += result.lines
+                for fields in result.candidates:
+                    if self.max_items is not None and yielded >= self.max_items:
+                        return
+                    yield self._build_content(fields)
+                    yielded += 1
+        finally:
+            await results.aclose()
+        # Only a complete pass gives corpus-wide counts
+        self.token_counts = counts.finish()
+
+    def _build_content(self, fields: CandidateFields) -> ProcessedContent:
+        content_id, telugu, difficulty, domains = fields
+        return ProcessedContent.model_construct(
+            id=content_id,
+            content_type=ContentType.SENTENCE,
+            text=telugu,
+            telugu_text=telugu,
+            english_text="",
+            transliteration=None,
+            difficulty=difficulty,
+            domains=domains,
+            source=self.source_name,
+            license=self.license,
+            metadata={
+                "corpus": "indiccorp",
+                "monolingual": True,
+            },
+        )
+
+
+def _select_candidates(lines: List[str], codepoints, starts, ends, rules: CandidateRules) -> List[str]:
+    """Lines passing the candidate rules, first occurrence only"""
+    lengths = ends - starts
+    space = segment_counts((codepoints == 0x20) | (codepoints == 0x09), starts, ends)
+    telugu = segment_counts(telugu_letters(codepoints), starts, ends)
+    digits = segment_counts(
+        ((codepoints >= 0x30) & (codepoints <= 0x39)) | ((codepoints >= 0x0C66) & (codepoints <= 0x0C6F)),
+        starts,
+        ends,
+    )
+    visible = np.maximum(lengths - space, 1)
+    keep = (
+        (lengths >= rules.min_chars)
+        & (lengths <= rules.max_chars)
+        & (telugu / visible >= rules.min_telugu_ratio)
+        & (digits <= rules.max_digits)
+    )
+    return list(dict.fromkeys(lines[i] for i in np.flatnonzero(keep)))
+
+
+def parse_shard(
+    data: bytes,
+    source: str,
+    rules: CandidateRules,
+    emit_candidates: bool = True,
+) -> ShardResult:
+    """Worker: sentence candidates and token counts for one shard of text"""
+    lines = [line.strip() for line in data.decode("utf-8", errors="replace").split("\n")]
+    lines = [line for line in lines if line]
+    codepoints, starts, ends = codepoint_segments(lines)
+
+    word_starts, word_ends = telugu_word_spans(codepoints, starts)
+    token_hashes, token_counts = np.unique(
+        segment_hashes(codepoints, word_starts, word_ends), return_counts=True
+    )
+
+    candidates: List[CandidateFields] = []
+    if emit_candidates:
+        sentences = _select_candidates(lines, codepoints, starts, ends, rules)
+        difficulties = get_difficulty_scorer().score_batch(sentences)
+        domains = get_domain_classifier().classify_batch([("", sentence) for sentence in sentences])
+        candidates = [
+            (make_content_id(source, sentence, ""), sentence, difficulty, sentence_domains)
+            for sentence, difficulty, sentence_domains in zip(sentences, difficulties, domains)
+        ]
+
+    return ShardResult(
+        candidates=candidates,
+        token_hashes=token_hashes,
+        token_counts=token_counts.astype(np.uint32),
+        lines=len(lines),
+    )
+
+
+def _parse_range(
+    filepath: Path,
+    byte_range: ByteRange,
+    source: str,
+    rules: CandidateRules,
+    emit_candidates: bool,
+) -> ShardResult:
+    """Worker: read one byte range of a plain file and parse it"""
+    start, end = byte_range
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return parse_shard(data, source, rules, emit_candidates)
@@ -0,0 +1,129 @@
+"""
+Background-thread read-ahead for async loaders.
+
+Loaders are async generators, but reading and decompressing files, and
+csv/json parsing, are blocking. Doing them on the event loop stalls
+everything else running in the process (API requests, vector upserts)
+for as long as the disk or the parser takes. read_ahead runs a blocking
+producer in a thread and hands its results to the async side through a
+bounded queue: up to `prefetch` results are read ahead while the loop
+processes earlier ones, and a slow consumer pauses the reader.
+
+Results are yielded in production order. Producers should yield batches
+(a list of rows, or one parsed chunk) rather than single rows, so the
+hand-off costs are spread over many items.
+"""
+import asyncio
+import itertools
+import threading
+from typing import AsyncIterator, Callable, Iterable, Iterator, List, TypeVar
+
+from app.data.loaders.chunked import read_line_chunks
+from app.data.readers import DataFile
+
+T = TypeVar("T")
+
+# Batches (or chunks) read ahead of the consumer
+DEFAULT_PREFETCH = 4
+
+# Rows per batch handed to the event loop
+DEFAULT_BATCH_SIZE = 1024
+
+# Bytes per chunk for chunked parsing
+DEFAULT_CHUNK_BYTES = 1 << 20
+
+_DONE = object()
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Lists of up to size consecutive items"""
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+async def read_ahead(
+    produce: Callable[[], Iterable[T]],
+    prefetch: int = DEFAULT_PREFETCH,
+) -> AsyncIterator[T]:
+    """
+    Iterate produce() in a background thread, yielding its items here.
+
+    produce is called in the thread too, so files it opens are opened,
+    read and closed there. Exceptions raised by the producer are re-raised
+    from this generator; closing this generator early stops the producer
+    after the item it is reading and closes its iterator.
+    """
+    loop = asyncio.get_running_loop()
+    ready: asyncio.Queue = asyncio.Queue()
+    slots = threading.Semaphore(prefetch)
+    stop = threading.Event()
+
+    def post(item, error=None) -> None:
+        try:
+            loop.call_soon_threadsafe(ready.put_nowait, (item, error))
+        except RuntimeError:
+            # Event loop already closed; nobody is listening any more
+            stop.set()
+
+    def run() -> None:
+        try:
+            iterator = iter(produce())
+            try:
+                for item in iterator:
+                    slots.acquire()
+                    if stop.is_set():
+                        break
+                    post(item)
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+        except BaseException as exc:
+            post(_DONE, exc)
+        else:
+            post(_DONE)
+
+    thread = threading.Thread(target=run, name="loader-read-ahead", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = await ready.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            slots.release()
+            yield item
+    finally:
+        stop.set()
+        # Wake the producer if it is waiting for a free slot
+        slots.release()
+
+
+def iter_row_batches(
+    produce_rows: Callable[[], Iterable[T]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> AsyncIterator[List[T]]:
+    """Read rows from a blocking reader in a thread, in batches of batch_size"""
+    return read_ahead(lambda: batched(produce_rows(), batch_size), prefetch)
+
+
+def iter_parsed_chunks(
+    data_file: DataFile,
+    parse_chunk: Callable[[bytes], List[T]],
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> AsyncIterator[List[T]]:
+    """
+    Read a line-oriented file in newline-aligned chunks of about
+    chunk_bytes, and parse each chunk into a list of rows, in a thread.
+    Only for formats where no record spans lines.
+    """
+    def produce() -> Iterator[List[T]]:
+        with data_file.open_binary() as stream:
+            for chunk in read_line_chunks(stream, chunk_bytes):
+                yield parse_chunk(chunk)
+
+    return read_ahead(produce, prefetch)
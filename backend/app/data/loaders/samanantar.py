@@ -8,30 +8,76 @@ License: CC0 (Public Domain)
 Expected file formats:
 - en-te/train.en and en-te/train.te (parallel text files)
 - Or: samanantar_te_en.tsv (TSV with english, telugu columns)
+Any of these may be compressed (.gz, .bz2, .xz, .zst).
 """
-import uuid
+import csv
+import io
+import itertools
 from pathlib import Path
-from typing import AsyncIterator
+from typing import AsyncIterator, Callable, Iterable, Iterator, List, Optional, Tuple
 
-from app.data.loaders.base import BaseLoader
+from app.data.difficulty import get_difficulty_scorer
+from app.data.domains import get_domain_classifier
+from app.data.loaders.base import BaseLoader, estimate_line_count
+from app.data.loaders.chunked import (
+    ByteRange,
+    aligned_line_ranges,
+    line_ranges,
+    map_ordered,
+    read_lines,
+)
+from app.data.loaders.readahead import batched, read_ahead
 from app.data.models import (
     ProcessedContent,
     ContentType,
     DifficultyLevel,
+    make_content_id,
 )
+from app.data.readers import DataFile, find_data_file
+from app.data.sampling import SAMPLING_MODES, sample_content
+
+# (id, english, telugu, difficulty, domains) for a pair that passed filtering
+PairFields = Tuple[str, str, str, DifficultyLevel, List[str]]
+
+_TSV_HEADERS = ["english", "en", "eng"]
+
+# Pairs parsed together when not using worker processes
+_PARSE_BATCH = 1024
 
 
 class SamanantatLoader(BaseLoader):
     """Loader for AI4Bharat Samanantar Telugu-English parallel corpus"""
     
-    def __init__(self, data_path: Path, max_items: int = None):
+    def __init__(
+        self,
+        data_path: Path,
+        max_items: int = None,
+        parse_workers: int = 0,
+        chunk_bytes: int = 4 << 20,
+        sampling: str = "head",
+        seed: int = 0,
+    ):
         """
         Args:
             data_path: Path to samanantar data directory
             max_items: Maximum items to load (None for all)
+            parse_workers: Processes that parse file chunks in parallel
+                (0 parses sequentially in this process)
+            chunk_bytes: Approximate size of each chunk in parallel mode
+            sampling: How max_items are chosen: "head" (first items),
+                "reservoir" (uniform over the whole corpus) or "stratified"
+                (proportional by difficulty and domain). The last two
+                read the whole corpus before yielding anything.
+            seed: Random seed for sampling
         """
+        if sampling not in SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode {sampling!r}")
         super().__init__(data_path)
         self.max_items = max_items
+        self.sampling = sampling
+        self.seed = seed
+        self.parse_workers = parse_workers
+        self.chunk_bytes = chunk_bytes
     
     @property
     def source_name(self) -> str:
@@ -41,121 +87,169 @@ class SamanantatLoader(BaseLoader):
     def license(self) -> str:
         return "CC0"
     
+    @property
+    def is_partial(self) -> bool:
+        return self.max_items is not None
+    
     def validate_source(self) -> bool:
         """Check for Samanantar data files"""
-        # Check for TSV format
-        tsv_file = self.data_path / "samanantar_te_en.tsv"
-        if tsv_file.exists():
-            return True
-        
-        # Check for parallel text files
-        en_file = self.data_path / "train.en"
-        te_file = self.data_path / "train.te"
-        if en_file.exists() and te_file.exists():
-            return True
+        return self._tsv_file() is not None or self._parallel_files() is not None
+    
+    def _tsv_file(self) -> Optional[DataFile]:
+        return find_data_file(self.data_path, "samanantar_te_en.tsv")
+    
+    def _parallel_files(self) -> Optional[Tuple[DataFile, DataFile]]:
+        """train.en/train.te in the data path or its en-te subdirectory"""
+        for directory in [self.data_path, self.data_path / "en-te"]:
+            en_file = find_data_file(directory, "train.en")
+            te_file = find_data_file(directory, "train.te")
+            if en_file and te_file:
+                return en_file, te_file
+        return None
+    
+    def estimate_total(self) -> Optional[int]:
+        """Line count of the input, capped by max_items"""
+        tsv_file = self._tsv_file()
+        parallel_files = self._parallel_files()
+        if tsv_file:
+            input_file = tsv_file
+        elif parallel_files:
+            input_file = parallel_files[0]
+        else:
+            return self.max_items
         
-        # Check in en-te subdirectory
-        en_te_dir = self.data_path / "en-te"
-        if en_te_dir.exists():
-            en_file = en_te_dir / "train.en"
-            te_file = en_te_dir / "train.te"
-            if en_file.exists() and te_file.exists():
-                return True
+        # Compressed inputs can't be sized cheaply
+        if not input_file.is_plain:
+            return self.max_items
+        total = estimate_line_count(input_file.path)
         
-        return False
+        if self.max_items:
+            return min(total, self.max_items)
+        return total
     
     async def load(self) -> AsyncIterator[ProcessedContent]:
-        """Load Telugu-English sentence pairs"""
+        """Load Telugu-English sentence pairs, sampled down to max_items if set"""
+        items = self._load_all()
+        try:
+            if self.max_items is None:
+                async for content in items:
+                    yield content
+                return
+            async for content in sample_content(items, self.max_items, self.sampling, self.seed):
+                yield content
+        finally:
+            await items.aclose()
+    
+    async def _load_all(self) -> AsyncIterator[ProcessedContent]:
+        """Every pair that passes filtering, in file order"""
         # Try TSV format first
-        tsv_file = self.data_path / "samanantar_te_en.tsv"
-        if tsv_file.exists():
+        tsv_file = self._tsv_file()
+        if tsv_file:
             async for content in self._load_tsv(tsv_file):
                 yield content
             return
         
         # Try parallel text files
-        en_file = self.data_path / "train.en"
-        te_file = self.data_path / "train.te"
-        
-        if not en_file.exists():
-            en_te_dir = self.data_path / "en-te"
-            en_file = en_te_dir / "train.en"
-            te_file = en_te_dir / "train.te"
-        
-        if en_file.exists() and te_file.exists():
-            async for content in self._load_parallel_files(en_file, te_file):
+        parallel_files = self._parallel_files()
+        if parallel_files:
+            async for content in self._load_parallel_files(*parallel_files):
                 yield content
     
-    async def _load_tsv(self, filepath: Path) -> AsyncIterator[ProcessedContent]:
+    async def _load_tsv(self, tsv_file: DataFile) -> AsyncIterator[ProcessedContent]:
         """Load from TSV file (english, telugu columns)"""
-        import csv
-        
-        count = 0
-        with open(filepath, "r", encoding="utf-8") as f:
-            reader = csv.reader(f, delimiter="\t")
+        # Byte-range chunking needs seekable, uncompressed files
+        if self.parse_workers and tsv_file.is_plain:
+            filepath = tsv_file.path
             
-            # Skip header if present
-            first_row = next(reader, None)
-            if first_row and first_row[0].lower() not in ["english", "en", "eng"]:
-                # First row is data, process it
-                if len(first_row) >= 2:
-                    content = self._create_content(first_row[0], first_row[1])
-                    if content:
-                        yield content
-                        count += 1
+            def tasks():
+                # Runs in map_ordered's task thread: the range scan reads the whole file
+                ranges = line_ranges(filepath, self.chunk_bytes)
+                for index, byte_range in enumerate(ranges):
+                    yield filepath, byte_range, self.source_name, index == 0
             
-            for row in reader:
-                if self.max_items and count >= self.max_items:
-                    break
+            async for content in self._load_chunks(_parse_tsv_chunk, tasks()):
+                yield content
+            return
+        
+        def read_pairs() -> Iterator[Tuple[str, str]]:
+            with tsv_file.open_text() as f:
+                reader = csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE)
+                
+                # Skip header if present
+                first_row = next(reader, None)
+                rows = reader
+                if first_row and first_row[0].lower() not in _TSV_HEADERS:
+                    # First row is data, process it
+                    rows = itertools.chain([first_row], reader)
                 
-                if len(row) >= 2:
-                    english, telugu = row[0].strip(), row[1].strip()
-                    content = self._create_content(english, telugu)
-                    if content:
-                        yield content
-                        count += 1
+                for row in rows:
+                    if len(row) >= 2:
+                        yield row[0].strip(), row[1].strip()
+        
+        async for content in self._load_pairs(read_pairs):
+            yield content
     
     async def _load_parallel_files(
-        self, en_file: Path, te_file: Path
+        self, en_file: DataFile, te_file: DataFile
     ) -> AsyncIterator[ProcessedContent]:
         """Load from parallel text files (one sentence per line)"""
-        count = 0
-        
-        with open(en_file, "r", encoding="utf-8") as en_f, \
-             open(te_file, "r", encoding="utf-8") as te_f:
+        if self.parse_workers and en_file.is_plain and te_file.is_plain:
+            def tasks():
+                # Runs in map_ordered's task thread: aligning ranges scans both files
+                ranges = aligned_line_ranges(en_file.path, te_file.path, self.chunk_bytes)
+                for en_range, te_range in ranges:
+                    yield en_file.path, en_range, te_file.path, te_range, self.source_name
             
-            for en_line, te_line in zip(en_f, te_f):
-                if self.max_items and count >= self.max_items:
-                    break
-                
-                english = en_line.strip()
-                telugu = te_line.strip()
-                
-                content = self._create_content(english, telugu)
-                if content:
-                    yield content
-                    count += 1
-    
-    def _create_content(self, english: str, telugu: str) -> ProcessedContent | None:
-        """Create ProcessedContent from a sentence pair"""
-        if not english or not telugu:
-            return None
-        
-        # Skip very short or very long sentences
-        if len(telugu) < 5 or len(telugu) > 500:
-            return None
-        if len(english) < 3 or len(english) > 500:
-            return None
+            async for content in self._load_chunks(_parse_parallel_chunk, tasks()):
+                yield content
+            return
         
-        difficulty = self._estimate_difficulty(telugu, english)
-        domains = self._detect_domains(english, telugu)
+        def read_pairs() -> Iterator[Tuple[str, str]]:
+            with en_file.open_text() as en_f, te_file.open_text() as te_f:
+                for en_line, te_line in zip(en_f, te_f):
+                    yield en_line.strip(), te_line.strip()
         
-        return ProcessedContent(
-            id=str(uuid.uuid4()),
+        async for content in self._load_pairs(read_pairs):
+            yield content
+    
+    async def _load_pairs(
+        self, read_pairs: Callable[[], Iterable[Tuple[str, str]]]
+    ) -> AsyncIterator[ProcessedContent]:
+        """
+        Read and parse (english, telugu) pairs in batches in a background
+        thread, so file reads don't block the event loop
+        """
+        source = self.source_name
+        parsed = read_ahead(
+            lambda: (self._parse_pairs(source, batch) for batch in batched(read_pairs(), _PARSE_BATCH))
+        )
+        try:
+            async for chunk in parsed:
+                for fields in chunk:
+                    yield self._build_content(fields)
+        finally:
+            await parsed.aclose()
+    
+    async def _load_chunks(self, parse_chunk, tasks) -> AsyncIterator[ProcessedContent]:
+        """Parse file chunks in a process pool, yielding content in file order"""
+        results = map_ordered(parse_chunk, tasks, self.parse_workers)
+        try:
+            async for chunk in results:
+                for fields in chunk:
+                    yield self._build_content(fields)
+        finally:
+            await results.aclose()
+    
+    def _build_content(self, fields: PairFields) -> ProcessedContent:
+        """Build content from already-validated fields, skipping model validation"""
+        content_id, english, telugu, difficulty, domains = fields
+        return ProcessedContent.model_construct(
+            id=content_id,
             content_type=ContentType.SENTENCE,
             text=f"{telugu} | {english}",
             telugu_text=telugu,
             english_text=english,
+            transliteration=None,
             difficulty=difficulty,
             domains=domains,
             source=self.source_name,
@@ -165,45 +259,59 @@ class SamanantatLoader(BaseLoader):
             },
         )
     
-    def _estimate_difficulty(self, telugu: str, english: str) -> DifficultyLevel:
-        """Estimate difficulty based on sentence complexity"""
-        telugu_words = len(telugu.split())
-        english_words = len(english.split())
-        avg_words = (telugu_words + english_words) / 2
+    @classmethod
+    def _parse_pairs(cls, source: str, pairs: List[Tuple[str, str]]) -> List[PairFields]:
+        """Filter a batch of sentence pairs and derive their fields (also runs in worker processes)"""
+        # Skip empty, very short or very long sentences
+        kept = [
+            (english, telugu)
+            for english, telugu in pairs
+            if 5 <= len(telugu) <= 500 and 3 <= len(english) <= 500
+        ]
+        domains = get_domain_classifier().classify_batch(kept)
+        difficulties = get_difficulty_scorer().score_batch([telugu for _, telugu in kept])
         
-        if avg_words <= 5:
-            return DifficultyLevel.BEGINNER
-        elif avg_words <= 12:
-            return DifficultyLevel.INTERMEDIATE
-        else:
-            return DifficultyLevel.ADVANCED
+        return [
+            (
+                make_content_id(source, telugu, english),
+                english,
+                telugu,
+                difficulty,
+                pair_domains,
+            )
+            for (english, telugu), difficulty, pair_domains in zip(kept, difficulties, domains)
+        ]
+
+
+def _parse_parallel_chunk(
+    en_file: Path,
+    en_range: ByteRange,
+    te_file: Path,
+    te_range: ByteRange,
+    source: str,
+) -> List[PairFields]:
+    """Worker: parse the aligned lines of one chunk of train.en/train.te"""
+    pairs = [
+        (english.strip(), telugu.strip())
+        for english, telugu in zip(read_lines(en_file, en_range), read_lines(te_file, te_range))
+    ]
+    return SamanantatLoader._parse_pairs(source, pairs)
+
+
+def _parse_tsv_chunk(
+    filepath: Path,
+    byte_range: ByteRange,
+    source: str,
+    first_chunk: bool,
+) -> List[PairFields]:
+    """Worker: parse one chunk of the TSV file"""
+    # Unquoted like the sequential reader, so each line is one row in both
+    lines = io.StringIO("\n".join(read_lines(filepath, byte_range)))
+    rows = csv.reader(lines, delimiter="\t", quoting=csv.QUOTE_NONE)
+    if first_chunk:
+        first_row = next(rows, None)
+        if first_row and first_row[0].lower() not in _TSV_HEADERS:
+            rows = [first_row, *rows]
     
-    def _detect_domains(self, english: str, telugu: str) -> list:
-        """Detect content domains from text"""
-        domains = []
-        text_lower = english.lower()
-        
-        # Office/work keywords
-        office_keywords = ["office", "work", "meeting", "project", "manager", "employee", "company", "business"]
-        if any(kw in text_lower for kw in office_keywords):
-            domains.append("office")
-        
-        # Family keywords
-        family_keywords = ["mother", "father", "sister", "brother", "family", "home", "house", "children"]
-        if any(kw in text_lower for kw in family_keywords):
-            domains.append("family")
-        
-        # Travel keywords
-        travel_keywords = ["travel", "train", "bus", "airport", "hotel", "ticket", "station", "journey"]
-        if any(kw in text_lower for kw in travel_keywords):
-            domains.append("travel")
-        
-        # Movies/entertainment
-        movie_keywords = ["movie", "film", "actor", "song", "music", "cinema", "hero"]
-        if any(kw in text_lower for kw in movie_keywords):
-            domains.append("movies")
-        
-        if not domains:
-            domains.append("general")
-        
-        return domains
+    pairs = [(row[0].strip(), row[1].strip()) for row in rows if len(row) >= 2]
+    return SamanantatLoader._parse_pairs(source, pairs)
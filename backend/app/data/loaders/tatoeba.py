@@ -7,20 +7,23 @@ Expected file format (TSV):
 - links.csv: sentence_id, translation_id
 - Or pre-filtered Telugu-English pairs
 
+Files may also be compressed (.gz, .bz2, .xz, .zst) or left inside the
+downloaded archives (sentences.tar.bz2, links.tar.bz2). Files are read
+in a background thread, so loading doesn't block the event loop.
+
 Download from: https://tatoeba.org/en/downloads
 """
+import asyncio
 import csv
-import uuid
 from pathlib import Path
-from typing import AsyncIterator, Dict, List, Optional
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
 
-from app.data.loaders.base import BaseLoader
-from app.data.models import (
-    ProcessedContent,
-    ContentType,
-    DifficultyLevel,
-    SentenceContent,
-)
+from app.data.difficulty import get_difficulty_scorer
+from app.data.domains import get_domain_classifier
+from app.data.loaders.base import BaseLoader, estimate_line_count
+from app.data.loaders.readahead import DEFAULT_BATCH_SIZE, batched, iter_row_batches
+from app.data.models import ProcessedContent, ContentType
+from app.data.readers import DataFile, find_data_file
 
 
 class TatoebaLoader(BaseLoader):
@@ -28,9 +31,8 @@ class TatoebaLoader(BaseLoader):
     
     def __init__(self, data_path: Path):
         super().__init__(data_path)
-        self._telugu_sentences: Dict[str, str] = {}
-        self._english_sentences: Dict[str, str] = {}
-        self._links: List[tuple] = []
+        self._domains = get_domain_classifier()
+        self._difficulty = get_difficulty_scorer()
     
     @property
     def source_name(self) -> str:
@@ -43,107 +45,144 @@ class TatoebaLoader(BaseLoader):
     def validate_source(self) -> bool:
         """Check for required Tatoeba files"""
         # Check for pre-processed pairs file first
-        pairs_file = self.data_path / "telugu_english_pairs.tsv"
-        if pairs_file.exists():
+        if find_data_file(self.data_path, "telugu_english_pairs.tsv"):
             return True
         
         # Check for raw Tatoeba files
-        sentences_file = self.data_path / "sentences.csv"
-        links_file = self.data_path / "links.csv"
-        return sentences_file.exists() and links_file.exists()
+        sentences_file = find_data_file(self.data_path, "sentences.csv")
+        links_file = find_data_file(self.data_path, "links.csv")
+        return sentences_file is not None and links_file is not None
+    
+    def estimate_total(self) -> Optional[int]:
+        """Line count of the pre-processed pairs file, if present"""
+        pairs_file = find_data_file(self.data_path, "telugu_english_pairs.tsv")
+        if pairs_file and pairs_file.is_plain:
+            return estimate_line_count(pairs_file.path)
+        return None
     
     async def load(self) -> AsyncIterator[ProcessedContent]:
         """Load Telugu-English sentence pairs"""
-        pairs_file = self.data_path / "telugu_english_pairs.tsv"
+        pairs_file = find_data_file(self.data_path, "telugu_english_pairs.tsv")
         
-        if pairs_file.exists():
+        if pairs_file:
             async for content in self._load_pairs_file(pairs_file):
                 yield content
         else:
             async for content in self._load_raw_tatoeba():
                 yield content
     
-    async def _load_pairs_file(self, filepath: Path) -> AsyncIterator[ProcessedContent]:
+    async def _load_pairs_file(self, pairs_file: DataFile) -> AsyncIterator[ProcessedContent]:
         """Load from pre-processed pairs file (TSV: telugu, english)"""
-        with open(filepath, "r", encoding="utf-8") as f:
+        batches = iter_row_batches(lambda: self._read_pairs(pairs_file))
+        try:
+            async for batch in batches:
+                difficulties = self._difficulty.score_batch([telugu for telugu, _ in batch])
+                domains = self._domains.classify_batch([(english, telugu) for telugu, english in batch])
+                
+                for (telugu, english), difficulty, pair_domains in zip(batch, difficulties, domains):
+                    yield ProcessedContent(
+                        id=self.content_id(telugu, english),
+                        content_type=ContentType.SENTENCE,
+                        text=f"{telugu} | {english}",
+                        telugu_text=telugu,
+                        english_text=english,
+                        difficulty=difficulty,
+                        domains=pair_domains,
+                        source=self.source_name,
+                        license=self.license,
+                        metadata={
+                            "sentence_type": "example",
+                        },
+                    )
+        finally:
+            await batches.aclose()
+    
+    @staticmethod
+    def _read_pairs(pairs_file: DataFile) -> Iterator[Tuple[str, str]]:
+        """Stream (telugu, english) rows of the pairs file, skipping the header"""
+        with pairs_file.open_text() as f:
             reader = csv.reader(f, delimiter="\t")
             next(reader, None)  # Skip header if present
             
             for row in reader:
                 if len(row) >= 2:
                     telugu, english = row[0].strip(), row[1].strip()
-                    
                     if telugu and english:
-                        content_id = str(uuid.uuid4())
-                        difficulty = self._estimate_difficulty(telugu)
-                        
-                        yield ProcessedContent(
-                            id=content_id,
-                            content_type=ContentType.SENTENCE,
-                            text=f"{telugu} | {english}",
-                            telugu_text=telugu,
-                            english_text=english,
-                            difficulty=difficulty,
-                            source=self.source_name,
-                            license=self.license,
-                            metadata={
-                                "sentence_type": "example",
-                            },
-                        )
+                        yield telugu, english
     
     async def _load_raw_tatoeba(self) -> AsyncIterator[ProcessedContent]:
-        """Load from raw Tatoeba dump files"""
-        # Load sentences
-        sentences_file = self.data_path / "sentences.csv"
-        with open(sentences_file, "r", encoding="utf-8") as f:
-            reader = csv.reader(f, delimiter="\t")
-            for row in reader:
-                if len(row) >= 3:
-                    sent_id, lang, text = row[0], row[1], row[2]
-                    if lang == "tel":
-                        self._telugu_sentences[sent_id] = text
-                    elif lang == "eng":
-                        self._english_sentences[sent_id] = text
+        """
+        Load from raw Tatoeba dump files.
         
-        # Load links
-        links_file = self.data_path / "links.csv"
-        with open(links_file, "r", encoding="utf-8") as f:
-            reader = csv.reader(f, delimiter="\t")
-            for row in reader:
-                if len(row) >= 2:
-                    self._links.append((row[0], row[1]))
+        The dumps hold millions of sentences in hundreds of languages, so
+        only the Telugu side is kept in memory: Telugu sentences first,
+        then the links from them, then just the English sentences those
+        links point to. Each pass runs in a worker thread.
+        """
+        sentences_file = find_data_file(self.data_path, "sentences.csv")
+        links_file = find_data_file(self.data_path, "links.csv")
         
-        # Generate pairs
-        for tel_id, eng_id in self._links:
-            if tel_id in self._telugu_sentences and eng_id in self._english_sentences:
-                telugu = self._telugu_sentences[tel_id]
-                english = self._english_sentences[eng_id]
-                
-                content_id = str(uuid.uuid4())
-                difficulty = self._estimate_difficulty(telugu)
-                
+        telugu_sentences = await asyncio.to_thread(self._read_sentences, sentences_file, "tel")
+        links = await asyncio.to_thread(self._read_links, links_file, telugu_sentences.keys())
+        english_sentences = await asyncio.to_thread(
+            self._read_sentences, sentences_file, "eng", {eng_id for _, eng_id in links}
+        )
+        
+        pairs = (
+            (tel_id, eng_id, telugu_sentences[tel_id], english_sentences[eng_id])
+            for tel_id, eng_id in links
+            if eng_id in english_sentences
+        )
+        for batch in batched(pairs, DEFAULT_BATCH_SIZE):
+            difficulties = self._difficulty.score_batch([telugu for _, _, telugu, _ in batch])
+            domains = self._domains.classify_batch([(english, telugu) for _, _, telugu, english in batch])
+            
+            for (tel_id, eng_id, telugu, english), difficulty, pair_domains in zip(batch, difficulties, domains):
                 yield ProcessedContent(
-                    id=content_id,
+                    id=self.content_id(telugu, english),
                     content_type=ContentType.SENTENCE,
                     text=f"{telugu} | {english}",
                     telugu_text=telugu,
                     english_text=english,
                     difficulty=difficulty,
+                    domains=pair_domains,
                     source=self.source_name,
                     license=self.license,
                     metadata={
-                        "tatoeba_tel_id": tel_id,
-                        "tatoeba_eng_id": eng_id,
+                        "tatoeba_tel_id": str(tel_id),
+                        "tatoeba_eng_id": str(eng_id),
                     },
                 )
     
-    def _estimate_difficulty(self, telugu_text: str) -> DifficultyLevel:
-        """Estimate difficulty based on sentence length and complexity"""
-        word_count = len(telugu_text.split())
-        
-        if word_count <= 4:
-            return DifficultyLevel.BEGINNER
-        elif word_count <= 8:
-            return DifficultyLevel.INTERMEDIATE
-        else:
-            return DifficultyLevel.ADVANCED
+    @staticmethod
+    def _sentence_id(value: str) -> Optional[int]:
+        return int(value) if value.isdigit() else None
+    
+    def _read_links(self, links_file: DataFile, telugu_ids) -> List[Tuple[int, int]]:
+        """(telugu id, translation id) for links from the given Telugu sentences"""
+        links: List[Tuple[int, int]] = []
+        with links_file.open_text(newline="") as f:
+            for row in csv.reader(f, delimiter="\t"):
+                if len(row) >= 2 and row[1].isdigit():
+                    tel_id = self._sentence_id(row[0])
+                    if tel_id in telugu_ids:
+                        links.append((tel_id, int(row[1])))
+        return links
+    
+    def _read_sentences(
+        self,
+        sentences_file: DataFile,
+        lang: str,
+        wanted: Optional[Set[int]] = None,
+    ) -> Dict[int, str]:
+        """Stream a sentences file, keeping one language (and optionally only some ids)"""
+        sentences: Dict[int, str] = {}
+        with sentences_file.open_text(newline="") as f:
+            for row in csv.reader(f, delimiter="\t"):
+                if len(row) < 3 or row[1] != lang:
+                    continue
+                sent_id = self._sentence_id(row[0])
+                if sent_id is None or (wanted is not None and sent_id not in wanted):
+                    continue
+                sentences[sent_id] = row[2]
+        return sentences
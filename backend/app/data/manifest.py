@@ -0,0 +1,148 @@
+"""
+Manifest of data downloads and preprocessing steps.
+
+The download scripts record what they fetched (URL, ETag, size, SHA-256)
+and what each step derived from it (the step's inputs and the hashes of
+its output files) in data/manifest.json. On the next run a step is
+skipped when its inputs are unchanged and its outputs are still on disk
+with the recorded content, so refreshing the data only redoes the parts
+that are actually out of date.
+
+Output files are re-hashed only when their size or modification time no
+longer match the manifest.
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from app.data.downloads import DownloadResult, RemoteInfo, file_sha256
+
+MANIFEST_VERSION = 1
+
+
+class DataManifest:
+    """JSON-file record of downloads and derived artifacts under a data directory"""
+
+    def __init__(self, path: Path, root: Optional[Path] = None):
+        """
+        Args:
+            path: Manifest file
+            root: Directory that output paths are recorded relative to
+                (default: the manifest's directory)
+        """
+        self.path = Path(path)
+        self.root = Path(root) if root else self.path.parent
+        self._state = self._read()
+
+    def _read(self) -> dict:
+        empty = {"version": MANIFEST_VERSION, "downloads": {}, "steps": {}}
+        if not self.path.exists():
+            return empty
+        with open(self.path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        # An unknown layout is treated as no record at all
+        return state if state.get("version") == MANIFEST_VERSION else empty
+
+    def _write(self) -> None:
+        """Write atomically so a crash never leaves a truncated file"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def _relative(self, path: Path) -> str:
+        path = Path(path)
+        try:
+            return str(path.resolve().relative_to(self.root.resolve()))
+        except ValueError:
+            return str(path.resolve())
+
+    def _absolute(self, name: str) -> Path:
+        return self.root / name
+
+    # Downloads
+
+    def download(self, url: str) -> Optional[dict]:
+        """What was recorded for a URL, if anything"""
+        return self._state["downloads"].get(url)
+
+    def remote_unchanged(self, url: str, remote: Optional[RemoteInfo]) -> bool:
+        """
+        Whether the remote file is the one recorded last time, judged by
+        its ETag, or by size and Last-Modified when there is no ETag.
+        """
+        record = self.download(url)
+        if not record or remote is None:
+            return False
+        if remote.etag and record.get("etag"):
+            return remote.etag == record["etag"]
+        if remote.size is None or remote.last_modified is None:
+            return False
+        return remote.size == record.get("size") and remote.last_modified == record.get("last_modified")
+
+    def download_hashes(self, urls: Iterable[str]) -> Optional[Dict[str, str]]:
+        """SHA-256 recorded for each URL, or None if any is missing"""
+        hashes = {}
+        for url in urls:
+            record = self.download(url)
+            if not record:
+                return None
+            hashes[url] = record["sha256"]
+        return hashes
+
+    def record_download(self, result: DownloadResult) -> None:
+        self._state["downloads"][result.url] = {
+            "etag": result.etag,
+            "last_modified": result.last_modified,
+            "size": result.size,
+            "sha256": result.sha256,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        self._write()
+
+    # Derived steps
+
+    def is_current(self, step: str, inputs: dict) -> bool:
+        """Whether a step ran with these inputs and its outputs are intact"""
+        record = self._state["steps"].get(step)
+        if not record or record["inputs"] != inputs:
+            return False
+
+        changed = False
+        for name, fingerprint in record["outputs"].items():
+            path = self._absolute(name)
+            if not path.is_file():
+                return False
+            stat = path.stat()
+            if stat.st_size != fingerprint["size"]:
+                return False
+            if stat.st_mtime_ns == fingerprint["mtime_ns"]:
+                continue
+            # Touched since it was recorded; only the content matters
+            if file_sha256(path) != fingerprint["sha256"]:
+                return False
+            fingerprint["mtime_ns"] = stat.st_mtime_ns
+            changed = True
+        if changed:
+            self._write()
+        return True
+
+    def record_step(self, step: str, inputs: dict, outputs: List[Path]) -> None:
+        """Record a finished step: its inputs and the content of its outputs"""
+        fingerprints = {}
+        for path in outputs:
+            stat = Path(path).stat()
+            fingerprints[self._relative(path)] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": file_sha256(path),
+            }
+        self._state["steps"][step] = {
+            "inputs": inputs,
+            "outputs": fingerprints,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        self._write()
@@ -0,0 +1,170 @@
+"""
+Throughput instrumentation for content ingestion.
+Tracks time spent per pipeline stage, items and bytes per second, queue
+depths and a per-source ETA, readable as a progress line or as JSON.
+"""
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 1) if value is not None else None
+
+
+@dataclass
+class StageMetrics:
+    """Accumulated work done by one pipeline stage"""
+    calls: int = 0
+    items: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self, elapsed: float) -> dict:
+        return {
+            "calls": self.calls,
+            "items": self.items,
+            "bytes": self.bytes,
+            "busy_seconds": round(self.seconds, 3),
+            # Throughput while the stage is actually working, and overall
+            "items_per_busy_sec": round(self.items / self.seconds, 1) if self.seconds else 0.0,
+            "items_per_sec": round(self.items / elapsed, 1) if elapsed else 0.0,
+            "bytes_per_sec": round(self.bytes / elapsed, 1) if elapsed else 0.0,
+        }
+
+
+@dataclass
+class SourceProgress:
+    """Progress of one source"""
+    name: str = ""  # Display name; sources are keyed by checkpoint key
+    started: float = field(default_factory=time.monotonic)
+    processed: int = 0
+    bytes: int = 0
+    estimated_total: Optional[int] = None
+    finished: bool = False
+
+    def eta_seconds(self) -> Optional[float]:
+        if self.finished:
+            return 0.0
+        if not self.estimated_total or not self.processed:
+            return None
+        rate = self.processed / max(time.monotonic() - self.started, 1e-9)
+        remaining = max(self.estimated_total - self.processed, 0)
+        return remaining / rate
+
+
+class IngestionMetrics:
+    """Collects stage timers, counters and gauges for one ingestion run"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.stages: Dict[str, StageMetrics] = {}
+        self.sources: Dict[str, SourceProgress] = {}
+        self._queue_probes: Dict[str, Callable[[], dict]] = {}
+
+    def add_stage_time(self, stage: str, seconds: float, items: int = 0, nbytes: int = 0) -> None:
+        """Record work done by a stage"""
+        metrics = self.stages.setdefault(stage, StageMetrics())
+        metrics.seconds += seconds
+        metrics.calls += 1
+        metrics.items += items
+        metrics.bytes += nbytes
+
+    @contextmanager
+    def time_stage(self, stage: str, items: int = 0, nbytes: int = 0):
+        """Time a block of work done by a stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage_time(stage, time.perf_counter() - start, items, nbytes)
+
+    def start_source(self, source: str, name: str, estimated_total: Optional[int] = None) -> None:
+        """Start tracking a source under its unique key (loader checkpoint key)"""
+        self.sources[source] = SourceProgress(name=name, estimated_total=estimated_total)
+
+    def record_loaded(self, source: str, items: int, nbytes: int) -> None:
+        progress = self.sources.setdefault(source, SourceProgress())
+        progress.processed += items
+        progress.bytes += nbytes
+
+    def finish_source(self, source: str) -> None:
+        if source in self.sources:
+            self.sources[source].finished = True
+        self._queue_probes.pop(source, None)
+
+    def watch_queues(self, source: str, probe: Callable[[], dict]) -> None:
+        """Register a callable returning current queue depths for a source"""
+        self._queue_probes[source] = probe
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Items waiting in front of each stage, summed over running sources"""
+        depths: Dict[str, int] = {}
+        for probe in list(self._queue_probes.values()):
+            for stage, depth in probe().items():
+                depths[stage] = depths.get(stage, 0) + depth
+        return depths
+
+    def eta_seconds(self) -> Optional[float]:
+        """Time until the slowest source with a size estimate finishes"""
+        etas = [progress.eta_seconds() for progress in self.sources.values()]
+        known = [eta for eta in etas if eta is not None]
+        return max(known) if known else None
+
+    def snapshot(self) -> dict:
+        """Machine-readable view of the current metrics"""
+        elapsed = time.monotonic() - self.started
+        processed = sum(p.processed for p in self.sources.values())
+        nbytes = sum(p.bytes for p in self.sources.values())
+        return {
+            "elapsed_seconds": round(elapsed, 2),
+            "items": processed,
+            "items_per_sec": round(processed / elapsed, 1) if elapsed else 0.0,
+            "bytes_per_sec": round(nbytes / elapsed, 1) if elapsed else 0.0,
+            "eta_seconds": _round(self.eta_seconds()),
+            "queue_depths": self.queue_depths(),
+            "stages": {
+                name: stage.to_dict(elapsed) for name, stage in self.stages.items()
+            },
+            "sources": {
+                key: {
+                    "source": progress.name,
+                    "processed": progress.processed,
+                    "estimated_total": progress.estimated_total,
+                    "finished": progress.finished,
+                    "eta_seconds": _round(progress.eta_seconds()),
+                }
+                for key, progress in self.sources.items()
+            },
+        }
+
+    def progress_line(self) -> str:
+        """One-line human-readable summary"""
+        snap = self.snapshot()
+        busy = ", ".join(
+            f"{name} {stage['busy_seconds']:.0f}s" for name, stage in snap["stages"].items()
+        )
+        queues = " ".join(f"{name}:{depth}" for name, depth in snap["queue_depths"].items())
+        eta = snap["eta_seconds"]
+        eta_text = f"{eta / 60:.1f}m" if eta is not None else "?"
+        return (
+            f"{snap['items']} items | {snap['items_per_sec']:.0f}/s | "
+            f"{snap['bytes_per_sec'] / 1024:.0f} KiB/s | busy: {busy or '-'} | "
+            f"queues: {queues or '-'} | ETA {eta_text}"
+        )
+
+    def write_json(self, path: Path, extra: Optional[dict] = None) -> None:
+        """Write the snapshot (plus optional final stats) atomically"""
+        data = self.snapshot()
+        if extra:
+            data.update(extra)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
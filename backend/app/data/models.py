@@ -1,11 +1,36 @@
 """
 Data models for ingested content.
 """
+import re
+import unicodedata
+import uuid
 from pydantic import BaseModel
 from typing import Optional, List
 from enum import Enum
 
 
+# Namespace for deterministic content IDs (uuid5)
+CONTENT_ID_NAMESPACE = uuid.UUID("6f1c4a52-3b8e-5d0a-9c7e-2a4b8d1e0f35")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for identity comparisons (NFC, casefold, single spaces)"""
+    text = unicodedata.normalize("NFC", text)
+    return _WHITESPACE.sub(" ", text).strip().casefold()
+
+
+def make_content_id(source: str, telugu: str, english: str) -> str:
+    """
+    Deterministic point ID for a piece of content.
+    The same source and normalized text always map to the same ID, so
+    re-running ingestion overwrites points instead of duplicating them.
+    """
+    key = "\x1f".join([source, normalize_text(telugu), normalize_text(english)])
+    return str(uuid.uuid5(CONTENT_ID_NAMESPACE, key))
+
+
 class ContentType(str, Enum):
     """Types of learning content"""
     SENTENCE = "sentence"           # Example sentence
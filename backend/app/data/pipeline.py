@@ -0,0 +1,177 @@
+"""
+Staged asyncio pipeline used by content ingestion.
+Stages are connected by bounded queues, so a slow stage applies
+backpressure upstream instead of letting batches pile up in memory.
+"""
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Hashable, List, Optional
+
+# Sentinel telling a worker that its input queue is drained
+_DONE = object()
+
+
+@dataclass
+class PipelineStage:
+    """
+    A single pipeline step.
+
+    The handler receives one item from the upstream queue and returns the
+    item to pass downstream, or None to drop it.
+    """
+    name: str
+    handler: Callable[[Any], Awaitable[Optional[Any]]]
+    concurrency: int = 1
+
+
+class Pipeline:
+    """Runs a source iterator through a chain of concurrent stages"""
+
+    def __init__(self, stages: List[PipelineStage], queue_size: int = 4):
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        for stage in stages:
+            if stage.concurrency < 1:
+                raise ValueError(f"Stage '{stage.name}' needs concurrency >= 1")
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self._queues: List[asyncio.Queue] = []
+
+    def queue_depths(self) -> dict:
+        """Current number of items waiting in front of each stage"""
+        return {
+            stage.name: queue.qsize()
+            for stage, queue in zip(self.stages, self._queues)
+        }
+
+    async def run(self, source: AsyncIterator[Any]) -> None:
+        """
+        Drive every item from source through all stages.
+        Returns once the last stage has drained; the first exception raised
+        by the source or a handler cancels the pipeline and is re-raised.
+        """
+        self._queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+
+        tasks = [asyncio.create_task(self._feed(source))]
+        for index in range(len(self.stages)):
+            tasks.append(asyncio.create_task(self._run_stage(index)))
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _feed(self, source: AsyncIterator[Any]) -> None:
+        """Push source items into the first stage"""
+        queue = self._queues[0]
+        async for item in source:
+            await queue.put(item)
+        for _ in range(self.stages[0].concurrency):
+            await queue.put(_DONE)
+
+    async def _run_stage(self, index: int) -> None:
+        """Run all workers of one stage, then signal the next stage"""
+        stage = self.stages[index]
+        inbox = self._queues[index]
+        outbox = self._queues[index + 1] if index + 1 < len(self.stages) else None
+
+        await asyncio.gather(*[
+            self._work(stage, inbox, outbox)
+            for _ in range(stage.concurrency)
+        ])
+
+        if outbox is not None:
+            for _ in range(self.stages[index + 1].concurrency):
+                await outbox.put(_DONE)
+
+    async def _work(
+        self,
+        stage: PipelineStage,
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+    ) -> None:
+        """Process items until the stage's sentinel arrives"""
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+            result = await stage.handler(item)
+            if result is not None and outbox is not None:
+                await outbox.put(result)
+
+
+class FairLimiter:
+    """
+    Concurrency limit shared by several clients.
+    
+    When the limit is reached, freed slots are handed to waiting clients
+    in round-robin order, so one busy client can't starve the others.
+    """
+
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError("FairLimiter needs limit >= 1")
+        self.limit = limit
+        self._active = 0
+        self._waiters: "OrderedDict[Hashable, Deque[asyncio.Future]]" = OrderedDict()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._waiters.values())
+
+    async def acquire(self, client: Hashable) -> None:
+        """Wait for a slot on behalf of a client"""
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(client, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as we were cancelled
+                self.release()
+            else:
+                self._discard(client, future)
+            raise
+
+    def release(self) -> None:
+        """Free a slot, handing it to the next client in rotation"""
+        while self._waiters:
+            client, queue = next(iter(self._waiters.items()))
+            future = queue.popleft()
+            if queue:
+                self._waiters.move_to_end(client)
+            else:
+                del self._waiters[client]
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    def _discard(self, client: Hashable, future: asyncio.Future) -> None:
+        queue = self._waiters.get(client)
+        if queue and future in queue:
+            queue.remove(future)
+            if not queue:
+                del self._waiters[client]
+
+    @asynccontextmanager
+    async def slot(self, client: Hashable):
+        """Hold a slot for the duration of the block"""
+        await self.acquire(client)
+        try:
+            yield
+        finally:
+            self.release()
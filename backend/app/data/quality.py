@@ -0,0 +1,147 @@
+"""
+Batch quality filter for parallel sentence pairs.
+
+Rejects mixed-script noise, mostly-Latin "Telugu" lines, misaligned
+pairs and number/punctuation soup before they reach the embedding model.
+Only sentence and vocabulary pairs are checked; monolingual text (no
+english_text) and other content types, such as transliteration pairs,
+pass through unchanged. Character statistics for a whole batch are computed at once over a
+single code point array.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.data.codepoints import codepoint_segments, segment_counts
+from app.data.models import ContentType, ProcessedContent
+
+# Telugu Unicode block and its digits
+_TELUGU_START, _TELUGU_END = 0x0C00, 0x0C7F
+_TELUGU_DIGIT_START, _TELUGU_DIGIT_END = 0x0C66, 0x0C6F
+
+# Reason codes, in the order checks are applied
+ACCEPTED = 0
+REJECT_REASONS = ["telugu_ratio", "length_ratio", "digit_density", "punct_density"]
+
+# Content types the checks are meant for: Telugu text with its translation
+CHECKED_TYPES = {ContentType.SENTENCE, ContentType.VOCABULARY}
+
+
+@dataclass
+class QualityThresholds:
+    """Limits a sentence pair must meet to be kept"""
+    min_telugu_ratio: float = 0.7   # Telugu-script share of letters on the Telugu side
+    min_length_ratio: float = 0.25  # Telugu length / English length
+    max_length_ratio: float = 4.0
+    max_digit_density: float = 0.25  # Digits per non-space character, both sides
+    max_punct_density: float = 0.25  # Punctuation per non-space character, both sides
+
+
+def _char_classes(codepoints: np.ndarray) -> Dict[str, np.ndarray]:
+    """Boolean masks classifying every code point"""
+    ascii_digit = (codepoints >= 0x30) & (codepoints <= 0x39)
+    telugu_digit = (codepoints >= _TELUGU_DIGIT_START) & (codepoints <= _TELUGU_DIGIT_END)
+    digit = ascii_digit | telugu_digit
+
+    space = (codepoints == 0x20) | ((codepoints >= 0x09) & (codepoints <= 0x0D)) | (codepoints == 0xA0)
+
+    punct = (
+        ((codepoints >= 0x21) & (codepoints <= 0x2F))
+        | ((codepoints >= 0x3A) & (codepoints <= 0x40))
+        | ((codepoints >= 0x5B) & (codepoints <= 0x60))
+        | ((codepoints >= 0x7B) & (codepoints <= 0x7E))
+        | ((codepoints >= 0x2000) & (codepoints <= 0x206F))  # General punctuation
+        | (codepoints == 0x0964) | (codepoints == 0x0965)  # Danda, double danda
+    )
+
+    telugu = (codepoints >= _TELUGU_START) & (codepoints <= _TELUGU_END) & ~telugu_digit
+    return {"digit": digit, "space": space, "punct": punct, "telugu": telugu}
+
+
+def _text_stats(texts: List[str]) -> Dict[str, np.ndarray]:
+    """Per-text character class counts for a batch"""
+    codepoints, starts, ends = codepoint_segments(texts)
+
+    classes = _char_classes(codepoints)
+    counts = {name: segment_counts(mask, starts, ends) for name, mask in classes.items()}
+    counts["chars"] = (ends - starts) - counts["space"]
+    counts["letters"] = counts["chars"] - counts["digit"] - counts["punct"]
+    return counts
+
+
+class QualityFilter:
+    """Vectorized quality checks over batches of sentence pairs"""
+
+    def __init__(self, thresholds: QualityThresholds = None):
+        self.thresholds = thresholds or QualityThresholds()
+        self.rejections: Dict[str, int] = {reason: 0 for reason in REJECT_REASONS}
+        self.accepted = 0
+
+    def evaluate(self, telugu: List[str], english: List[str]) -> np.ndarray:
+        """
+        Classify a batch of pairs.
+
+        Returns:
+            Array of reason codes: ACCEPTED (0), or 1 + index into
+            REJECT_REASONS for the first check the pair failed
+        """
+        t = self.thresholds
+        te = _text_stats(telugu)
+        en = _text_stats(english)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            telugu_ratio = np.where(te["letters"] > 0, te["telugu"] / te["letters"], 0.0)
+            length_ratio = np.where(en["chars"] > 0, te["chars"] / en["chars"], np.inf)
+            total_chars = np.maximum(te["chars"] + en["chars"], 1)
+            digit_density = (te["digit"] + en["digit"]) / total_chars
+            punct_density = (te["punct"] + en["punct"]) / total_chars
+
+        failures = [
+            telugu_ratio < t.min_telugu_ratio,
+            (length_ratio < t.min_length_ratio) | (length_ratio > t.max_length_ratio),
+            digit_density > t.max_digit_density,
+            punct_density > t.max_punct_density,
+        ]
+
+        # Report the first failed check for each pair
+        codes = np.zeros(len(telugu), dtype=np.int8)
+        for code, failed in reversed(list(enumerate(failures, start=1))):
+            codes[failed] = code
+        return codes
+
+    @staticmethod
+    def is_checked(item: ProcessedContent) -> bool:
+        """Whether the item is a translation pair the checks apply to"""
+        return item.content_type in CHECKED_TYPES and bool(item.english_text)
+
+    def filter(self, items: List[ProcessedContent]) -> Tuple[List[ProcessedContent], Dict[str, int]]:
+        """
+        Keep items that pass every check. Items that aren't translation
+        pairs (see `is_checked`) are kept without being judged.
+
+        Returns:
+            (kept items, rejection counts by reason for this batch)
+        """
+        batch_rejections = {reason: 0 for reason in REJECT_REASONS}
+        checked = [item for item in items if self.is_checked(item)]
+        if not checked:
+            return items, batch_rejections
+
+        checked_codes = self.evaluate(
+            [item.telugu_text for item in checked],
+            [item.english_text for item in checked],
+        )
+        counts = np.bincount(checked_codes, minlength=len(REJECT_REASONS) + 1)
+        for index, reason in enumerate(REJECT_REASONS, start=1):
+            batch_rejections[reason] = int(counts[index])
+            self.rejections[reason] += int(counts[index])
+        self.accepted += int(counts[ACCEPTED])
+
+        # Unchecked items keep their place in the batch
+        codes = iter(checked_codes.tolist())
+        kept = [
+            item for item in items
+            if not self.is_checked(item) or next(codes) == ACCEPTED
+        ]
+        return kept, batch_rejections
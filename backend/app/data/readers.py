@@ -0,0 +1,321 @@
+"""
+Streaming readers for corpus files that may be compressed or archived.
+
+Inputs are picked by file suffix: plain files, .gz, .bz2, .xz and .zst
+(needs the optional `zstandard` package), members of tar archives in
+any of those compressions, and members of zip archives. Everything is decompressed on the fly with
+large buffered reads, so downloads never have to be extracted to disk.
+JSON documents can be streamed item by item with iter_json_items, and
+JSON Lines chunks parsed with parse_json_lines, which skips bad lines.
+"""
+import bz2
+import gzip
+import io
+import json
+import logging
+import lzma
+import tarfile
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, TextIO
+
+READ_BUFFER = 1 << 20
+
+# Largest single JSON value (in characters) the streaming decoder will buffer
+MAX_JSON_VALUE = 64 << 20
+
+COMPRESSION_SUFFIXES = [".gz", ".bz2", ".xz", ".zst"]
+TAR_SUFFIXES = [".tar", ".tgz", ".tbz2", ".txz"] + [f".tar{s}" for s in COMPRESSION_SUFFIXES]
+
+_SHORT_TAR_SUFFIXES = {".tgz": ".gz", ".tbz2": ".bz2", ".txz": ".xz"}
+
+logger = logging.getLogger(__name__)
+
+
+def _compression(name: str) -> Optional[str]:
+    """Compression suffix of a file name, if any"""
+    name = name.lower()
+    for short, suffix in _SHORT_TAR_SUFFIXES.items():
+        if name.endswith(short):
+            return suffix
+    for suffix in COMPRESSION_SUFFIXES:
+        if name.endswith(suffix):
+            return suffix
+    return None
+
+
+def _decompress(raw: BinaryIO, compression: Optional[str]) -> BinaryIO:
+    """Wrap a raw byte stream in a decompressing reader"""
+    if compression is None:
+        return raw
+    if compression == ".gz":
+        stream = gzip.GzipFile(fileobj=raw, mode="rb")
+    elif compression == ".bz2":
+        stream = bz2.BZ2File(raw, mode="rb")
+    elif compression == ".xz":
+        stream = lzma.LZMAFile(raw, mode="rb")
+    else:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("Reading .zst files requires the 'zstandard' package")
+        stream = zstandard.ZstdDecompressor().stream_reader(raw, read_size=READ_BUFFER)
+    return io.BufferedReader(stream, buffer_size=READ_BUFFER)
+
+
+class _MemberReader(io.RawIOBase):
+    """
+    Non-seekable raw stream over an archive member (tar members are read
+    in streaming mode).
+    Closing it also closes the archive and the streams underneath.
+    """
+
+    def __init__(self, member: BinaryIO, resources: list):
+        self._member = member
+        self._resources = resources
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._member.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            for resource in reversed(self._resources):
+                resource.close()
+        super().close()
+
+
+@dataclass(frozen=True)
+class DataFile:
+    """A corpus input: a possibly compressed file, or a member of a tar archive"""
+    path: Path
+    member: Optional[str] = None  # File name of the member inside a tar or zip archive
+
+    @property
+    def name(self) -> str:
+        return self.member or self.path.name
+
+    @property
+    def is_plain(self) -> bool:
+        """True for an uncompressed regular file, which supports seeking and mmap"""
+        return self.member is None and _compression(self.path.name) is None
+
+    def open_binary(self) -> BinaryIO:
+        """Open a decompressed byte stream"""
+        raw = open(self.path, "rb", buffering=READ_BUFFER)
+        try:
+            if self.path.suffix.lower() == ".zip":
+                return self._open_zip_member(raw)
+            stream = _decompress(raw, _compression(self.path.name))
+            if self.member is None:
+                return stream
+
+            tar = tarfile.open(fileobj=stream, mode="r|")
+            for info in tar:
+                if info.isfile() and Path(info.name).name == self.member:
+                    reader = _MemberReader(tar.extractfile(info), [stream, tar])
+                    return io.BufferedReader(reader, buffer_size=READ_BUFFER)
+            tar.close()
+            raise FileNotFoundError(f"{self.member} not found in {self.path}")
+        except BaseException:
+            raw.close()
+            raise
+
+    def _open_zip_member(self, raw: BinaryIO) -> BinaryIO:
+        archive = zipfile.ZipFile(raw)
+        for info in archive.infolist():
+            if not info.is_dir() and Path(info.filename).name == self.member:
+                reader = _MemberReader(archive.open(info), [raw, archive])
+                return io.BufferedReader(reader, buffer_size=READ_BUFFER)
+        archive.close()
+        raise FileNotFoundError(f"{self.member} not found in {self.path}")
+    
+    def open_text(self, newline: Optional[str] = None) -> TextIO:
+        """Open a decompressed UTF-8 text stream"""
+        return io.TextIOWrapper(self.open_binary(), encoding="utf-8", newline=newline)
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.member}" if self.member else str(self.path)
+
+
+def find_data_file(directory: Path, name: str) -> Optional[DataFile]:
+    """
+    Locate an input by its plain name in a directory.
+
+    Tries `name` itself, then `name` with a compression suffix, then a tar
+    archive named after it (e.g. links.tar.bz2 holding links.csv).
+    """
+    for suffix in [""] + COMPRESSION_SUFFIXES:
+        candidate = directory / f"{name}{suffix}"
+        if candidate.is_file():
+            return DataFile(candidate)
+
+    stem = Path(name).stem
+    for base in dict.fromkeys([name, stem]):
+        for suffix in TAR_SUFFIXES:
+            candidate = directory / f"{base}{suffix}"
+            if candidate.is_file():
+                return DataFile(candidate, member=name)
+    return None
+
+
+def find_zip_member(archive: Path, name: str) -> Optional[DataFile]:
+    """A file inside a zip archive, matched by file name in any folder"""
+    if not archive.is_file():
+        return None
+    with zipfile.ZipFile(archive) as zf:
+        for info in zf.infolist():
+            if not info.is_dir() and Path(info.filename).name == name:
+                return DataFile(archive, member=name)
+    return None
+
+
+def find_data_files(directory: Path, extension: str) -> List[DataFile]:
+    """All files in a directory with an extension, plain or compressed (e.g. *.json, *.json.gz)"""
+    files = []
+    for suffix in [""] + COMPRESSION_SUFFIXES:
+        files.extend(DataFile(path) for path in sorted(directory.glob(f"*{extension}{suffix}")))
+    return files
+
+
+class _JsonScanner:
+    """Incremental JSON tokenizer over a text stream, decoding one value at a time"""
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, f: TextIO, chunk_size: int = READ_BUFFER, max_value: int = MAX_JSON_VALUE):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._max_value = max_value
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int = None) -> bool:
+        """Read another chunk (of `size` characters if given); False at end of file"""
+        if self._eof:
+            return False
+        chunk = self._file.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop consumed text so the buffer stays about one chunk long
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at end of file"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in self._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos} of JSON stream")
+        self._pos += 1
+
+    def _fill_value(self) -> bool:
+        """
+        Read more of a value that is incomplete in the buffer, doubling what
+        is buffered so re-decoding stays linear. False at end of file; a
+        value longer than max_value is an error, so malformed input can't
+        pull the rest of the file into memory.
+        """
+        pending = len(self._buffer) - self._pos
+        if pending >= self._max_value:
+            raise ValueError(
+                f"JSON value at offset {self._pos} of the buffer is longer than "
+                f"{self._max_value} characters, or malformed"
+            )
+        return self._fill(min(max(pending, self._chunk_size), self._max_value - pending))
+
+    def value(self):
+        """Decode the next complete value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill_value():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill_value():
+                continue
+            self._pos = end
+            return value
+
+    def array_items(self) -> Iterator:
+        """Decode the elements of the array starting at the cursor, one by one"""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+def iter_json_items(f: TextIO, key: str = "content") -> Iterator:
+    """
+    Stream the items of a JSON document without loading it whole.
+
+    Handles a top-level array, or an object whose `key` member is an array
+    (other members are decoded and skipped). Anything else has no items.
+    """
+    scanner = _JsonScanner(f)
+    first = scanner.peek()
+    if first == "[":
+        yield from scanner.array_items()
+    elif first == "{":
+        scanner.expect("{")
+        while scanner.peek() not in ("}", ""):
+            name = scanner.value()
+            scanner.expect(":")
+            if name == key and scanner.peek() == "[":
+                yield from scanner.array_items()
+            else:
+                scanner.value()
+            if scanner.peek() == ",":
+                scanner.expect(",")
+
+
+def parse_json_lines(chunk: bytes, name: str = "JSON Lines input") -> List[dict]:
+    """
+    The JSON objects on the lines of a JSON Lines chunk. Lines that aren't
+    a valid object are skipped with a warning instead of failing the load.
+    """
+    objects = []
+    skipped = 0
+    # Not splitlines(): U+2028 and friends may appear inside JSON strings
+    for line in chunk.decode("utf-8", errors="replace").split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError:
+            skipped += 1
+            continue
+        if isinstance(value, dict):
+            objects.append(value)
+        else:
+            skipped += 1
+    if skipped:
+        logger.warning(f"Skipped {skipped} malformed line(s) in {name}")
+    return objects
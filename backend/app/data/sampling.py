@@ -0,0 +1,174 @@
+"""
+Single-pass sampling of loader output.
+
+Taking the first N items of a corpus gives a subset biased to the head of
+the file. These samplers see every item once and keep only a bounded
+reservoir, so a representative subset of a huge corpus can be drawn in
+one streaming pass. The same seed always gives the same sample, and the
+sample is returned in corpus order, so resumed runs line up with their
+checkpoints.
+"""
+import math
+import random
+from typing import AsyncIterator, Callable, Dict, Generic, Hashable, List, Tuple, TypeVar
+
+from app.data.models import ProcessedContent
+
+T = TypeVar("T")
+
+# "head" keeps the first N items, like a plain limit
+SAMPLING_MODES = ["head", "reservoir", "stratified"]
+
+
+def _open_unit(rng: random.Random) -> float:
+    """Uniform value in the open interval (0, 1)"""
+    while True:
+        value = rng.random()
+        if value:
+            return value
+
+
+class Reservoir(Generic[T]):
+    """
+    Uniform sample of fixed size from a stream of unknown length.
+
+    Uses Algorithm L (Li, 1994): instead of drawing a random number for
+    every item, it draws how many items to skip before the next
+    replacement, so most items cost only a comparison.
+    """
+
+    def __init__(self, size: int, rng: random.Random):
+        self.size = size
+        self.seen = 0
+        self._rng = rng
+        self._items: List[Tuple[int, T]] = []
+        self._weight = 1.0
+        self._next = 0
+
+    def add(self, index: int, item: T) -> None:
+        """Offer the item at stream position `index`"""
+        position = self.seen
+        self.seen += 1
+        if not self.size:
+            return
+        if position < self.size:
+            self._items.append((index, item))
+            if self.seen == self.size:
+                self._weight = math.exp(math.log(_open_unit(self._rng)) / self.size)
+                self._skip(position)
+            return
+        if position == self._next:
+            self._items[self._rng.randrange(self.size)] = (index, item)
+            self._weight *= math.exp(math.log(_open_unit(self._rng)) / self.size)
+            self._skip(position)
+
+    def _skip(self, position: int) -> None:
+        gap = math.floor(math.log(_open_unit(self._rng)) / math.log(1.0 - self._weight))
+        self._next = position + gap + 1
+
+    def items(self) -> List[Tuple[int, T]]:
+        """(stream position, item) pairs currently held"""
+        return list(self._items)
+
+
+async def reservoir_sample(
+    items: AsyncIterator[T],
+    size: int,
+    seed: int = 0,
+) -> List[T]:
+    """Uniform sample of `size` items, in stream order"""
+    reservoir: Reservoir[T] = Reservoir(size, random.Random(seed))
+    index = 0
+    async for item in items:
+        reservoir.add(index, item)
+        index += 1
+    return [item for _, item in sorted(reservoir.items(), key=lambda entry: entry[0])]
+
+
+def _allocate(counts: Dict[Hashable, int], size: int) -> Dict[Hashable, int]:
+    """Split `size` across strata in proportion to their counts (largest remainder)"""
+    total = sum(counts.values())
+    if total <= size:
+        return dict(counts)
+    shares = {key: size * count / total for key, count in counts.items()}
+    quotas = {key: math.floor(share) for key, share in shares.items()}
+    # Sorting by key as well keeps ties deterministic
+    by_remainder = sorted(shares, key=lambda key: (quotas[key] - shares[key], str(key)))
+    for key in by_remainder[:size - sum(quotas.values())]:
+        quotas[key] += 1
+    return quotas
+
+
+async def stratified_sample(
+    items: AsyncIterator[T],
+    size: int,
+    key: Callable[[T], Hashable],
+    seed: int = 0,
+) -> List[T]:
+    """
+    Sample of `size` items with each stratum represented in proportion to
+    its share of the stream, in stream order.
+
+    Every stratum keeps its own reservoir of up to `size` items, since its
+    final quota is only known once the stream ends; memory is bounded by
+    `size` times the number of strata.
+    """
+    rng = random.Random(seed)
+    reservoirs: Dict[Hashable, Reservoir[T]] = {}
+    index = 0
+    async for item in items:
+        stratum = key(item)
+        reservoir = reservoirs.get(stratum)
+        if reservoir is None:
+            reservoir = reservoirs[stratum] = Reservoir(size, rng)
+        reservoir.add(index, item)
+        index += 1
+
+    quotas = _allocate({stratum: reservoir.seen for stratum, reservoir in reservoirs.items()}, size)
+    sample: List[Tuple[int, T]] = []
+    for stratum in sorted(reservoirs, key=str):
+        held = reservoirs[stratum].items()
+        # A uniform subset of a uniform reservoir is still uniform
+        sample.extend(rng.sample(held, min(quotas[stratum], len(held))))
+    return [item for _, item in sorted(sample, key=lambda entry: entry[0])]
+
+
+def difficulty_domain_stratum(content: ProcessedContent) -> Tuple[str, str]:
+    """Stratum of a content item: its difficulty and primary domain"""
+    return content.difficulty.value, content.domains[0] if content.domains else "general"
+
+
+async def sample_content(
+    items: AsyncIterator[ProcessedContent],
+    size: int,
+    mode: str = "reservoir",
+    seed: int = 0,
+) -> AsyncIterator[ProcessedContent]:
+    """
+    Yield `size` items of a content stream chosen by a sampling mode.
+
+    Args:
+        items: Loader output
+        size: Items to keep
+        mode: "head" (first items), "reservoir" (uniform) or
+            "stratified" (proportional by difficulty and domain)
+        seed: Random seed; the same seed gives the same sample
+    """
+    if mode not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling mode {mode!r}; expected one of {', '.join(SAMPLING_MODES)}")
+
+    if mode == "head":
+        count = 0
+        async for item in items:
+            if count >= size:
+                return
+            yield item
+            count += 1
+        return
+
+    if mode == "reservoir":
+        sample = await reservoir_sample(items, size, seed)
+    else:
+        sample = await stratified_sample(items, size, difficulty_domain_stratum, seed)
+    for item in sample:
+        yield item
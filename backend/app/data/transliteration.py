@@ -0,0 +1,266 @@
+"""
+Compact Telugu <-> romanized word index for filling in transliterations.
+
+Built once from the Dakshina and Aksharantar lexicons
+(scripts/build_transliteration_index.py). Each direction maps a word's
+64-bit hash to its best-attested counterpart through a sorted key array
+and a binary search, and all strings live in two UTF-8 blobs with offset
+arrays. Everything is stored as .npy files in one directory and can be
+memory-mapped, so a multi-million-word index loads instantly and is
+shared between processes by the OS page cache.
+
+romanize_batch transliterates whole sentences word by word: Telugu words
+are found and hashed for the whole batch at once, so ingestion can fill
+in transliterations in bulk without calling a model.
+"""
+import json
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.data.codepoints import codepoint_segments, segment_hashes, telugu_word_spans, text_hashes
+from app.data.models import ProcessedContent
+
+INDEX_VERSION = 1
+
+_ARRAYS = [
+    "native_blob",
+    "native_offsets",
+    "roman_blob",
+    "roman_offsets",
+    "native_keys",
+    "native_entries",
+    "roman_keys",
+    "roman_entries",
+]
+
+
+def normalize_native(word: str) -> str:
+    return unicodedata.normalize("NFC", word.strip())
+
+
+def normalize_roman(word: str) -> str:
+    return word.strip().lower()
+
+
+def _pack(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """UTF-8 blob and offsets (len(strings) + 1) for a list of strings"""
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    offsets[1:] = np.cumsum([len(e) for e in encoded])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _key_index(words: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted word hashes and the entry each belongs to"""
+    keys = text_hashes(words)
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    # Colliding hashes would make lookups ambiguous; the first entry wins
+    unique = np.ones(len(keys), dtype=bool)
+    unique[1:] = keys[1:] != keys[:-1]
+    return keys[unique], order[unique].astype(np.uint32)
+
+
+class TransliterationIndex:
+    """Two-way Telugu/romanized word lookup over sorted arrays"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """
+        Args:
+            arrays: The index arrays (see _ARRAYS), in memory or memory-mapped
+        """
+        missing = [name for name in _ARRAYS if name not in arrays]
+        if missing:
+            raise ValueError(f"Transliteration index is missing {', '.join(missing)}")
+        self._arrays = arrays
+
+    def __len__(self) -> int:
+        """Number of (Telugu, romanized) entries"""
+        return len(self._arrays["native_offsets"]) - 1
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "TransliterationIndex":
+        """Open a saved index; with mmap, arrays are paged in on demand"""
+        directory = Path(directory)
+        with open(directory / "index.json", "r", encoding="utf-8") as f:
+            info = json.load(f)
+        if info.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported transliteration index version in {directory}")
+        mode = "r" if mmap else None
+        return cls({name: np.load(directory / f"{name}.npy", mmap_mode=mode) for name in _ARRAYS})
+
+    def save(self, directory: Path) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in _ARRAYS:
+            np.save(directory / f"{name}.npy", np.asarray(self._arrays[name]))
+        with open(directory / "index.json", "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "entries": len(self)}, f)
+
+    def _string(self, side: str, entry: int) -> str:
+        offsets = self._arrays[f"{side}_offsets"]
+        start, end = int(offsets[entry]), int(offsets[entry + 1])
+        return self._arrays[f"{side}_blob"][start:end].tobytes().decode("utf-8")
+
+    def _entries(self, side: str, hashes: np.ndarray) -> np.ndarray:
+        """Entry of each hash on one side's key array, or -1 when absent"""
+        keys = self._arrays[f"{side}_keys"]
+        if not len(keys) or not len(hashes):
+            return np.full(len(hashes), -1, dtype=np.int64)
+        index = np.minimum(np.searchsorted(keys, hashes), len(keys) - 1)
+        entries = np.asarray(self._arrays[f"{side}_entries"][index], dtype=np.int64)
+        return np.where(keys[index] == hashes, entries, -1)
+
+    def _translate(self, words: List[str], source: str, target: str) -> List[Optional[str]]:
+        results: List[Optional[str]] = []
+        for word, entry in zip(words, self._entries(source, text_hashes(words))):
+            # Confirm the match, so a hash collision can't return a wrong word
+            if entry >= 0 and self._string(source, entry) == word:
+                results.append(self._string(target, entry))
+            else:
+                results.append(None)
+        return results
+
+    def romanize_words(self, words: List[str]) -> List[Optional[str]]:
+        """Best-attested romanization of each Telugu word, or None"""
+        return self._translate([normalize_native(word) for word in words], "native", "roman")
+
+    def telugu_words(self, romanized: List[str]) -> List[Optional[str]]:
+        """Best-attested Telugu spelling of each romanized word, or None"""
+        return self._translate([normalize_roman(word) for word in romanized], "roman", "native")
+
+    def romanize_batch(self, texts: List[str], min_coverage: float = 1.0) -> List[Optional[str]]:
+        """
+        Romanize each text word by word, keeping spaces, punctuation and
+        Latin text as they are.
+
+        Args:
+            texts: Telugu sentences or words
+            min_coverage: Share of Telugu words that must be in the index;
+                below it the text gets None rather than a mix of scripts
+
+        Returns:
+            Romanized text, or None for texts without (enough) known words
+        """
+        texts = [normalize_native(text) for text in texts]
+        codepoints, starts, ends = codepoint_segments(texts)
+        word_starts, word_ends = telugu_word_spans(codepoints, starts)
+        entries = self._entries("native", segment_hashes(codepoints, word_starts, word_ends))
+        owners = np.searchsorted(ends, word_starts, side="right")
+        first_word = np.searchsorted(owners, np.arange(len(texts) + 1))
+
+        joined = "".join(texts)
+        results: List[Optional[str]] = []
+        for i in range(len(texts)):
+            words = range(first_word[i], first_word[i + 1])
+            if not len(words):
+                results.append(None)
+                continue
+
+            pieces = []
+            cursor = int(starts[i])
+            found = 0
+            for w in words:
+                start, end = int(word_starts[w]), int(word_ends[w])
+                word = joined[start:end]
+                pieces.append(joined[cursor:start])
+                entry = int(entries[w])
+                if entry >= 0 and self._string("native", entry) == word:
+                    pieces.append(self._string("roman", entry))
+                    found += 1
+                else:
+                    pieces.append(word)
+                cursor = end
+            pieces.append(joined[cursor:int(ends[i])])
+
+            results.append("".join(pieces) if found / len(words) >= min_coverage else None)
+        return results
+
+
+class TransliterationIndexBuilder:
+    """Collects weighted (Telugu, romanized) pairs and builds the index"""
+
+    def __init__(self):
+        self._weights: Dict[Tuple[str, str], float] = {}
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def add(self, telugu: str, romanized: str, weight: float = 1.0) -> None:
+        telugu, romanized = normalize_native(telugu), normalize_roman(romanized)
+        if telugu and romanized:
+            key = (telugu, romanized)
+            self._weights[key] = self._weights.get(key, 0.0) + weight
+
+    def add_content(self, items: Iterable[ProcessedContent]) -> None:
+        """
+        Add transliteration items from the Dakshina or Aksharantar loaders.
+        Dakshina's alternative romanizations are added with their attestations.
+        """
+        for item in items:
+            alternatives = item.metadata.get("romanizations")
+            if alternatives:
+                for alternative in alternatives:
+                    self.add(item.telugu_text, alternative["romanized"], alternative["attestations"])
+            elif item.transliteration:
+                self.add(item.telugu_text, item.transliteration)
+
+    def build(self) -> TransliterationIndex:
+        """Keep the heaviest pair for every word on each side"""
+        best_roman: Dict[str, Tuple[float, str]] = {}
+        best_native: Dict[str, Tuple[float, str]] = {}
+        # Sorted, so equal weights resolve the same way on every build
+        for (telugu, romanized), weight in sorted(self._weights.items()):
+            if telugu not in best_roman or weight > best_roman[telugu][0]:
+                best_roman[telugu] = (weight, romanized)
+            if romanized not in best_native or weight > best_native[romanized][0]:
+                best_native[romanized] = (weight, telugu)
+
+        pairs = sorted(
+            {(telugu, romanized) for telugu, (_, romanized) in best_roman.items()}
+            | {(telugu, romanized) for romanized, (_, telugu) in best_native.items()}
+        )
+        entry_of = {pair: index for index, pair in enumerate(pairs)}
+
+        natives = list(best_roman)
+        native_keys, native_order = _key_index(natives)
+        native_entries = np.array(
+            [entry_of[(natives[i], best_roman[natives[i]][1])] for i in native_order], dtype=np.uint32
+        )
+        romans = list(best_native)
+        roman_keys, roman_order = _key_index(romans)
+        roman_entries = np.array(
+            [entry_of[(best_native[romans[i]][1], romans[i])] for i in roman_order], dtype=np.uint32
+        )
+
+        native_blob, native_offsets = _pack([telugu for telugu, _ in pairs])
+        roman_blob, roman_offsets = _pack([romanized for _, romanized in pairs])
+        return TransliterationIndex({
+            "native_blob": native_blob,
+            "native_offsets": native_offsets,
+            "roman_blob": roman_blob,
+            "roman_offsets": roman_offsets,
+            "native_keys": native_keys,
+            "native_entries": native_entries,
+            "roman_keys": roman_keys,
+            "roman_entries": roman_entries,
+        })
+
+
+@lru_cache(maxsize=None)
+def get_transliteration_index(index_path: Optional[str] = None) -> Optional[TransliterationIndex]:
+    """
+    Shared memory-mapped index, opened once per process.
+    Uses settings.transliteration_index_path unless a path is given;
+    None when no index has been built.
+    """
+    if index_path is None:
+        from app.core.config import settings
+        index_path = settings.transliteration_index_path
+    if not index_path or not (Path(index_path) / "index.json").is_file():
+        return None
+    return TransliterationIndex.load(Path(index_path))
@@ -94,3 +94,11 @@ app.include_router(api_router, prefix="/api/v1")
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "service": settings.app_name}
+
+
+@app.get("/health/db")
+async def database_health():
+    """Connection pool usage and acquire-wait metrics"""
+    stats = db.pool_stats()
+    status = "healthy" if stats["connected"] else "unavailable"
+    return {"status": status, "pool": stats}
@@ -14,22 +14,25 @@ from app.models.learner import (
     LearningDomain,
 )
 
+# Profile lookup on nearly every request, prepared on every pooled connection
+LEARNER_BY_ID = db.register(
+    "learner-by-id",
+    """
+    SELECT id, email, native_language, target_goal, daily_time_minutes,
+           style_preference, domains, proficiency_level, streak_days,
+           total_practice_minutes
+    FROM learner_profiles
+    WHERE id = $1
+    """,
+)
+
 
 class LearnerRepository:
     """Repository for learner profile CRUD operations"""
     
     async def get_by_id(self, learner_id: str) -> Optional[LearnerProfile]:
         """Get learner profile by ID"""
-        row = await db.fetchrow(
-            """
-            SELECT id, email, native_language, target_goal, daily_time_minutes,
-                   style_preference, domains, proficiency_level, streak_days,
-                   total_practice_minutes
-            FROM learner_profiles
-            WHERE id = $1
-            """,
-            learner_id
-        )
+        row = await db.fetchrow_named(LEARNER_BY_ID, learner_id)
         
         if not row:
             return None
@@ -7,16 +7,45 @@ from datetime import datetime
 from app.core.database import db
 from app.models.review import VocabularyItem, SpacedRepetitionItem
 
+# Queries on the review path, prepared on every pooled connection
+GET_VOCABULARY_ITEM = db.register(
+    "get-vocabulary-item",
+    "SELECT * FROM vocabulary_items WHERE id = $1",
+)
+GET_SRS_ITEM = db.register(
+    "get-srs-item",
+    "SELECT * FROM spaced_repetition_items WHERE id = $1",
+)
+DUE_ITEMS = db.register(
+    "due-items",
+    """
+    SELECT * FROM spaced_repetition_items
+    WHERE learner_id = $1 AND next_review <= $2
+    ORDER BY next_review ASC
+    LIMIT $3
+    """,
+)
+UPDATE_SRS_ITEM = db.register(
+    "update-srs-item",
+    """
+    UPDATE spaced_repetition_items
+    SET ease_factor = $2,
+        interval_days = $3,
+        repetitions = $4,
+        next_review = $5,
+        last_review = $6
+    WHERE id = $1
+    RETURNING *
+    """,
+)
+
 
 class ReviewRepository:
     """Repository for spaced repetition operations"""
     
     async def get_vocabulary_item(self, vocab_id: str) -> Optional[VocabularyItem]:
         """Get a vocabulary item by ID"""
-        row = await db.fetchrow(
-            "SELECT * FROM vocabulary_items WHERE id = $1",
-            vocab_id
-        )
+        row = await db.fetchrow_named(GET_VOCABULARY_ITEM, vocab_id)
         
         if not row:
             return None
@@ -33,10 +62,7 @@ class ReviewRepository:
     
     async def get_srs_item(self, item_id: str) -> Optional[SpacedRepetitionItem]:
         """Get a spaced repetition item by ID"""
-        row = await db.fetchrow(
-            "SELECT * FROM spaced_repetition_items WHERE id = $1",
-            item_id
-        )
+        row = await db.fetchrow_named(GET_SRS_ITEM, item_id)
         
         if not row:
             return None
@@ -58,13 +84,8 @@ class ReviewRepository:
         limit: int = 20
     ) -> List[SpacedRepetitionItem]:
         """Get items due for review"""
-        rows = await db.fetch(
-            """
-            SELECT * FROM spaced_repetition_items
-            WHERE learner_id = $1 AND next_review <= $2
-            ORDER BY next_review ASC
-            LIMIT $3
-            """,
+        rows = await db.fetch_named(
+            DUE_ITEMS,
             learner_id,
             datetime.utcnow(),
             limit
@@ -114,17 +135,8 @@ class ReviewRepository:
         next_review: datetime,
     ) -> SpacedRepetitionItem:
         """Update a spaced repetition item after review"""
-        row = await db.fetchrow(
-            """
-            UPDATE spaced_repetition_items
-            SET ease_factor = $2,
-                interval_days = $3,
-                repetitions = $4,
-                next_review = $5,
-                last_review = $6
-            WHERE id = $1
-            RETURNING *
-            """,
+        row = await db.fetchrow_named(
+            UPDATE_SRS_ITEM,
             item_id,
             ease_factor,
             interval_days,
@@ -7,6 +7,32 @@ from datetime import datetime
 from app.core.database import db
 from app.models.skill import SkillConcept, LearnerSkill, SkillCategory
 
+# Queries on the skill path, prepared on every pooled connection
+LEARNER_SKILLS = db.register(
+    "learner-skills",
+    "SELECT * FROM learner_skills WHERE learner_id = $1",
+)
+GET_LEARNER_SKILL = db.register(
+    "get-learner-skill",
+    """
+    SELECT * FROM learner_skills
+    WHERE learner_id = $1 AND concept_id = $2
+    """,
+)
+UPSERT_LEARNER_SKILL = db.register(
+    "upsert-learner-skill",
+    """
+    INSERT INTO learner_skills (learner_id, concept_id, mastery_score, attempts, last_practiced)
+    VALUES ($1, $2, $3, $4, $5)
+    ON CONFLICT (learner_id, concept_id)
+    DO UPDATE SET
+        mastery_score = $3,
+        attempts = $4,
+        last_practiced = $5
+    RETURNING *
+    """,
+)
+
 
 class SkillRepository:
     """Repository for skill concept and mastery operations"""
@@ -46,10 +72,7 @@ class SkillRepository:
     
     async def get_learner_skills(self, learner_id: str) -> List[LearnerSkill]:
         """Get all skill masteries for a learner"""
-        rows = await db.fetch(
-            "SELECT * FROM learner_skills WHERE learner_id = $1",
-            learner_id
-        )
+        rows = await db.fetch_named(LEARNER_SKILLS, learner_id)
         
         return [
             LearnerSkill(
@@ -69,14 +92,7 @@ class SkillRepository:
         concept_id: str
     ) -> Optional[LearnerSkill]:
         """Get a learner's mastery of a specific concept"""
-        row = await db.fetchrow(
-            """
-            SELECT * FROM learner_skills
-            WHERE learner_id = $1 AND concept_id = $2
-            """,
-            learner_id,
-            concept_id
-        )
+        row = await db.fetchrow_named(GET_LEARNER_SKILL, learner_id, concept_id)
         
         if not row:
             return None
@@ -98,17 +114,8 @@ class SkillRepository:
         attempts: int,
     ) -> LearnerSkill:
         """Insert or update a learner's skill mastery"""
-        row = await db.fetchrow(
-            """
-            INSERT INTO learner_skills (learner_id, concept_id, mastery_score, attempts, last_practiced)
-            VALUES ($1, $2, $3, $4, $5)
-            ON CONFLICT (learner_id, concept_id)
-            DO UPDATE SET
-                mastery_score = $3,
-                attempts = $4,
-                last_practiced = $5
-            RETURNING *
-            """,
+        row = await db.fetchrow_named(
+            UPSERT_LEARNER_SKILL,
             learner_id,
             concept_id,
             mastery_score,
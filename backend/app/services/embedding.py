@@ -3,6 +3,7 @@ Embedding service for generating vector embeddings of Telugu text.
 Uses bge-m3 model which has excellent multilingual support including Telugu.
 """
 from typing import List, Optional
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,8 @@ class EmbeddingService:
     async def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for multiple texts.
+        Encoding runs in a worker thread so ingestion can keep loading and
+        uploading other batches meanwhile.
         
         Args:
             texts: List of texts to embed
@@ -61,7 +64,9 @@ class EmbeddingService:
         if not self._initialized:
             await self.initialize()
         
-        embeddings = self.model.encode(texts, normalize_embeddings=True)
+        embeddings = await asyncio.to_thread(
+            self.model.encode, texts, normalize_embeddings=True
+        )
         return [emb.tolist() for emb in embeddings]
     
     async def embed_query(self, query: str) -> List[float]:
@@ -0,0 +1,112 @@
+"""
+Benchmark domain classification throughput.
+
+Compares the previous per-sentence keyword scan with the shared compiled
+classifier, one pair at a time and in batches. Uses sentence pairs from a
+Samanantar-style TSV (english<TAB>telugu) if given, otherwise a built-in
+sample repeated to the requested size.
+
+Usage:
+    python -m scripts.benchmark_domains
+    python -m scripts.benchmark_domains --items 200000 --batch-size 4096
+    python -m scripts.benchmark_domains --tsv ./data/samanantar/samanantar_te_en.tsv
+"""
+import argparse
+import csv
+import itertools
+import time
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+SAMPLE_PAIRS = [
+    ("I go to office by bus", "నేను బస్సులో ఆఫీసుకు వెళ్తాను"),
+    ("Mother made breakfast", "అమ్మ టిఫిన్ చేసింది"),
+    ("This movie is very good", "ఈ సినిమా చాలా బాగుంది"),
+    ("Where is the bus to Hyderabad?", "హైదరాబాద్ వెళ్ళే బస్సు ఎక్కడ?"),
+    ("I didn't understand", "నాకు అర్థం కాలేదు"),
+    ("The manager called a meeting about the new project", "మేనేజర్ కొత్త ప్రాజెక్ట్ గురించి సమావేశం పెట్టారు"),
+    ("Please say it again", "దయచేసి మళ్ళీ చెప్పండి"),
+    ("Does this train go to Vijayawada?", "ఈ రైలు విజయవాడ వెళ్తుందా?"),
+]
+
+LEGACY_KEYWORDS = {
+    "office": ["office", "work", "meeting", "project", "manager", "employee", "company", "business"],
+    "family": ["mother", "father", "sister", "brother", "family", "home", "house", "children"],
+    "travel": ["travel", "train", "bus", "airport", "hotel", "ticket", "station", "journey"],
+    "movies": ["movie", "film", "actor", "song", "music", "cinema", "hero"],
+}
+
+
+def legacy_detect_domains(english: str, telugu: str) -> list:
+    """The original substring scan (English only)"""
+    text_lower = english.lower()
+    domains = [
+        domain
+        for domain, keywords in LEGACY_KEYWORDS.items()
+        if any(kw in text_lower for kw in keywords)
+    ]
+    return domains or ["general"]
+
+
+def substring_detect_domains(taxonomy: dict, english: str, telugu: str) -> list:
+    """The original substring scan extended to the full English + Telugu taxonomy"""
+    text_lower = english.lower()
+    domains = [
+        domain
+        for domain, keywords in taxonomy.items()
+        if any(kw in text_lower for kw in keywords["en"]) or any(kw in telugu for kw in keywords["te"])
+    ]
+    return domains or ["general"]
+
+
+def load_pairs(tsv: Path, items: int) -> list:
+    if tsv:
+        with open(tsv, "r", encoding="utf-8") as f:
+            rows = (row for row in csv.reader(f, delimiter="\t") if len(row) >= 2)
+            return [(row[0], row[1]) for row in itertools.islice(rows, items)]
+    return list(itertools.islice(itertools.cycle(SAMPLE_PAIRS), items))
+
+
+def report(name: str, items: int, seconds: float) -> None:
+    print(f"  {name:<32} {seconds:8.3f}s  {items / seconds:>12,.0f} pairs/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark domain classification")
+    parser.add_argument("--items", type=int, default=100_000, help="Pairs to classify")
+    parser.add_argument("--batch-size", type=int, default=1024, help="Pairs per batch")
+    parser.add_argument("--tsv", type=str, default=None, help="TSV of english<TAB>telugu pairs")
+    args = parser.parse_args()
+
+    from app.data.domains import DEFAULT_TAXONOMY, DomainClassifier
+
+    pairs = load_pairs(Path(args.tsv) if args.tsv else None, args.items)
+    classifier = DomainClassifier()
+    print(f"Classifying {len(pairs)} pairs\n")
+
+    started = time.perf_counter()
+    for english, telugu in pairs:
+        legacy_detect_domains(english, telugu)
+    report("legacy scan (English only)", len(pairs), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for english, telugu in pairs:
+        substring_detect_domains(DEFAULT_TAXONOMY, english, telugu)
+    report("substring scan, full taxonomy", len(pairs), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for english, telugu in pairs:
+        classifier.classify(english, telugu)
+    report("compiled, one pair at a time", len(pairs), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for start in range(0, len(pairs), args.batch_size):
+        classifier.classify_batch(pairs[start:start + args.batch_size])
+    report(f"compiled, batches of {args.batch_size}", len(pairs), time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
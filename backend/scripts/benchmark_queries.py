@@ -0,0 +1,171 @@
+"""
+Benchmark the repository hot queries: literal SQL vs the prepared registry.
+
+Runs the queries behind the review endpoints (due items, SRS item,
+vocabulary item) and the skill endpoints (learner profile, learner
+skills, one learner skill) against the configured database in three
+modes, each with a fresh pool:
+
+    literal-uncached  literal SQL, no asyncpg statement cache (as behind pgbouncer)
+    literal-cached    literal SQL through asyncpg's per-connection statement cache
+    prepared          the named registry, prepared when each connection opens
+
+Only read queries are run, so the database is left unchanged. Latencies
+are per query, measured around the pool call (acquire included).
+
+Usage:
+    python -m scripts.benchmark_queries
+    python -m scripts.benchmark_queries --iterations 5000 --concurrency 8
+    python -m scripts.benchmark_queries --learner-id <uuid>
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.core.database import db
+from app.repositories.learner import LEARNER_BY_ID
+from app.repositories.review import DUE_ITEMS, GET_SRS_ITEM, GET_VOCABULARY_ITEM
+from app.repositories.skill import GET_LEARNER_SKILL, LEARNER_SKILLS
+
+MODES = {
+    "literal-uncached": {"db_prepared_statements": False, "db_statement_cache_size": 0},
+    "literal-cached": {"db_prepared_statements": False},
+    "prepared": {"db_prepared_statements": True},
+}
+
+
+async def pick_fixtures(learner_id: str = None) -> dict:
+    """A learner with SRS items and skills, plus one of each to look up"""
+    if learner_id is None:
+        learner_id = await db.fetchval(
+            """
+            SELECT learner_id FROM spaced_repetition_items
+            GROUP BY learner_id
+            ORDER BY COUNT(*) DESC
+            LIMIT 1
+            """
+        )
+    if learner_id is None:
+        raise SystemExit("No spaced repetition items found; pass --learner-id or seed the database")
+
+    srs_item = await db.fetchrow(
+        "SELECT id, vocab_id FROM spaced_repetition_items WHERE learner_id = $1 LIMIT 1",
+        learner_id,
+    )
+    concept_id = await db.fetchval(
+        "SELECT concept_id FROM learner_skills WHERE learner_id = $1 LIMIT 1",
+        learner_id,
+    )
+    return {
+        "learner_id": learner_id,
+        "srs_item_id": srs_item["id"],
+        "vocab_id": srs_item["vocab_id"],
+        # Any id will do for the lookup if the learner has no skills yet
+        "concept_id": concept_id or srs_item["vocab_id"],
+    }
+
+
+def endpoint_queries(fixtures: dict) -> dict:
+    """(method, query name, args) for each endpoint's queries"""
+    learner_id = fixtures["learner_id"]
+    return {
+        "review": [
+            (db.fetch_named, DUE_ITEMS, (learner_id, datetime.utcnow(), 20)),
+            (db.fetchrow_named, GET_SRS_ITEM, (fixtures["srs_item_id"],)),
+            (db.fetchrow_named, GET_VOCABULARY_ITEM, (fixtures["vocab_id"],)),
+        ],
+        "skill": [
+            (db.fetchrow_named, LEARNER_BY_ID, (learner_id,)),
+            (db.fetch_named, LEARNER_SKILLS, (learner_id,)),
+            (db.fetchrow_named, GET_LEARNER_SKILL, (learner_id, fixtures["concept_id"])),
+        ],
+    }
+
+
+async def run_mode(queries: dict, iterations: int, concurrency: int, warmup: int) -> dict:
+    """Seconds per call, keyed by (endpoint, query name)"""
+    timings = defaultdict(list)
+
+    async def worker(count: int, record: bool):
+        for _ in range(count):
+            for endpoint, calls in queries.items():
+                for method, name, args in calls:
+                    started = time.perf_counter()
+                    await method(name, *args)
+                    if record:
+                        timings[(endpoint, name)].append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker(warmup, False) for _ in range(concurrency)))
+    per_worker = max(iterations // concurrency, 1)
+    await asyncio.gather(*(worker(per_worker, True) for _ in range(concurrency)))
+    return timings
+
+
+def summarize(samples: list) -> tuple:
+    ordered = sorted(samples)
+    p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+    return statistics.mean(ordered) * 1000, statistics.median(ordered) * 1000, p95 * 1000
+
+
+def request_time(timings: dict, endpoint: str) -> float:
+    """Mean seconds spent in one request's queries"""
+    return sum(statistics.mean(samples) for (e, _), samples in timings.items() if e == endpoint)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark literal vs prepared repository queries")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per query per mode")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent callers")
+    parser.add_argument("--warmup", type=int, default=50, help="Unrecorded calls per caller first")
+    parser.add_argument("--learner-id", help="Learner to query (default: the one with most SRS items)")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    args = parser.parse_args()
+
+    defaults = {key: getattr(settings, key) for key in ("db_prepared_statements", "db_statement_cache_size")}
+    results = {}
+    fixtures = None
+    for mode in args.modes:
+        for key, value in {**defaults, **MODES[mode]}.items():
+            setattr(settings, key, value)
+        await db.connect()
+        try:
+            if fixtures is None:
+                fixtures = await pick_fixtures(args.learner_id)
+            results[mode] = await run_mode(
+                endpoint_queries(fixtures), args.iterations, args.concurrency, args.warmup
+            )
+        finally:
+            await db.disconnect()
+
+    print(f"\n{args.iterations} calls per query, concurrency {args.concurrency}; milliseconds (mean / p50 / p95)\n")
+    header = f"{'endpoint':<8} {'query':<22}" + "".join(f"{mode:>26}" for mode in args.modes)
+    print(header)
+    print("-" * len(header))
+    for endpoint, name in results[args.modes[0]]:
+        cells = []
+        for mode in args.modes:
+            mean, p50, p95 = summarize(results[mode][(endpoint, name)])
+            cells.append(f"{mean:8.3f} /{p50:7.3f} /{p95:7.3f}")
+        print(f"{endpoint:<8} {name:<22}" + "".join(f"{cell:>26}" for cell in cells))
+
+    if "prepared" in results:
+        print()
+        for mode in args.modes:
+            if mode == "prepared":
+                continue
+            for endpoint in ("review", "skill"):
+                saving = 1 - request_time(results["prepared"], endpoint) / request_time(results[mode], endpoint)
+                print(f"{endpoint}: prepared spends {saving:.1%} less time in queries per request than {mode}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
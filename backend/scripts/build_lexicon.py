@@ -0,0 +1,142 @@
+"""
+Build the Telugu word-frequency lexicon used for difficulty scoring.
+
+Counts every Telugu word in one or more corpora and writes the counts as
+sorted hash/count arrays (.npz). Loaders pick the file up from
+settings.difficulty_lexicon_path; re-run after adding corpora, then
+recompile any corpus caches so stored difficulties are refreshed.
+
+IndicCorp is counted by its own sharded loader (every word in the corpus,
+not only the sentence candidates it would yield), in parallel with
+settings.ingest_parse_workers processes.
+
+Usage:
+    python -m scripts.build_lexicon --corpus samanantar=./data/samanantar
+    python -m scripts.build_lexicon --corpus samanantar=./data/samanantar --corpus tatoeba=./data/tatoeba
+    python -m scripts.build_lexicon --corpus indiccorp=./data/indiccorp --min-count 3
+    python -m scripts.build_lexicon --corpus cache=./data/cache/samanantar.parquet --output ./data/lexicon/telugu_words.npz
+"""
+import asyncio
+import argparse
+import time
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+SOURCES = ["tatoeba", "samanantar", "indiccorp", "custom", "cache"]
+
+
+def parse_corpus(value: str):
+    source, sep, path = value.partition("=")
+    if not sep or source not in SOURCES:
+        raise argparse.ArgumentTypeError(f"Expected SOURCE=PATH with SOURCE one of {', '.join(SOURCES)}")
+    return source, Path(path)
+
+
+def make_loader(source: str, data_path: Path, max_items: int = None):
+    from app.core.config import settings
+    from app.data.corpus_cache import CorpusCacheLoader
+    from app.data.loaders.custom import CustomLoader
+    from app.data.loaders.tatoeba import TatoebaLoader
+    from app.data.loaders.samanantar import SamanantatLoader
+    from app.data.loaders.indiccorp import IndicCorpLoader
+
+    if source == "custom":
+        return CustomLoader(data_path)
+    if source == "tatoeba":
+        return TatoebaLoader(data_path)
+    if source == "samanantar":
+        return SamanantatLoader(
+            data_path,
+            max_items=max_items,
+            parse_workers=settings.ingest_parse_workers,
+            chunk_bytes=settings.ingest_parse_chunk_bytes,
+        )
+    if source == "indiccorp":
+        return IndicCorpLoader(
+            data_path,
+            parse_workers=settings.ingest_parse_workers,
+            emit_candidates=False,
+        )
+    return CorpusCacheLoader(data_path)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Build the Telugu word-frequency lexicon")
+    parser.add_argument(
+        "--corpus",
+        type=parse_corpus,
+        action="append",
+        required=True,
+        help="SOURCE=PATH of a corpus to count (repeatable)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Output .npz file (default: settings.difficulty_lexicon_path)",
+    )
+    parser.add_argument(
+        "--max-items",
+        type=int,
+        default=None,
+        help="Maximum sentences per corpus (samanantar only)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10_000,
+        help="Sentences counted per batch",
+    )
+    parser.add_argument(
+        "--min-count",
+        type=int,
+        default=1,
+        help="Drop words seen fewer times (trims typos from large corpora)",
+    )
+    args = parser.parse_args()
+
+    from app.core.config import settings
+    from app.data.difficulty import LexiconBuilder
+
+    builder = LexiconBuilder()
+    started = time.monotonic()
+    for source, data_path in args.corpus:
+        loader = make_loader(source, data_path, args.max_items)
+        if not loader.validate_source():
+            print(f"Error: Invalid data source at {data_path}")
+            sys.exit(1)
+
+        print(f"Counting words in {loader.source_name} ({data_path})...")
+        if source == "indiccorp":
+            async for _ in loader.load():
+                pass
+            builder.add_counts(loader.token_counts.hashes, loader.token_counts.counts)
+            print(f"  {loader.lines_read} lines, {len(loader.token_counts)} distinct words")
+            continue
+
+        sentences = 0
+        batch = []
+        async for content in loader.load():
+            batch.append(content.telugu_text)
+            if len(batch) >= args.batch_size:
+                builder.add(batch)
+                sentences += len(batch)
+                batch = []
+        builder.add(batch)
+        sentences += len(batch)
+        print(f"  {sentences} sentences")
+
+    lexicon = builder.finish(min_count=args.min_count)
+    output = Path(args.output or settings.difficulty_lexicon_path)
+    lexicon.save(output)
+    elapsed = time.monotonic() - started
+
+    print(f"\nWrote {len(lexicon)} distinct words ({int(lexicon.counts.sum())} occurrences) to {output} in {elapsed:.1f}s")
+    print(f"Common-word threshold: {lexicon.common_threshold(settings.difficulty_common_words)} occurrences")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""
+Build the Telugu <-> romanized transliteration index.
+
+Streams the Dakshina and/or Aksharantar lexicons, keeps the best-attested
+romanization of every Telugu word (and the best Telugu spelling of every
+romanized word), and writes a memory-mappable index directory. Ingestion
+with --transliterate uses it to fill in missing transliterations.
+
+Usage:
+    python -m scripts.build_transliteration_index --corpus dakshina=./data/dakshina
+    python -m scripts.build_transliteration_index --corpus dakshina=./data/dakshina --corpus aksharantar=./data/aksharantar
+    python -m scripts.ingest_data --source samanantar --path ./data/samanantar --transliterate
+"""
+import asyncio
+import argparse
+import time
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+SOURCES = ["dakshina", "aksharantar"]
+
+
+def parse_corpus(value: str):
+    source, sep, path = value.partition("=")
+    if not sep or source not in SOURCES:
+        raise argparse.ArgumentTypeError(f"Expected SOURCE=PATH with SOURCE one of {', '.join(SOURCES)}")
+    return source, Path(path)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Build the transliteration index")
+    parser.add_argument(
+        "--corpus",
+        type=parse_corpus,
+        action="append",
+        required=True,
+        help="SOURCE=PATH of a transliteration corpus (repeatable)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Output directory (default: settings.transliteration_index_path)",
+    )
+    parser.add_argument(
+        "--max-items",
+        type=int,
+        default=None,
+        help="Maximum entries read per corpus",
+    )
+    args = parser.parse_args()
+
+    from app.core.config import settings
+    from app.data.loaders.aksharantar import AksharantarLoader
+    from app.data.loaders.dakshina import DakshinaLoader
+    from app.data.transliteration import TransliterationIndexBuilder
+
+    builder = TransliterationIndexBuilder()
+    started = time.monotonic()
+    for source, data_path in args.corpus:
+        loader_class = DakshinaLoader if source == "dakshina" else AksharantarLoader
+        loader = loader_class(data_path, max_items=args.max_items)
+        if not loader.validate_source():
+            print(f"Error: Invalid data source at {data_path}")
+            sys.exit(1)
+
+        print(f"Reading {loader.source_name} ({data_path})...")
+        count = 0
+        async for content in loader.load():
+            builder.add_content([content])
+            count += 1
+        print(f"  {count} entries, {len(builder)} distinct pairs so far")
+
+    index = builder.build()
+    output = Path(args.output or settings.transliteration_index_path)
+    index.save(output)
+    elapsed = time.monotonic() - started
+
+    size = sum(path.stat().st_size for path in output.iterdir())
+    print(f"\nWrote {len(index)} entries to {output} ({size / 1e6:.1f} MB) in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
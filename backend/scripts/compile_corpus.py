@@ -0,0 +1,128 @@
+"""
+Compile a corpus into a columnar Parquet cache.
+
+Parses the source once, applying the loader's filtering, difficulty and
+domain annotation, and writes the result with a schema version. Later
+ingestions and dry runs read the cache with --source cache and skip
+parsing entirely. Re-run after changing a loader's heuristics.
+
+Requires: pip install pyarrow
+
+Usage:
+    python -m scripts.compile_corpus --source samanantar --path ./data/samanantar
+    python -m scripts.compile_corpus --source samanantar --path ./data/samanantar --max-items 50000 --sample stratified
+    python -m scripts.compile_corpus --source tatoeba --path ./data/tatoeba --output ./data/cache/tatoeba.parquet
+    python -m scripts.ingest_data --source cache --path ./data/cache/samanantar.parquet
+"""
+import asyncio
+import argparse
+import time
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compile a corpus into a Parquet cache")
+    parser.add_argument(
+        "--source",
+        type=str,
+        required=True,
+        choices=["tatoeba", "samanantar", "custom"],
+        help="Data source type",
+    )
+    parser.add_argument(
+        "--path",
+        type=str,
+        required=True,
+        help="Path to data directory",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Output .parquet file (default: data/cache/<source>.parquet)",
+    )
+    parser.add_argument(
+        "--name",
+        type=str,
+        default="Custom",
+        help="Source name (for custom sources)",
+    )
+    parser.add_argument(
+        "--license",
+        type=str,
+        default="Custom",
+        help="License info (for custom sources)",
+    )
+    parser.add_argument(
+        "--max-items",
+        type=int,
+        default=None,
+        help="Maximum items to compile (samanantar only)",
+    )
+    parser.add_argument(
+        "--sample",
+        type=str,
+        default="head",
+        choices=["head", "reservoir", "stratified"],
+        help="How --max-items are chosen: first items, uniform, or by difficulty and domain",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for --sample reservoir/stratified",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="Processes for parsing large corpora in parallel (samanantar only)",
+    )
+    args = parser.parse_args()
+
+    from app.core.config import settings
+    from app.data.corpus_cache import compile_corpus
+    from app.data.loaders.custom import CustomLoader
+    from app.data.loaders.tatoeba import TatoebaLoader
+    from app.data.loaders.samanantar import SamanantatLoader
+
+    data_path = Path(args.path)
+    if args.source == "custom":
+        loader = CustomLoader(data_path, args.name, args.license)
+    elif args.source == "tatoeba":
+        loader = TatoebaLoader(data_path)
+    else:
+        loader = SamanantatLoader(
+            data_path,
+            max_items=args.max_items,
+            parse_workers=(
+                settings.ingest_parse_workers if args.parse_workers is None else args.parse_workers
+            ),
+            chunk_bytes=settings.ingest_parse_chunk_bytes,
+            sampling=args.sample,
+            seed=args.seed,
+        )
+
+    if not loader.validate_source():
+        print(f"Error: Invalid data source at {data_path}")
+        sys.exit(1)
+
+    output = Path(args.output) if args.output else CACHE_DIR / f"{args.source}.parquet"
+    print(f"Compiling {loader.source_name} from {data_path}...")
+    started = time.monotonic()
+    rows = await compile_corpus(loader, output)
+    elapsed = time.monotonic() - started
+
+    print(f"\nWrote {rows} rows to {output} in {elapsed:.1f}s")
+    print(f"Size: {output.stat().st_size / 1e6:.1f} MB")
+    print(f"\nIngest with: python -m scripts.ingest_data --source cache --path {output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -5,27 +5,72 @@ Sources:
 - Tatoeba: Telugu-English sentence pairs
 - Dakshina: Transliteration data
 
+Downloads stream to disk and resume after an interruption (re-run the
+same command). What was downloaded and derived is recorded in
+data/manifest.json, and steps whose inputs haven't changed are skipped
+on the next run (--force redoes everything).
+
 Usage:
     python -m scripts.download_data --source tatoeba
     python -m scripts.download_data --source all
 """
 import asyncio
 import argparse
-import httpx
-import tarfile
-import zipfile
 import csv
+import httpx
 import json
 from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
 import sys
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 DATA_DIR = Path(__file__).parent.parent / "data"
 
+TATOEBA_PAIRS_STEP = "tatoeba/pairs"
+
+# Bump when extract_tatoeba_pairs changes its output, so old files are rebuilt
+TATOEBA_PAIRS_VERSION = 1
+
+SAMANANTAR_SAMPLE_STEP = "samanantar/sample"
+SAMANANTAR_DATASET = "ai4bharat/samanantar"
+
 
-async def download_tatoeba():
+def _pairs_inputs(download_hashes: Dict[str, str]) -> dict:
+    return {"version": TATOEBA_PAIRS_VERSION, "downloads": download_hashes}
+
+
+def samanantar_sample_inputs(max_items: int) -> dict:
+    """
+    Manifest inputs of a Samanantar sample: the first max_items pairs at
+    the dataset's current revision (None when the Hub can't be reached,
+    in which case the sample is never considered current).
+    """
+    from app.data.downloads import huggingface_dataset_revision
+    
+    return {
+        "dataset": SAMANANTAR_DATASET,
+        "config": "te",
+        "split": "train",
+        "revision": huggingface_dataset_revision(SAMANANTAR_DATASET),
+        "max_items": max_items,
+    }
+
+
+async def download_tatoeba(manifest, concurrency: int = 3, force: bool = False):
     """
     Download Telugu sentences from Tatoeba.
     Creates a pre-filtered Telugu-English pairs file.
+    
+    Nothing is downloaded when the manifest shows the remote files are
+    unchanged and the pairs file is intact; pairs are not re-extracted
+    when new downloads have the same content as last time.
+    
+    Args:
+        manifest: DataManifest recording downloads and the pairs file
+        concurrency: Files downloaded at the same time
+        force: Ignore the manifest and redo every step
     """
     print("=== Downloading Tatoeba Telugu Data ===")
     
@@ -43,109 +88,133 @@ async def download_tatoeba():
     print("Note: Full Tatoeba download is large (~1GB compressed)")
     print("Using per-language files instead for Telugu and English...")
     
-    async with httpx.AsyncClient(timeout=300.0, follow_redirects=True) as client:
-        # Download Telugu sentences
-        print("\nDownloading Telugu sentences...")
-        tel_file = tatoeba_dir / "tel_sentences.tsv.bz2"
-        
-        try:
-            response = await client.get(tel_sentences_url)
-            response.raise_for_status()
-            tel_file.write_bytes(response.content)
-            print(f"  Saved: {tel_file}")
-        except Exception as e:
-            print(f"  Error downloading Telugu sentences: {e}")
-            print("  Falling back to manual extraction instructions...")
-            print_manual_instructions()
+    from app.data.downloads import DownloadError, DownloadSpec, download_files, remote_info
+    
+    tel_file = tatoeba_dir / "tel_sentences.tsv.bz2"
+    eng_file = tatoeba_dir / "eng_sentences.tsv.bz2"
+    links_archive = tatoeba_dir / "links.tar.bz2"
+    output_file = tatoeba_dir / "telugu_english_pairs.tsv"
+    urls = [tel_sentences_url, eng_sentences_url, links_url]
+    
+    if not force:
+        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            remotes = await asyncio.gather(*(remote_info(client, url) for url in urls))
+        recorded = manifest.download_hashes(urls)
+        if (
+            recorded
+            and all(manifest.remote_unchanged(url, remote) for url, remote in zip(urls, remotes))
+            and manifest.is_current(TATOEBA_PAIRS_STEP, _pairs_inputs(recorded))
+        ):
+            print(f"\nUnchanged since the last download; keeping {output_file} (use --force to refresh)")
             return
+    
+    # Stream to disk, resuming any partial files from an earlier run
+    print("\nDownloading Telugu sentences, English sentences (~200MB) and links...")
+    try:
+        results = await download_files(
+            [
+                DownloadSpec(tel_sentences_url, tel_file),
+                DownloadSpec(eng_sentences_url, eng_file),
+                DownloadSpec(links_url, links_archive),
+            ],
+            concurrency=concurrency,
+        )
+    except DownloadError as e:
+        print(f"  Error downloading Tatoeba files: {e}")
+        print("  Partial files are kept; re-run to resume, or download manually:")
+        print_manual_instructions()
+        return
+    for result in results:
+        note = " (resumed)" if result.resumed else ""
+        print(f"  Saved: {result.path} ({result.size / 1e6:.1f} MB, sha256 {result.sha256[:12]}){note}")
+        manifest.record_download(result)
+    
+    inputs = _pairs_inputs({result.url: result.sha256 for result in results})
+    if not force and manifest.is_current(TATOEBA_PAIRS_STEP, inputs):
+        print(f"\nDownloads match the last run; {output_file} is up to date")
+    else:
+        # Stream the compressed downloads directly, without extracting to disk
+        print("\nFinding Telugu-English pairs...")
+        from app.data.readers import DataFile
         
-        # Download English sentences  
-        print("Downloading English sentences (this is large, ~200MB)...")
-        eng_file = tatoeba_dir / "eng_sentences.tsv.bz2"
-        
-        try:
-            response = await client.get(eng_sentences_url)
-            response.raise_for_status()
-            eng_file.write_bytes(response.content)
-            print(f"  Saved: {eng_file}")
-        except Exception as e:
-            print(f"  Error downloading English sentences: {e}")
-            return
+        count = extract_tatoeba_pairs(
+            DataFile(tel_file),
+            DataFile(eng_file),
+            DataFile(links_archive, member="links.csv"),
+            output_file,
+        )
+        manifest.record_step(TATOEBA_PAIRS_STEP, inputs, [output_file])
         
-        # Download links
-        print("Downloading sentence links...")
-        try:
-            response = await client.get(links_url)
-            response.raise_for_status()
-            links_file = tatoeba_dir / "links.tar.bz2"
-            links_file.write_bytes(response.content)
-            print(f"  Saved: {links_file}")
-        except Exception as e:
-            print(f"  Error downloading links: {e}")
-            return
-    
-    # Extract and process
-    print("\nExtracting files...")
-    import bz2
+        print(f"\nSaved to: {output_file}")
+        print(f"Total pairs: {count}")
     
-    # Extract Telugu sentences
-    with bz2.open(tel_file, "rt", encoding="utf-8") as f:
-        tel_sentences = {}
-        for line in f:
-            parts = line.strip().split("\t")
-            if len(parts) >= 3:
-                tel_sentences[parts[0]] = parts[2]
-    print(f"  Telugu sentences: {len(tel_sentences)}")
-    
-    # Extract English sentences
-    with bz2.open(eng_file, "rt", encoding="utf-8") as f:
-        eng_sentences = {}
+    # Cleanup large files
+    print("\nCleaning up temporary files...")
+    tel_file.unlink(missing_ok=True)
+    eng_file.unlink(missing_ok=True)
+    links_archive.unlink(missing_ok=True)
+
+
+def _tatoeba_rows(data_file) -> Iterator[Tuple[str, str]]:
+    """Stream (sentence id, text) from a Tatoeba sentences export"""
+    with data_file.open_text() as f:
         for line in f:
-            parts = line.strip().split("\t")
+            parts = line.rstrip("\r\n").split("\t")
             if len(parts) >= 3:
-                eng_sentences[parts[0]] = parts[2]
-    print(f"  English sentences: {len(eng_sentences)}")
+                yield parts[0], parts[2].strip()
+
+
+def extract_tatoeba_pairs(tel_file, eng_file, links_file, output_file: Path) -> int:
+    """
+    Join Tatoeba exports into a Telugu-English pairs TSV, Telugu first.
     
-    # Extract links
-    with tarfile.open(tatoeba_dir / "links.tar.bz2", "r:bz2") as tar:
-        tar.extractall(tatoeba_dir)
+    Only the Telugu sentences and their links are held in memory: the
+    links are streamed once to find the English ids linked to a Telugu
+    sentence, then the English export is streamed once and each linked
+    sentence's pairs are written out as it is found. Memory grows with
+    the Telugu subset, not with the millions of English sentences.
     
-    # Find Telugu-English pairs
-    print("\nFinding Telugu-English pairs...")
-    pairs = []
-    links_file = tatoeba_dir / "links.csv"
+    Returns:
+        Number of pairs written
+    """
+    tel_sentences = dict(_tatoeba_rows(tel_file))
+    print(f"  Telugu sentences: {len(tel_sentences)}")
     
-    with open(links_file, "r", encoding="utf-8") as f:
+    # English id -> Telugu ids linked to it (links are listed in both directions)
+    wanted: Dict[str, List[str]] = {}
+    with links_file.open_text() as f:
         for line in f:
-            parts = line.strip().split("\t")
-            if len(parts) >= 2:
-                id1, id2 = parts[0], parts[1]
-                
-                # Check if this is a Telugu-English pair
-                if id1 in tel_sentences and id2 in eng_sentences:
-                    pairs.append((tel_sentences[id1], eng_sentences[id2]))
-                elif id2 in tel_sentences and id1 in eng_sentences:
-                    pairs.append((tel_sentences[id2], eng_sentences[id1]))
-    
-    print(f"  Found {len(pairs)} Telugu-English pairs")
-    
-    # Save pairs
-    output_file = tatoeba_dir / "telugu_english_pairs.tsv"
-    with open(output_file, "w", encoding="utf-8", newline="") as f:
+            parts = line.rstrip("\r\n").split("\t")
+            if len(parts) < 2:
+                continue
+            id1, id2 = parts[0], parts[1]
+            if id1 in tel_sentences and id2 not in tel_sentences:
+                tel_id, eng_id = id1, id2
+            elif id2 in tel_sentences and id1 not in tel_sentences:
+                tel_id, eng_id = id2, id1
+            else:
+                continue
+            tel_ids = wanted.setdefault(eng_id, [])
+            if tel_id not in tel_ids:
+                tel_ids.append(tel_id)
+    print(f"  Linked sentences in other languages: {len(wanted)}")
+    
+    # Written to a temporary file so an interrupted run leaves no partial output
+    partial_file = output_file.with_name(output_file.name + ".part")
+    count = 0
+    with open(partial_file, "w", encoding="utf-8", newline="") as f:
         writer = csv.writer(f, delimiter="\t")
         writer.writerow(["telugu", "english"])
-        for tel, eng in pairs:
-            writer.writerow([tel, eng])
-    
-    print(f"\nSaved to: {output_file}")
-    print(f"Total pairs: {len(pairs)}")
-    
-    # Cleanup large files
-    print("\nCleaning up temporary files...")
-    (tatoeba_dir / "tel_sentences.tsv.bz2").unlink(missing_ok=True)
-    (tatoeba_dir / "eng_sentences.tsv.bz2").unlink(missing_ok=True)
-    (tatoeba_dir / "links.tar.bz2").unlink(missing_ok=True)
-    (tatoeba_dir / "links.csv").unlink(missing_ok=True)
+        for eng_id, english in _tatoeba_rows(eng_file):
+            tel_ids = wanted.get(eng_id)
+            if not tel_ids or not english:
+                continue
+            for tel_id in tel_ids:
+                if tel_sentences[tel_id]:
+                    writer.writerow([tel_sentences[tel_id], english])
+                    count += 1
+    partial_file.replace(output_file)
+    return count
 
 
 def print_manual_instructions():
@@ -156,7 +225,7 @@ def print_manual_instructions():
 1. Tatoeba (Telugu-English sentences):
    - Go to: https://tatoeba.org/en/downloads
    - Download: sentences.tar.bz2 and links.tar.bz2
-   - Extract and filter for Telugu (tel) and English (eng)
+   - Place both archives in backend/data/tatoeba/ (no need to extract)
    - Or use their sentence search: https://tatoeba.org/en/sentences/search?from=tel&to=eng
 
 2. AI4Bharat Samanantar (Parallel corpus):
@@ -166,20 +235,22 @@ def print_manual_instructions():
 
 3. Dakshina (Transliteration):
    - Go to: https://github.com/google-research-datasets/dakshina
-   - Download Telugu data
+   - Download the dataset and extract the Telugu lexicons (te/lexicons/)
    - Place in: backend/data/dakshina/
 
 4. Aksharantar (Transliteration pairs):
    - Go to: https://github.com/AI4Bharat/IndicXlit
-   - Download Telugu transliteration data
+   - Download the Telugu archive tel.zip (no need to extract)
    - Place in: backend/data/aksharantar/
 """)
 
 
-async def download_samanantar_sample():
+async def download_samanantar_sample(manifest, force: bool = False):
     """
     Download a sample from AI4Bharat Samanantar.
     Full dataset requires manual download due to size.
+    Skipped when the manifest shows the same sample of the same dataset
+    revision is already on disk.
     """
     print("=== AI4Bharat Samanantar ===")
     
@@ -250,18 +321,23 @@ License: CC0 (Public Domain)
     readme.write_text(readme_content)
     print(f"Created: {readme}")
     
+    # Get first 5000 samples
+    sample_file = samanantar_dir / "samanantar_te_en.tsv"
+    max_samples = 5000
+    inputs = samanantar_sample_inputs(max_samples)
+    if not force and inputs["revision"] and manifest.is_current(SAMANANTAR_SAMPLE_STEP, inputs):
+        print(f"Samanantar revision {inputs['revision'][:12]} unchanged; keeping {sample_file}")
+        return
+    
     # Try to create a small sample using HuggingFace datasets
     try:
         print("\nAttempting to download sample via HuggingFace datasets...")
         from datasets import load_dataset
         
         print("Loading dataset (this may take a few minutes)...")
-        ds = load_dataset('ai4bharat/samanantar', 'te', split='train', streaming=True)
+        ds = load_dataset(SAMANANTAR_DATASET, 'te', split='train', streaming=True)
         
-        # Get first 5000 samples
-        sample_file = samanantar_dir / "samanantar_te_en.tsv"
         count = 0
-        max_samples = 5000
         
         with open(sample_file, "w", encoding="utf-8") as f:
             f.write("english\ttelugu\n")
@@ -277,6 +353,8 @@ License: CC0 (Public Domain)
                     print(f"  Downloaded {count} samples...")
         
         print(f"\nSaved {count} samples to: {sample_file}")
+        if inputs["revision"]:
+            manifest.record_step(SAMANANTAR_SAMPLE_STEP, inputs, [sample_file])
         
     except ImportError:
         print("\nNote: Install 'datasets' package for automatic download:")
@@ -417,16 +495,29 @@ async def main():
         choices=["tatoeba", "samanantar", "sample", "all"],
         help="Data source to download",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=3,
+        help="Files downloaded at the same time",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Redo every step, even those the data manifest shows are up to date",
+    )
     
     args = parser.parse_args()
     
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+    from app.data.manifest import DataManifest
+    manifest = DataManifest(DATA_DIR / "manifest.json")
     
     if args.source == "tatoeba" or args.source == "all":
-        await download_tatoeba()
+        await download_tatoeba(manifest, concurrency=args.concurrency, force=args.force)
     
     if args.source == "samanantar" or args.source == "all":
-        await download_samanantar_sample()
+        await download_samanantar_sample(manifest, force=args.force)
     
     if args.source == "sample" or args.source == "all":
         await create_expanded_sample()
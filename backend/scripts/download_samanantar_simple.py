@@ -1,11 +1,19 @@
 """
 Simple Samanantar downloader without heavy dependencies.
 Downloads directly from HuggingFace using requests.
+
+The sample is recorded in data/manifest.json; re-running with the same
+size is a no-op until the dataset gets a new revision (pass --force to
+download anyway).
 """
 import requests
 import json
+import sys
 from pathlib import Path
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 DATA_DIR = Path(__file__).parent.parent / "data" / "samanantar"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -15,11 +23,20 @@ DATASET = "ai4bharat/samanantar"
 CONFIG = "te"
 SPLIT = "train"
 
-def download_samanantar(max_items=5000):
-    """Download Samanantar data via HuggingFace API"""
-    print(f"Downloading {max_items} Telugu-English sentence pairs from Samanantar...")
+def download_samanantar(max_items=5000, force=False):
+    """Download Samanantar data via HuggingFace API, unless the manifest shows it is current"""
+    from app.data.manifest import DataManifest
+    from scripts.download_data import SAMANANTAR_SAMPLE_STEP, samanantar_sample_inputs
     
     output_file = DATA_DIR / "samanantar_te_en.tsv"
+    manifest = DataManifest(DATA_DIR.parent / "manifest.json")
+    inputs = samanantar_sample_inputs(max_items)
+    if not force and inputs["revision"] and manifest.is_current(SAMANANTAR_SAMPLE_STEP, inputs):
+        print(f"✓ Samanantar revision {inputs['revision'][:12]} unchanged; keeping {output_file}")
+        return 0
+    
+    print(f"Downloading {max_items} Telugu-English sentence pairs from Samanantar...")
+    failed = False
     
     with open(output_file, "w", encoding="utf-8") as f:
         f.write("english\ttelugu\n")
@@ -67,20 +84,25 @@ def download_samanantar(max_items=5000):
                 
             except Exception as e:
                 print(f"\nError downloading batch at offset {offset}: {e}")
+                failed = True
                 break
     
     print(f"\n✓ Successfully downloaded {total_downloaded} sentence pairs")
     print(f"✓ Saved to: {output_file}")
+    # An incomplete sample is downloaded again next time
+    if not failed and inputs["revision"]:
+        manifest.record_step(SAMANANTAR_SAMPLE_STEP, inputs, [output_file])
     return total_downloaded
 
 if __name__ == "__main__":
-    import sys
+    force = "--force" in sys.argv
+    positional = [arg for arg in sys.argv[1:] if arg != "--force"]
     
     max_items = 5000
-    if len(sys.argv) > 1:
-        max_items = int(sys.argv[1])
+    if positional:
+        max_items = int(positional[0])
     
-    count = download_samanantar(max_items)
+    count = download_samanantar(max_items, force=force)
     
     if count > 0:
         print("\nTo preview the data:")
@@ -4,8 +4,16 @@ CLI script for ingesting Telugu learning content.
 Usage:
     python -m scripts.ingest_data --source tatoeba --path ./data/tatoeba
     python -m scripts.ingest_data --source samanantar --path ./data/samanantar --max-items 10000
+    python -m scripts.ingest_data --source samanantar --path ./data/samanantar --max-items 10000 --sample stratified --seed 7
     python -m scripts.ingest_data --source custom --path ./data/custom --name "My Content"
     python -m scripts.ingest_data --source custom --path ./data/sample --dry-run
+    python -m scripts.ingest_data --source samanantar --path ./data/samanantar --resume
+    python -m scripts.ingest_data --source custom --path ./data/custom --delta --delete-missing
+    python -m scripts.ingest_data --source all --path ./data --stats-file ./ingest_stats.json
+    python -m scripts.ingest_data --source cache --path ./data/cache/samanantar.parquet
+    python -m scripts.ingest_data --source dakshina --path ./data/dakshina
+    python -m scripts.ingest_data --source indiccorp --path ./data/indiccorp --max-items 50000 --parse-workers 8
+    python -m scripts.ingest_data --source samanantar --path ./data/samanantar --transliterate
 """
 import asyncio
 import argparse
@@ -16,20 +24,48 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
+# Default output directory of scripts/compile_corpus.py
+CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+
+
+def source_dirs(data_path: Path) -> list:
+    """
+    Subdirectories of data_path to ingest with --source all. Hidden
+    directories and the ones holding generated files (run state, lexicon,
+    transliteration index, corpus caches) are skipped.
+    """
+    from app.core.config import settings
+    
+    generated = {
+        Path(settings.ingest_state_dir).resolve(),
+        Path(settings.difficulty_lexicon_path).resolve().parent,
+        Path(settings.transliteration_index_path).resolve(),
+        Path(settings.transliteration_index_path).resolve().parent,
+        CACHE_DIR.resolve(),
+    }
+    return [
+        subdir
+        for subdir in sorted(data_path.iterdir())
+        if subdir.is_dir()
+        and not subdir.name.startswith(".")
+        and subdir.resolve() not in generated
+    ]
+
+
 async def main():
     parser = argparse.ArgumentParser(description="Ingest Telugu learning content")
     parser.add_argument(
         "--source",
         type=str,
         required=True,
-        choices=["tatoeba", "samanantar", "custom", "all"],
+        choices=["tatoeba", "samanantar", "dakshina", "aksharantar", "indiccorp", "custom", "cache", "all"],
         help="Data source type",
     )
     parser.add_argument(
         "--path",
         type=str,
         required=True,
-        help="Path to data directory",
+        help="Path to data directory (or .parquet file for --source cache)",
     )
     parser.add_argument(
         "--name",
@@ -47,7 +83,98 @@ async def main():
         "--max-items",
         type=int,
         default=None,
-        help="Maximum items to ingest (useful for large datasets like Samanantar)",
+        help="Maximum items to ingest (useful for large datasets like Samanantar and Aksharantar)",
+    )
+    parser.add_argument(
+        "--sample",
+        type=str,
+        default=None,
+        choices=["head", "reservoir", "stratified"],
+        help="How --max-items are chosen: first items, uniform, or by difficulty and domain",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for --sample reservoir/stratified",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="Processes for parsing large corpora in parallel (0 = sequential)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Items per embedding/upsert batch",
+    )
+    parser.add_argument(
+        "--embed-workers",
+        type=int,
+        default=None,
+        help="Concurrent embedding batches per source",
+    )
+    parser.add_argument(
+        "--upsert-workers",
+        type=int,
+        default=None,
+        help="Concurrent vector DB uploads per source",
+    )
+    parser.add_argument(
+        "--max-concurrent-sources",
+        type=int,
+        default=None,
+        help="Sources ingested at the same time with --source all",
+    )
+    parser.add_argument(
+        "--embed-budget",
+        type=int,
+        default=None,
+        help="Concurrent embedding calls shared by all sources",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue each source from its last checkpoint instead of starting over",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Only embed and upload items that are new or changed since the last run",
+    )
+    parser.add_argument(
+        "--delete-missing",
+        action="store_true",
+        help="Delete previously ingested items that are no longer in the source",
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Drop near-duplicate sentences across all sources before embedding",
+    )
+    parser.add_argument(
+        "--quality-filter",
+        action="store_true",
+        help="Drop wrong-script, misaligned or mostly-numeric pairs before embedding",
+    )
+    parser.add_argument(
+        "--transliterate",
+        action="store_true",
+        help="Fill in missing transliterations from the transliteration index",
+    )
+    parser.add_argument(
+        "--stats-file",
+        type=str,
+        default=None,
+        help="Write live and final throughput stats as JSON to this file",
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=2.0,
+        help="Seconds between progress line updates (0 to disable)",
     )
     parser.add_argument(
         "--dry-run",
@@ -73,6 +200,10 @@ async def dry_run(args, data_path: Path):
     from app.data.loaders.custom import CustomLoader
     from app.data.loaders.tatoeba import TatoebaLoader
     from app.data.loaders.samanantar import SamanantatLoader
+    from app.data.loaders.dakshina import DakshinaLoader
+    from app.data.loaders.aksharantar import AksharantarLoader
+    from app.data.loaders.indiccorp import IndicCorpLoader
+    from app.data.corpus_cache import CorpusCacheLoader
     
     print(f"=== DRY RUN: Previewing content from {data_path} ===\n")
     
@@ -81,9 +212,22 @@ async def dry_run(args, data_path: Path):
     elif args.source == "tatoeba":
         loader = TatoebaLoader(data_path)
     elif args.source == "samanantar":
-        loader = SamanantatLoader(data_path, max_items=args.max_items or 100)
+        loader = SamanantatLoader(
+            data_path,
+            max_items=args.max_items or 100,
+            sampling=args.sample or "head",
+            seed=args.seed,
+        )
+    elif args.source == "dakshina":
+        loader = DakshinaLoader(data_path, max_items=args.max_items)
+    elif args.source == "aksharantar":
+        loader = AksharantarLoader(data_path, max_items=args.max_items or 100)
+    elif args.source == "indiccorp":
+        loader = IndicCorpLoader(data_path, max_items=args.max_items or 100)
+    elif args.source == "cache":
+        loader = CorpusCacheLoader(data_path)
     else:
-        print("Dry run only supports 'custom', 'tatoeba', and 'samanantar' sources")
+        print("Dry run does not support --source all")
         return
     
     if not loader.validate_source():
@@ -106,6 +250,17 @@ async def dry_run(args, data_path: Path):
     print("Make sure Qdrant is running: docker-compose up -d qdrant")
 
 
+async def report_progress(service, interval: float, stats_file: Path = None):
+    """Periodically print a progress line and refresh the stats file"""
+    if interval <= 0:
+        return
+    while True:
+        await asyncio.sleep(interval)
+        print(f"\r{service.metrics.progress_line()}", end="", flush=True)
+        if stats_file:
+            service.metrics.write_json(stats_file)
+
+
 async def full_ingest(args, data_path: Path):
     """Full ingestion with vector DB storage"""
     from app.data.ingestion import ingestion_service
@@ -126,12 +281,38 @@ async def full_ingest(args, data_path: Path):
     print("Loading embedding model (this may take a while on first run)...")
     await embedding_service.initialize()
     
+    ingestion_service.configure(
+        batch_size=args.batch_size,
+        embed_workers=args.embed_workers,
+        upsert_workers=args.upsert_workers,
+        max_concurrent_sources=args.max_concurrent_sources,
+        embed_budget=args.embed_budget,
+    )
+    
     print(f"Adding {args.source} source from {data_path}...")
     
     if args.source == "tatoeba":
         success = ingestion_service.add_tatoeba_source(data_path)
     elif args.source == "samanantar":
-        success = ingestion_service.add_samanantar_source(data_path, max_items=args.max_items)
+        success = ingestion_service.add_samanantar_source(
+            data_path,
+            max_items=args.max_items,
+            parse_workers=args.parse_workers,
+            sampling=args.sample,
+            seed=args.seed,
+        )
+    elif args.source == "dakshina":
+        success = ingestion_service.add_dakshina_source(data_path, max_items=args.max_items)
+    elif args.source == "aksharantar":
+        success = ingestion_service.add_aksharantar_source(data_path, max_items=args.max_items)
+    elif args.source == "indiccorp":
+        success = ingestion_service.add_indiccorp_source(
+            data_path,
+            max_items=args.max_items,
+            parse_workers=args.parse_workers,
+        )
+    elif args.source == "cache":
+        success = ingestion_service.add_corpus_cache_source(data_path)
     elif args.source == "custom":
         success = ingestion_service.add_custom_source(
             data_path,
@@ -141,32 +322,96 @@ async def full_ingest(args, data_path: Path):
     else:
         # Add all sources from subdirectories
         success = True
-        for subdir in data_path.iterdir():
-            if subdir.is_dir():
-                if subdir.name == "tatoeba":
-                    ingestion_service.add_tatoeba_source(subdir)
-                elif subdir.name == "samanantar":
-                    ingestion_service.add_samanantar_source(subdir, max_items=args.max_items)
-                else:
-                    ingestion_service.add_custom_source(subdir, source_name=subdir.name)
+        for subdir in source_dirs(data_path):
+            if subdir.name == "tatoeba":
+                ingestion_service.add_tatoeba_source(subdir)
+            elif subdir.name == "samanantar":
+                ingestion_service.add_samanantar_source(
+                    subdir,
+                    max_items=args.max_items,
+                    parse_workers=args.parse_workers,
+                    sampling=args.sample,
+                    seed=args.seed,
+                )
+            elif subdir.name == "dakshina":
+                ingestion_service.add_dakshina_source(subdir, max_items=args.max_items)
+            elif subdir.name == "aksharantar":
+                ingestion_service.add_aksharantar_source(subdir, max_items=args.max_items)
+            elif subdir.name == "indiccorp":
+                ingestion_service.add_indiccorp_source(
+                    subdir,
+                    max_items=args.max_items,
+                    parse_workers=args.parse_workers,
+                )
+            else:
+                ingestion_service.add_custom_source(subdir, source_name=subdir.name)
     
     if not success and args.source != "all":
         print("Error: Failed to add data source")
         sys.exit(1)
     
     print("Starting ingestion...")
-    stats = await ingestion_service.ingest_all()
+    stats_file = Path(args.stats_file) if args.stats_file else None
+    reporter = asyncio.create_task(
+        report_progress(ingestion_service, args.progress_interval, stats_file)
+    )
+    try:
+        stats = await ingestion_service.ingest_all(
+            resume=args.resume,
+            delta=args.delta,
+            delete_missing=args.delete_missing,
+            dedup=args.dedup,
+            quality_filter=args.quality_filter,
+            transliterate=args.transliterate,
+        )
+    finally:
+        reporter.cancel()
+        print()
+    
+    if stats_file:
+        ingestion_service.metrics.write_json(stats_file, extra={"result": stats})
+        print(f"Stats written to {stats_file}")
     
     print("\n=== Ingestion Complete ===")
     print(f"Total processed: {stats['total_processed']}")
     print(f"Total stored: {stats['total_stored']}")
     print(f"Errors: {stats['errors']}")
+    if args.delete_missing:
+        print(f"Total deleted: {stats['total_deleted']}")
+    if args.dedup:
+        print(f"Near-duplicates removed: {stats['total_duplicates']}")
+    if args.quality_filter:
+        print(f"Low-quality pairs rejected: {stats['total_rejected']}")
+        for reason, count in stats["rejected"].items():
+            print(f"  {reason}: {count}")
+    if args.transliterate:
+        print(f"Transliterations filled in: {stats['total_transliterated']}")
+    if stats["dead_letter_file"]:
+        print(f"Failed items written to: {stats['dead_letter_file']}")
+        print(f"  Retry with: python -m scripts.retry_dead_letter {stats['dead_letter_file']}")
+    if stats["failed_sources"]:
+        print(f"Failed sources: {', '.join(stats['failed_sources'])}")
     
-    for source, source_stats in stats["sources"].items():
-        print(f"\n{source}:")
+    for key, source_stats in stats["sources"].items():
+        print(f"\n{key}:")
         print(f"  Processed: {source_stats['processed']}")
         print(f"  Stored: {source_stats['stored']}")
         print(f"  Errors: {source_stats['errors']}")
+        print(f"  Time: {source_stats['elapsed_seconds']}s")
+        if args.delta:
+            print(f"  Added: {source_stats['added']}")
+            print(f"  Updated: {source_stats['updated']}")
+            print(f"  Unchanged: {source_stats['unchanged']}")
+        if args.delete_missing:
+            print(f"  Deleted: {source_stats['deleted']}")
+        if args.dedup:
+            print(f"  Near-duplicates: {source_stats['duplicates']}")
+        if args.quality_filter:
+            print(f"  Rejected: {sum(source_stats['rejected'].values())}")
+        if args.transliterate:
+            print(f"  Transliterated: {source_stats['transliterated']}")
+        if source_stats.get("resumed_from"):
+            print(f"  Resumed after: {source_stats['resumed_from']}")
     
     # Get collection info
     info = await vector_db.get_collection_info()
@@ -6,11 +6,13 @@ Usage:
     python -m scripts.reset_qdrant
 """
 import asyncio
+import shutil
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from app.core.config import settings
 from app.core.vector_db import vector_db
 
 
@@ -42,6 +44,12 @@ async def reset_collection():
     print(f"Collection '{vector_db.collection_name}' created successfully!")
     print(f"Dimensions: {vector_db.EMBEDDING_DIM}")
     
+    # Checkpoints and the content-hash index describe the old collection
+    state_dir = Path(settings.ingest_state_dir)
+    if state_dir.exists():
+        shutil.rmtree(state_dir)
+        print(f"Cleared ingestion state in {state_dir}")
+    
     await vector_db.disconnect()
 
 
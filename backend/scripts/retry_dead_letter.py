@@ -0,0 +1,72 @@
+"""
+Retry items that failed during an earlier ingestion run.
+
+Failed items are written to data/.ingest/dead_letter/ingest-<timestamp>.jsonl.
+This re-ingests just those items, using small batches so one bad item
+doesn't take a whole batch down with it again. Items that still fail are
+written to a new dead-letter file. Retried items are recorded in the
+content index under the source they originally failed in, so later delta
+and --delete-missing runs of that source see them as stored.
+
+Usage:
+    python -m scripts.retry_dead_letter data/.ingest/dead_letter/ingest-20240101T120000-1a2b3c.jsonl
+    python -m scripts.retry_dead_letter <file> --batch-size 5
+"""
+import asyncio
+import argparse
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Retry failed ingestion items")
+    parser.add_argument(
+        "files",
+        nargs="+",
+        help="Dead-letter JSONL file(s) to retry",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10,
+        help="Items per embedding/upsert batch (default: 10)",
+    )
+    args = parser.parse_args()
+
+    from app.data.ingestion import ingestion_service
+    from app.core.vector_db import vector_db
+    from app.services.embedding import embedding_service
+
+    try:
+        await vector_db.connect()
+    except Exception as e:
+        print(f"Error: Could not connect to Qdrant: {e}")
+        sys.exit(1)
+
+    print("Loading embedding model...")
+    await embedding_service.initialize()
+
+    ingestion_service.configure(batch_size=args.batch_size)
+    for filename in args.files:
+        if not ingestion_service.add_dead_letter_source(Path(filename)):
+            print(f"Error: Not a dead-letter file: {filename}")
+            sys.exit(1)
+
+    print(f"Retrying with batches of {args.batch_size}...")
+    stats = await ingestion_service.ingest_all()
+
+    print("\n=== Retry Complete ===")
+    print(f"Retried: {stats['total_processed']}")
+    print(f"Stored: {stats['total_stored']}")
+    print(f"Still failing: {stats['errors']}")
+    if stats["dead_letter_file"]:
+        print(f"Remaining failures written to: {stats['dead_letter_file']}")
+
+    await vector_db.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+"""
+Tests for the Parquet corpus cache.
+"""
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from app.data import corpus_cache
+from app.data.corpus_cache import CorpusCacheLoader, compile_corpus
+from app.data.loaders.custom import CustomLoader
+
+
+async def collect(loader):
+    return [content async for content in loader.load()]
+
+
+@pytest.mark.asyncio
+async def test_compiled_cache_round_trips(tmp_path):
+    """Content read from the cache matches what the source loader produced"""
+    source_dir = tmp_path / "custom"
+    source_dir.mkdir()
+    (source_dir / "items.csv").write_text(
+        "telugu,english,type,difficulty,domains\n"
+        "నమస్కారం,Hello,vocabulary,beginner,general\n"
+        "ఈ సినిమా చాలా బాగుంది,This movie is very good,sentence,intermediate,\"movies,general\"\n",
+        encoding="utf-8",
+    )
+    source = CustomLoader(source_dir, "My Content", "CC0")
+    cache_path = tmp_path / "cache" / "custom.parquet"
+
+    rows = await compile_corpus(source, cache_path)
+    cache = CorpusCacheLoader(cache_path)
+
+    assert rows == 2
+    assert cache.validate_source()
+    assert cache.source_name == "My Content"
+    assert cache.estimate_total() == 2
+    original = await collect(source)
+    cached = await collect(cache)
+    assert [c.model_dump() for c in cached] == [c.model_dump() for c in original]
+
+
+@pytest.mark.asyncio
+async def test_outdated_cache_is_rejected(tmp_path, monkeypatch):
+    """A cache written with another schema version fails validation"""
+    source_dir = tmp_path / "custom"
+    source_dir.mkdir()
+    (source_dir / "items.csv").write_text("telugu,english\nనమస్కారం,Hello\n", encoding="utf-8")
+    cache_path = tmp_path / "custom.parquet"
+    await compile_corpus(CustomLoader(source_dir), cache_path)
+
+    monkeypatch.setattr(corpus_cache, "SCHEMA_VERSION", corpus_cache.SCHEMA_VERSION + 1)
+
+    assert not CorpusCacheLoader(cache_path).validate_source()
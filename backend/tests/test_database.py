@@ -0,0 +1,226 @@
+"""
+Tests for connection pool sizing and acquisition metrics (no server needed).
+"""
+import asyncio
+
+import asyncpg
+import pytest
+
+from app.core import database
+from app.core.database import Database, PoolMetrics, database_dsn, pool_max_size
+
+
+class FakePool:
+    """Stands in for asyncpg.Pool with a fixed number of connections"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.free = asyncio.Queue()
+        for i in range(size):
+            self.free.put_nowait(f"conn-{i}")
+
+    async def acquire(self, timeout=None):
+        return await asyncio.wait_for(self.free.get(), timeout)
+
+    async def release(self, conn):
+        self.free.put_nowait(conn)
+
+    def is_closing(self):
+        return False
+
+    def get_size(self):
+        return self.size
+
+    def get_idle_size(self):
+        return self.free.qsize()
+
+    def get_min_size(self):
+        return self.size
+
+    def get_max_size(self):
+        return self.size
+
+
+def connected(size: int) -> Database:
+    db = Database()
+    db.pool = FakePool(size)
+    return db
+
+
+async def _hold(db: Database):
+    async with db.acquire():
+        pass
+
+
+@pytest.mark.asyncio
+async def test_acquire_tracks_acquired_and_waiters():
+    """A caller queued behind a busy pool shows up as a waiter until released"""
+    db = connected(1)
+
+    async with db.acquire():
+        waiting = asyncio.create_task(_hold(db))
+        await asyncio.sleep(0.02)
+        stats = db.pool_stats()
+        assert stats["acquired"] == 1 and stats["waiters"] == 1 and stats["idle"] == 0
+
+    await waiting
+    stats = db.pool_stats()
+    assert stats["acquired"] == 0 and stats["waiters"] == 0 and stats["idle"] == 1
+    assert stats["acquisitions"] == 2
+    histogram = stats["acquire_wait"]["histogram"]
+    assert histogram["le_inf"] == 2
+    # The queued caller waited at least 10 ms; the first one didn't
+    assert histogram["le_1ms"] == 1 and histogram["le_5ms"] == 1
+    assert stats["acquire_wait"]["max_ms"] >= 10
+
+
+@pytest.mark.asyncio
+async def test_acquire_timeout_is_counted():
+    """Timing out on an exhausted pool raises and is recorded"""
+    db = connected(1)
+
+    async with db.acquire():
+        with pytest.raises(asyncio.TimeoutError):
+            async with db.acquire(timeout=0.01):
+                pass
+
+    stats = db.pool_stats()
+    assert stats["acquire_timeouts"] == 1 and stats["waiters"] == 0
+    assert stats["acquisitions"] == 1
+
+
+def test_wait_quantile_reports_bucket_bound():
+    metrics = PoolMetrics(buckets=[0.01, 0.1])
+    for seconds in [0.001] * 9 + [0.05]:
+        metrics.observe_wait(seconds)
+
+    assert metrics.wait_quantile(0.5) == 0.01
+    assert metrics.wait_quantile(0.95) == 0.1
+    metrics.observe_wait(1.0)
+    assert metrics.wait_quantile(1.0) is None
+
+
+def test_pool_size_is_capped_by_connection_budget(monkeypatch):
+    """Workers share the server's connection budget"""
+    monkeypatch.setattr(database.settings, "db_pool_max_size", 20)
+    monkeypatch.setattr(database.settings, "db_connection_budget", None)
+    assert pool_max_size() == 20
+
+    monkeypatch.setattr(database.settings, "db_connection_budget", 90)
+    monkeypatch.setattr(database.settings, "web_concurrency", 8)
+    assert pool_max_size() == 11
+
+    monkeypatch.setattr(database.settings, "web_concurrency", 200)
+    assert pool_max_size() == 1
+
+
+def test_dsn_drops_sqlalchemy_driver():
+    assert database_dsn("postgresql+asyncpg://u:p@db:5433/x") == "postgresql://u:p@db:5433/x"
+
+
+class FakeStatement:
+    def __init__(self, conn, query):
+        self.conn = conn
+        self.query = query
+
+    async def fetchrow(self, *args):
+        self.conn.calls.append(("prepared", self.query, args))
+        return {"query": self.query}
+
+
+class FakeConnection:
+    """Records literal and prepared calls; looks like a PreparedConnection"""
+
+    def __init__(self):
+        self.prepared = {}
+        self.calls = []
+
+    async def prepare(self, query):
+        self.calls.append(("prepare", query))
+        if "missing_table" in query:
+            raise asyncpg.UndefinedTableError('relation "missing_table" does not exist')
+        return FakeStatement(self, query)
+
+    async def fetchrow(self, query, *args):
+        self.calls.append(("literal", query, args))
+        return {"query": query}
+
+
+def registry_db(conn) -> Database:
+    db = Database()
+    db.pool = FakePool(0)
+    db.pool.free.put_nowait(conn)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_registered_queries_prepared_at_connection_init(monkeypatch):
+    """The init hook prepares every registered query; calls by name reuse them"""
+    monkeypatch.setattr(database.settings, "db_prepared_statements", True)
+    conn = FakeConnection()
+    db = registry_db(conn)
+    name = db.register("get-item", "SELECT * FROM items WHERE id = $1")
+
+    await db._prepare_registered(conn)
+    assert await db.fetchrow_named(name, 7) == {"query": "SELECT * FROM items WHERE id = $1"}
+    await db.fetchrow_named(name, 8)
+
+    assert [call[0] for call in conn.calls] == ["prepare", "prepared", "prepared"]
+    assert conn.calls[-1][2] == (8,)
+
+
+@pytest.mark.asyncio
+async def test_late_registration_is_prepared_on_first_use(monkeypatch):
+    monkeypatch.setattr(database.settings, "db_prepared_statements", True)
+    conn = FakeConnection()
+    db = registry_db(conn)
+    await db._prepare_registered(conn)
+
+    db.register("late", "SELECT 1")
+    await db.fetchrow_named("late")
+    await db.fetchrow_named("late")
+
+    assert [call[0] for call in conn.calls] == ["prepare", "prepared", "prepared"]
+
+
+@pytest.mark.asyncio
+async def test_disabled_registry_sends_literal_sql(monkeypatch):
+    """With prepared statements off (pgbouncer) nothing is prepared"""
+    monkeypatch.setattr(database.settings, "db_prepared_statements", False)
+    conn = FakeConnection()
+    db = registry_db(conn)
+    db.register("get-item", "SELECT * FROM items WHERE id = $1")
+
+    await db._prepare_registered(conn)
+    await db.fetchrow_named("get-item", 7)
+
+    assert conn.calls == [("literal", "SELECT * FROM items WHERE id = $1", (7,))]
+
+
+@pytest.mark.asyncio
+async def test_invalid_query_does_not_break_connection_init(monkeypatch, caplog):
+    """One query that can't be prepared is skipped; the rest are prepared and work"""
+    monkeypatch.setattr(database.settings, "db_prepared_statements", True)
+    conn = FakeConnection()
+    db = registry_db(conn)
+    db.register("broken", "SELECT * FROM missing_table WHERE id = $1")
+    db.register("get-item", "SELECT * FROM items WHERE id = $1")
+
+    with caplog.at_level("WARNING"):
+        await db._prepare_registered(conn)
+
+    assert list(conn.prepared) == ["get-item"]
+    assert "'broken'" in caplog.text
+    assert await db.fetchrow_named("get-item", 7) == {"query": "SELECT * FROM items WHERE id = $1"}
+    # The broken query is retried lazily and its error surfaces to the caller
+    with pytest.raises(asyncpg.UndefinedTableError):
+        await db.fetchrow_named("broken", 1)
+    assert db.pool_stats()["acquired"] == 0
+
+
+def test_conflicting_registration_is_rejected():
+    db = Database()
+    assert db.register("q", "SELECT 1") == "q"
+    assert db.register("q", "SELECT 1") == "q"
+    with pytest.raises(ValueError):
+        db.register("q", "SELECT 2")
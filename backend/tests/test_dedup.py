@@ -0,0 +1,54 @@
+"""
+Tests for MinHash near-duplicate filtering.
+"""
+from app.data.dedup import MinHashDeduplicator
+from app.data.models import ProcessedContent, ContentType
+
+
+def make_item(telugu: str, english: str) -> ProcessedContent:
+    return ProcessedContent(
+        id=telugu,
+        content_type=ContentType.SENTENCE,
+        text=f"{telugu} | {english}",
+        telugu_text=telugu,
+        english_text=english,
+        source="Test",
+        license="CC0",
+    )
+
+
+def test_near_duplicates_are_removed():
+    """Punctuation and case variants of a sentence are dropped"""
+    dedup = MinHashDeduplicator()
+    items = [
+        make_item("నేను బస్సులో ఆఫీసుకు వెళ్తాను", "I go to office by bus"),
+        make_item("నేను  బస్సులో ఆఫీసుకు వెళ్తాను.", "I go to office by bus."),
+        make_item("ఈ సినిమా చాలా బాగుంది", "This movie is very good"),
+    ]
+
+    kept = dedup.filter(items)
+
+    assert [item.english_text for item in kept] == [
+        "I go to office by bus",
+        "This movie is very good",
+    ]
+    assert dedup.removed == 1
+
+
+def test_duplicates_detected_across_batches():
+    """Items from a later batch are compared with everything remembered"""
+    dedup = MinHashDeduplicator()
+    dedup.filter([make_item("నేను ఉదయం ఆరు గంటలకు లేస్తాను", "I wake up at 6 AM every day")])
+
+    kept = dedup.filter([make_item("నేను ఉదయం ఆరు గంటలకు లేస్తాను", "I wake up at 6 AM every day.")])
+
+    assert kept == []
+
+
+def test_memory_is_bounded():
+    """Only max_entries signatures are remembered"""
+    dedup = MinHashDeduplicator(max_entries=10)
+    dedup.filter([make_item(f"వాక్యం సంఖ్య {i}", f"sentence number {i * 7919}") for i in range(50)])
+
+    assert len(dedup._entries) == 10
+    assert len(dedup._buckets) <= 10 * dedup.bands
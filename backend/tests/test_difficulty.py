@@ -0,0 +1,62 @@
+"""
+Tests for the frequency-lexicon difficulty scorer.
+"""
+import numpy as np
+
+from app.data.difficulty import DifficultyScorer, DifficultyThresholds, Lexicon, analyze_texts
+from app.data.models import DifficultyLevel
+
+
+def test_aksharas_conjuncts_and_words():
+    """Conjunct clusters are one akshara; words never join across texts"""
+    features = analyze_texts(["అమ్మ ప్రయాణం", "ఇది", "abc 12", "స్త్రీ"])
+
+    assert features.aksharas.tolist() == [5, 2, 0, 1]
+    assert features.conjuncts.tolist() == [2, 0, 0, 2]
+    assert features.words.tolist() == [2, 1, 0, 1]
+    assert features.word_owners.tolist() == [0, 0, 1, 3]
+
+
+def test_word_hashes_are_position_independent():
+    """The same word hashes identically wherever it appears in a batch"""
+    first = analyze_texts(["అమ్మ"]).word_hashes
+    batch = analyze_texts(["నాన్న అమ్మ", "ఇంటికి అమ్మ వచ్చింది"]).word_hashes
+
+    assert batch[1] == first[0]
+    assert batch[3] == first[0]
+    assert len(set(batch.tolist())) == 4
+
+
+def test_lexicon_counts_and_round_trip(tmp_path):
+    """Counts merge across batches and survive save/load"""
+    lexicon = Lexicon.build(["అమ్మ నాన్న", "అమ్మ", "అమ్మ ఇల్లు"], batch_size=1)
+    path = tmp_path / "lexicon.npz"
+    lexicon.save(path)
+    loaded = Lexicon.load(path)
+
+    words = analyze_texts(["అమ్మ నాన్న ఇల్లు పాట"]).word_hashes
+    assert loaded.lookup(words).tolist() == [3, 1, 1, 0]
+    assert np.all(np.diff(loaded.hashes.astype(np.float64)) > 0)
+    assert loaded.common_threshold(1) == 3
+
+
+def test_rare_words_raise_difficulty():
+    """With a lexicon, a sentence of rare words scores above one of common words"""
+    lexicon = Lexicon.build(["నేను ఇంటికి వెళ్తాను"] * 50 + ["అనివార్యంగా"])
+    scorer = DifficultyScorer(lexicon, DifficultyThresholds(common_words=3))
+
+    common, rare = scorer.scores(["నేను ఇంటికి వెళ్తాను", "అనివార్యంగా సంక్లిష్టమైన"])
+    assert rare > common
+    assert scorer.features(["నేను ఇంటికి"])["rare_ratio"].tolist() == [0.0]
+
+
+def test_levels_without_lexicon():
+    """Length and conjunct density alone separate short and long sentences"""
+    scorer = DifficultyScorer()
+    levels = scorer.score_batch([
+        "ఇది ఎంత?",
+        "ప్రభుత్వం రాష్ట్రంలోని అన్ని జిల్లాల్లో స్వచ్ఛ భారత్ కార్యక్రమాన్ని విస్తృతంగా నిర్వహించాలని నిర్ణయించింది",
+        "",
+    ])
+
+    assert levels == [DifficultyLevel.BEGINNER, DifficultyLevel.ADVANCED, DifficultyLevel.BEGINNER]
@@ -0,0 +1,52 @@
+"""
+Tests for the shared domain classifier.
+"""
+from app.data.domains import DomainClassifier
+
+
+def test_english_and_telugu_keywords():
+    """Both sides are tagged; Telugu stems match with suffixes attached"""
+    classifier = DomainClassifier()
+
+    assert classifier.classify("I go to office by bus") == ["office", "travel"]
+    assert classifier.classify("", "నేను బస్సులో వెళ్తాను") == ["travel"]
+    assert classifier.classify("We watched two movies", "") == ["movies"]
+    assert classifier.classify("The weather is nice", "వాతావరణం బాగుంది") == ["general"]
+
+
+def test_word_boundaries():
+    """Keywords inside other words don't match"""
+    classifier = DomainClassifier()
+
+    assert classifier.classify("His business is booming") == ["office"]
+    assert classifier.classify("Homework is due") == ["general"]
+
+
+def test_batch_matches_are_assigned_to_their_items():
+    """One pass over a batch maps every match back to the right pair"""
+    classifier = DomainClassifier()
+    pairs = [
+        ("My mother cooks", ""),
+        ("Nothing here", "ఏమీ లేదు"),
+        ("", "ఈ సినిమా బాగుంది"),
+        ("The train left the station", "రైలు వెళ్ళిపోయింది"),
+    ]
+
+    assert classifier.classify_batch(pairs) == [
+        ["family"],
+        ["general"],
+        ["movies"],
+        ["travel"],
+    ]
+
+
+def test_custom_taxonomy():
+    """A configured taxonomy replaces the built-in one"""
+    classifier = DomainClassifier(
+        {"food": {"en": ["rice", "curry"], "te": ["అన్నం"]}},
+        default="other",
+    )
+
+    assert classifier.classify("Rice and curry", "") == ["food"]
+    assert classifier.classify("", "అన్నం తిన్నావా?") == ["food"]
+    assert classifier.classify("I go to office") == ["other"]
@@ -0,0 +1,256 @@
+"""
+Tests for data downloads: resumable fetches against a local HTTP server,
+and Tatoeba pair extraction.
+"""
+import bz2
+import gzip
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from app.data.downloads import (
+    ChecksumError,
+    DownloadError,
+    DownloadSpec,
+    download_file,
+    download_files,
+)
+from app.data.readers import DataFile
+from scripts.download_data import extract_tatoeba_pairs
+
+
+class FileServer:
+    """Serves in-memory files with ETags and byte ranges, and can cut responses short"""
+
+    def __init__(self):
+        self.files = {}  # path -> bytes
+        self.drop_after = {}  # path -> bytes to send before closing, once
+        self.gzip = {}  # path -> "negotiate" (if the client accepts gzip) or "always"
+        self.requests = []  # (path, Range header, If-Range header)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.requests.append((self.path, self.headers.get("Range"), self.headers.get("If-Range")))
+                data = server.files.get(self.path)
+                if data is None:
+                    self.send_error(404)
+                    return
+                mode = server.gzip.get(self.path)
+                encoded = mode == "always" or (
+                    mode == "negotiate" and "gzip" in self.headers.get("Accept-Encoding", "")
+                )
+                if encoded:
+                    data = gzip.compress(data, mtime=0)
+                etag = f'"{hashlib.md5(data).hexdigest()}"'
+
+                start = 0
+                range_header = self.headers.get("Range")
+                if_range = self.headers.get("If-Range")
+                if range_header and (if_range is None or if_range == etag):
+                    start = int(range_header.split("=")[1].rstrip("-"))
+                    if start >= len(data):
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{len(data)}")
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+                else:
+                    self.send_response(200)
+                body = data[start:]
+                if encoded:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+
+                cut = server.drop_after.pop(self.path, None)
+                self.wfile.write(body if cut is None else body[:cut])
+                if cut is not None:
+                    self.close_connection = True
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.httpd.server_port}{path}"
+
+
+@pytest.fixture
+def server():
+    file_server = FileServer()
+    file_server.thread.start()
+    yield file_server
+    file_server.httpd.shutdown()
+    file_server.httpd.server_close()
+
+
+def payload(size, seed=0):
+    return bytes((i * 31 + seed) % 251 for i in range(size))
+
+
+@pytest.mark.asyncio
+async def test_download_streams_to_disk_and_verifies_checksum(server, tmp_path):
+    """The file is written in chunks, checked and moved into place"""
+    data = payload(300_000)
+    server.files["/big.bin"] = data
+    target = tmp_path / "big.bin"
+
+    async with httpx.AsyncClient() as client:
+        result = await download_file(
+            client,
+            DownloadSpec(server.url("/big.bin"), target, sha256=hashlib.sha256(data).hexdigest()),
+            chunk_bytes=4096,
+        )
+
+    assert target.read_bytes() == data
+    assert result.size == len(data) and not result.resumed
+    assert result.etag == f'"{hashlib.md5(data).hexdigest()}"'
+    assert not (tmp_path / "big.bin.part").exists()
+    assert not (tmp_path / "big.bin.part.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_resumes_with_range(server, tmp_path):
+    """A cut-off response is retried from where it stopped"""
+    data = payload(100_000)
+    server.files["/f.bin"] = data
+    server.drop_after["/f.bin"] = 40_000
+    target = tmp_path / "f.bin"
+
+    async with httpx.AsyncClient() as client:
+        result = await download_file(client, DownloadSpec(server.url("/f.bin"), target), backoff=0)
+
+    assert target.read_bytes() == data
+    assert result.resumed and result.downloaded_bytes == len(data) - 40_000
+    assert server.requests[1][1] == "bytes=40000-"
+    assert server.requests[1][2] == result.etag
+
+
+@pytest.mark.asyncio
+async def test_partial_file_from_earlier_run_is_resumed(server, tmp_path):
+    """A .part file left by an interrupted run is continued, not restarted"""
+    data = payload(50_000)
+    server.files["/f.bin"] = data
+    target = tmp_path / "f.bin"
+    (tmp_path / "f.bin.part").write_bytes(data[:20_000])
+    (tmp_path / "f.bin.part.json").write_text(
+        json.dumps({"url": server.url("/f.bin"), "etag": f'"{hashlib.md5(data).hexdigest()}"'})
+    )
+
+    async with httpx.AsyncClient() as client:
+        result = await download_file(
+            client, DownloadSpec(server.url("/f.bin"), target, sha256=hashlib.sha256(data).hexdigest())
+        )
+
+    assert target.read_bytes() == data
+    assert result.resumed and result.downloaded_bytes == 30_000
+
+
+@pytest.mark.asyncio
+async def test_changed_remote_file_restarts_download(server, tmp_path):
+    """If-Range fails for a stale ETag, so the new file is fetched whole"""
+    old, new = payload(30_000, seed=1), payload(30_000, seed=2)
+    server.files["/f.bin"] = new
+    target = tmp_path / "f.bin"
+    (tmp_path / "f.bin.part").write_bytes(old[:10_000])
+    (tmp_path / "f.bin.part.json").write_text(
+        json.dumps({"url": server.url("/f.bin"), "etag": f'"{hashlib.md5(old).hexdigest()}"'})
+    )
+
+    async with httpx.AsyncClient() as client:
+        result = await download_file(client, DownloadSpec(server.url("/f.bin"), target))
+
+    assert target.read_bytes() == new
+    assert not result.resumed
+
+
+@pytest.mark.asyncio
+async def test_checksum_mismatch_discards_download(server, tmp_path):
+    """A corrupt download raises and leaves nothing behind"""
+    server.files["/f.bin"] = payload(1000)
+    target = tmp_path / "f.bin"
+
+    async with httpx.AsyncClient() as client:
+        with pytest.raises(ChecksumError):
+            await download_file(client, DownloadSpec(server.url("/f.bin"), target, sha256="0" * 64))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_downloads_keep_finished_files(server, tmp_path):
+    """Files download side by side; one missing file doesn't discard the others"""
+    for i in range(4):
+        server.files[f"/{i}.bin"] = payload(20_000 + i, seed=i)
+    specs = [DownloadSpec(server.url(f"/{i}.bin"), tmp_path / f"{i}.bin") for i in range(4)]
+
+    results = await download_files(specs, concurrency=2)
+
+    assert [r.path.read_bytes() for r in results] == [server.files[f"/{i}.bin"] for i in range(4)]
+
+    with pytest.raises(DownloadError):
+        await download_files(specs + [DownloadSpec(server.url("/missing"), tmp_path / "missing")])
+    assert all(spec.path.exists() for spec in specs)
+
+
+@pytest.mark.asyncio
+async def test_downloads_keep_bytes_as_sent(server, tmp_path):
+    """Identity encoding is requested, and an encoded body is stored and resumed undecoded"""
+    data = payload(60_000)
+    server.files["/plain.csv"] = data
+    server.gzip["/plain.csv"] = "negotiate"
+    server.files["/forced.csv"] = data
+    server.gzip["/forced.csv"] = "always"
+    encoded = gzip.compress(data, mtime=0)
+    server.drop_after["/forced.csv"] = len(encoded) // 2
+
+    async with httpx.AsyncClient() as client:
+        plain = await download_file(client, DownloadSpec(server.url("/plain.csv"), tmp_path / "plain.csv"))
+        forced = await download_file(
+            client, DownloadSpec(server.url("/forced.csv"), tmp_path / "forced.csv"), backoff=0
+        )
+
+    assert (tmp_path / "plain.csv").read_bytes() == data
+    assert plain.sha256 == hashlib.sha256(data).hexdigest()
+    # A server that encodes anyway: the stored file is the body it sent, spliced correctly
+    assert (tmp_path / "forced.csv").read_bytes() == encoded
+    assert forced.resumed and forced.size == len(encoded)
+
+
+def test_tatoeba_pairs_are_joined_telugu_first(tmp_path):
+    """Pairs come out in English-file order, once each, skipping other languages"""
+    (tmp_path / "tel.tsv.bz2").write_bytes(bz2.compress(
+        "1\ttel\tనమస్కారం\n4\ttel\tధన్యవాదాలు\n".encode("utf-8")
+    ))
+    (tmp_path / "eng.tsv").write_text(
+        "2\teng\tHello\n5\teng\tThank you\n6\teng\tUnlinked\n7\teng\tHi\n", encoding="utf-8"
+    )
+    (tmp_path / "links.csv").write_text(
+        "1\t2\n2\t1\n1\t3\n5\t4\n4\t5\n3\t2\n1\t7\n", encoding="utf-8"
+    )
+    output = tmp_path / "pairs.tsv"
+
+    count = extract_tatoeba_pairs(
+        DataFile(tmp_path / "tel.tsv.bz2"),
+        DataFile(tmp_path / "eng.tsv"),
+        DataFile(tmp_path / "links.csv"),
+        output,
+    )
+
+    assert count == 3
+    assert output.read_text(encoding="utf-8").splitlines() == [
+        "telugu\tenglish",
+        "నమస్కారం\tHello",
+        "ధన్యవాదాలు\tThank you",
+        "నమస్కారం\tHi",
+    ]
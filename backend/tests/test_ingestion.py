@@ -0,0 +1,304 @@
+"""
+Tests for the content ingestion pipeline.
+"""
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.data import ingestion
+from app.data.ingestion import IngestionService
+from app.data.loaders.base import BaseLoader
+from app.data.models import ProcessedContent, ContentType
+from app.data.transliteration import TransliterationIndexBuilder
+
+
+class FakeLoader(BaseLoader):
+    """In-memory loader yielding numbered sentence pairs"""
+
+    def __init__(self, count: int, name: str = "Fake"):
+        super().__init__(Path("."))
+        self.count = count
+        self._name = name
+
+    @property
+    def source_name(self) -> str:
+        return self._name
+
+    @property
+    def license(self) -> str:
+        return "CC0"
+
+    def validate_source(self) -> bool:
+        return True
+
+    async def load(self):
+        for i in range(self.count):
+            yield ProcessedContent(
+                id=f"{self._name}-{i}",
+                content_type=ContentType.SENTENCE,
+                text=f"వాక్యం {i} | sentence {i}",
+                telugu_text=f"వాక్యం {i}",
+                english_text=f"sentence {i}",
+                source=self._name,
+                license=self.license,
+            )
+
+
+class FakeEmbedder:
+    def __init__(self, fail_on: str = None):
+        self.fail_on = fail_on
+
+    async def embed_texts(self, texts):
+        await asyncio.sleep(0)
+        if self.fail_on and any(t.endswith(self.fail_on) for t in texts):
+            raise RuntimeError("embedding backend down")
+        return [[float(len(t))] for t in texts]
+
+
+class FakeVectorDB:
+    def __init__(self):
+        self.points = {}
+
+    async def upsert_contents(self, items):
+        await asyncio.sleep(0)
+        for content_id, embedding, payload in items:
+            self.points[content_id] = (embedding, payload)
+
+    async def delete_contents(self, content_ids):
+        for content_id in content_ids:
+            self.points.pop(content_id, None)
+
+
+@pytest.fixture
+def service(tmp_path):
+    """Ingestion service keeping its run state in a temp directory"""
+    service = IngestionService()
+    service.configure(state_dir=tmp_path)
+    return service
+
+
+@pytest.fixture
+def fake_backends(monkeypatch):
+    """Swap the embedding model and Qdrant for in-memory fakes"""
+    store = FakeVectorDB()
+    monkeypatch.setattr(ingestion, "embedding_service", FakeEmbedder())
+    monkeypatch.setattr(ingestion, "vector_db", store)
+    return store
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stores_every_item(service, fake_backends, tmp_path):
+    """All loaded items are embedded and stored, including a partial last batch"""
+    service.configure(
+        batch_size=7, embed_workers=3, upsert_workers=2, queue_size=2, state_dir=tmp_path
+    )
+    service.loaders.append(FakeLoader(50))
+
+    stats = await service.ingest_all()
+
+    assert stats["total_processed"] == 50
+    assert stats["total_stored"] == 50
+    assert stats["errors"] == 0
+    assert len(fake_backends.points) == 50
+
+    snapshot = service.metrics.snapshot()
+    assert snapshot["items"] == 50
+    assert snapshot["stages"]["embed"]["items"] == 50
+    assert snapshot["stages"]["upsert"]["calls"] == 8
+
+
+@pytest.mark.asyncio
+async def test_pipeline_counts_failed_batches(service, fake_backends, monkeypatch, tmp_path):
+    """A failed embedding call drops only its own batch"""
+    monkeypatch.setattr(ingestion, "embedding_service", FakeEmbedder(fail_on="sentence 3"))
+    service.configure(batch_size=5, embed_workers=2, upsert_workers=1, state_dir=tmp_path)
+    service.loaders.append(FakeLoader(20))
+
+    stats = await service.ingest_all()
+
+    assert stats["total_processed"] == 20
+    assert stats["total_stored"] == 15
+    assert stats["errors"] == 5
+    assert stats["dead_letters"] == 5
+
+    # Retrying the dead letters with a working backend stores the rest
+    monkeypatch.setattr(ingestion, "embedding_service", FakeEmbedder())
+    service.loaders = []
+    assert service.add_dead_letter_source(Path(stats["dead_letter_file"]))
+    retry_stats = await service.ingest_all()
+
+    assert retry_stats["total_stored"] == 5
+    assert len(fake_backends.points) == 20
+
+    # Retried items are indexed under their original source, so a delta run skips them
+    service.loaders = [FakeLoader(20)]
+    delta_stats = await service.ingest_all(delta=True)
+    assert delta_stats["sources"]["Fake:."]["unchanged"] == 20
+    assert delta_stats["total_stored"] == 0
+
+
+@pytest.mark.asyncio
+async def test_transliterations_filled_from_index(service, fake_backends, monkeypatch):
+    """Items without a transliteration get one from the index before storage"""
+    builder = TransliterationIndexBuilder()
+    builder.add("వాక్యం", "vaakyam")
+    monkeypatch.setattr(ingestion, "get_transliteration_index", lambda: builder.build())
+    service.loaders.append(FakeLoader(5))
+
+    stats = await service.ingest_all(transliterate=True)
+
+    assert stats["total_transliterated"] == 5
+    payload = fake_backends.points["Fake-3"][1]
+    assert payload["transliteration"] == "vaakyam 3"
+
+
+@pytest.mark.asyncio
+async def test_resume_continues_after_checkpoint(service, fake_backends):
+    """A resumed run skips items a previous run already stored"""
+    loader = FakeLoader(30)
+    service.loaders.append(loader)
+    service.checkpoints.update(loader.checkpoint_key, 20)
+
+    stats = await service.ingest_all(resume=True)
+
+    assert stats["sources"]["Fake:."]["resumed_from"] == 20
+    assert stats["total_processed"] == 10
+    assert sorted(fake_backends.points) == sorted(f"Fake-{i}" for i in range(20, 30))
+    assert service.checkpoints.is_complete(loader.checkpoint_key)
+
+    # Completed sources are skipped entirely on the next resume
+    stats = await service.ingest_all(resume=True)
+    assert stats["total_processed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_delta_run_only_uploads_changes(service, fake_backends):
+    """A delta refresh skips unchanged items and deletes removed ones"""
+    service.loaders.append(FakeLoader(10))
+    await service.ingest_all()
+
+    service.loaders = [FakeLoader(12)]
+    fake_backends.points.pop("Fake-0")  # would be re-stored if not skipped
+    stats = await service.ingest_all(delta=True)
+    source_stats = stats["sources"]["Fake:."]
+
+    assert source_stats["added"] == 2
+    assert source_stats["unchanged"] == 10
+    assert source_stats["stored"] == 2
+    assert "Fake-0" not in fake_backends.points
+
+    service.loaders = [FakeLoader(8)]
+    stats = await service.ingest_all(delta=True, delete_missing=True)
+
+    assert stats["sources"]["Fake:."]["deleted"] == 4
+    assert "Fake-9" not in fake_backends.points
+
+
+@pytest.mark.asyncio
+async def test_delete_missing_keeps_items_from_failed_batches(service, fake_backends, monkeypatch, tmp_path):
+    """Items still in the source are never deleted because their batch failed"""
+    service.configure(batch_size=10, state_dir=tmp_path)
+    service.loaders.append(FakeLoader(30))
+    await service.ingest_all()
+
+    # Changed items whose re-embed fails are still in the source
+    monkeypatch.setattr(ingestion, "embedding_service", FakeEmbedder(fail_on="sentence 3"))
+    service.loaders = [FakeLoader(30)]
+    stats = await service.ingest_all(delete_missing=True)
+
+    assert stats["errors"] == 10
+    assert stats["sources"]["Fake:."]["deleted"] == 0
+    assert len(fake_backends.points) == 30
+
+    # Nothing is deleted while the run has failures, even items that are gone
+    service.loaders = [FakeLoader(25)]
+    stats = await service.ingest_all(delete_missing=True)
+    assert stats["sources"]["Fake:."]["deleted"] == 0
+    assert len(fake_backends.points) == 30
+
+    # A clean run removes only what the source dropped
+    monkeypatch.setattr(ingestion, "embedding_service", FakeEmbedder())
+    service.loaders = [FakeLoader(25)]
+    stats = await service.ingest_all(delete_missing=True)
+    assert stats["sources"]["Fake:."]["deleted"] == 5
+    assert sorted(fake_backends.points) == sorted(f"Fake-{i}" for i in range(25))
+
+
+@pytest.mark.asyncio
+async def test_sources_run_concurrently(service, fake_backends, tmp_path):
+    """Multiple sources overlap and each gets its own stats"""
+    service.configure(max_concurrent_sources=3, embed_budget=1, batch_size=5, state_dir=tmp_path)
+    service.loaders = [FakeLoader(40, "A"), FakeLoader(5, "B"), FakeLoader(5, "C")]
+
+    stats = await service.ingest_all()
+
+    assert stats["total_stored"] == 50
+    assert {key: s["stored"] for key, s in stats["sources"].items()} == {"A:.": 40, "B:.": 5, "C:.": 5}
+
+
+@pytest.mark.asyncio
+async def test_sources_sharing_a_name_keep_separate_stats(service, fake_backends, tmp_path):
+    """Two custom sources with the same name are reported separately"""
+    service.configure(batch_size=5, state_dir=tmp_path)
+    first, second = FakeLoader(10, "Custom"), FakeLoader(5, "Custom")
+    first.data_path, second.data_path = Path("notes"), Path("phrases")
+    service.loaders = [first, second]
+
+    stats = await service.ingest_all()
+
+    assert {key: (s["source"], s["processed"]) for key, s in stats["sources"].items()} == {
+        "Custom:notes": ("Custom", 10),
+        "Custom:phrases": ("Custom", 5),
+    }
+    snapshot = service.metrics.snapshot()
+    assert {key: s["processed"] for key, s in snapshot["sources"].items()} == {
+        "Custom:notes": 10,
+        "Custom:phrases": 5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_fair_limiter_round_robin():
+    """Freed slots alternate between waiting clients"""
+    from app.data.pipeline import FairLimiter
+
+    limiter = FairLimiter(1)
+    order = []
+
+    async def worker(client, n):
+        for _ in range(n):
+            async with limiter.slot(client):
+                order.append(client)
+                await asyncio.sleep(0)
+
+    await limiter.acquire("holder")
+    tasks = [asyncio.create_task(worker("big", 4)), asyncio.create_task(worker("small", 2))]
+    await asyncio.sleep(0)
+    limiter.release()
+    await asyncio.gather(*tasks)
+
+    assert order[:4] == ["big", "small", "big", "small"]
+
+
+def test_content_ids_are_deterministic():
+    """IDs depend only on source and normalized text"""
+    from app.data.models import make_content_id
+
+    first = make_content_id("Tatoeba", "నమస్కారం", "Hello")
+    assert first == make_content_id("Tatoeba", " నమస్కారం ", "hello")
+    assert first != make_content_id("Custom", "నమస్కారం", "Hello")
+
+
+def test_source_scan_skips_generated_directories(tmp_path, monkeypatch):
+    from app.core.config import settings
+    from scripts.ingest_data import source_dirs
+
+    for name in ("tatoeba", "notes", ".ingest", "lexicon", "translit"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "README.md").write_text("")
+    monkeypatch.setattr(settings, "ingest_state_dir", str(tmp_path / ".ingest"))
+    monkeypatch.setattr(settings, "difficulty_lexicon_path", str(tmp_path / "lexicon" / "words.npz"))
+    monkeypatch.setattr(settings, "transliteration_index_path", str(tmp_path / "translit" / "te"))
+
+    assert [subdir.name for subdir in source_dirs(tmp_path)] == ["notes", "tatoeba"]
@@ -0,0 +1,325 @@
+"""
+Tests for content loaders.
+"""
+import bz2
+import gzip
+import io
+import json
+import lzma
+import tarfile
+
+import pytest
+
+from app.data.difficulty import Lexicon
+from app.data.loaders.custom import CustomLoader
+from app.data.loaders.indiccorp import IndicCorpLoader
+from app.data.loaders.samanantar import SamanantatLoader
+from app.data.loaders.tatoeba import TatoebaLoader
+
+
+async def collect(loader):
+    return [content async for content in loader.load()]
+
+
+SENTENCES = (
+    "1\ttel\tనమస్కారం\n"
+    "2\teng\tHello\n"
+    "3\tfra\tBonjour\n"
+    "4\ttel\tధన్యవాదాలు\n"
+    "5\teng\tThank you\n"
+    "6\teng\tUnlinked sentence\n"
+)
+LINKS = "1\t2\n2\t1\n1\t3\n4\t5\n4\t99\n3\t2\n"
+
+
+def write_tar(path, member, text):
+    data = text.encode("utf-8")
+    info = tarfile.TarInfo(f"exports/{member}")
+    info.size = len(data)
+    with tarfile.open(path, "w:bz2") as tar:
+        tar.addfile(info, io.BytesIO(data))
+
+
+@pytest.mark.asyncio
+async def test_tatoeba_raw_dump_join(tmp_path):
+    """Raw dumps are joined through links, ignoring other languages"""
+    (tmp_path / "sentences.csv").write_text(SENTENCES, encoding="utf-8")
+    (tmp_path / "links.csv").write_text(LINKS, encoding="utf-8")
+    loader = TatoebaLoader(tmp_path)
+
+    contents = await collect(loader)
+
+    assert [(c.telugu_text, c.english_text) for c in contents] == [
+        ("నమస్కారం", "Hello"),
+        ("ధన్యవాదాలు", "Thank you"),
+    ]
+    assert contents[0].metadata == {"tatoeba_tel_id": "1", "tatoeba_eng_id": "2"}
+
+
+def write_parallel_corpus(directory, count):
+    english = [f"Sentence number {i} about the office" for i in range(count)]
+    telugu = [f"ఇది వాక్యం సంఖ్య {i}" for i in range(count)]
+    english[3] = ""  # Filtered out
+    (directory / "train.en").write_text("\n".join(english) + "\n", encoding="utf-8")
+    (directory / "train.te").write_text("\n".join(telugu) + "\n", encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_samanantar_parallel_parse_matches_sequential(tmp_path):
+    """Chunked parsing in worker processes yields the same items in order"""
+    write_parallel_corpus(tmp_path, 500)
+
+    sequential = await collect(SamanantatLoader(tmp_path))
+    parallel = await collect(SamanantatLoader(tmp_path, parse_workers=2, chunk_bytes=1024))
+
+    assert len(sequential) == 499
+    assert [c.model_dump() for c in parallel] == [c.model_dump() for c in sequential]
+
+
+@pytest.mark.asyncio
+async def test_samanantar_tsv_quotes_parse_the_same_in_parallel(tmp_path):
+    """Quote characters are text, so chunk boundaries can't change the rows"""
+    rows = [
+        f'"Wait {i}, he said\tఅతను "ఆగు {i}' if i % 3 == 0 else f"Sentence number {i}\tఇది వాక్యం సంఖ్య {i}"
+        for i in range(200)
+    ]
+    (tmp_path / "samanantar_te_en.tsv").write_text(
+        "english\ttelugu\n" + "\n".join(rows) + "\n", encoding="utf-8"
+    )
+
+    sequential = await collect(SamanantatLoader(tmp_path))
+    parallel = await collect(SamanantatLoader(tmp_path, parse_workers=2, chunk_bytes=512))
+
+    assert len(sequential) == 200
+    assert sequential[0].english_text == '"Wait 0, he said'
+    assert [c.model_dump() for c in parallel] == [c.model_dump() for c in sequential]
+
+
+@pytest.mark.asyncio
+async def test_samanantar_parallel_tsv_respects_max_items(tmp_path):
+    """The TSV header is skipped and max_items stops the pool early"""
+    rows = [f"Sentence number {i}\tఇది వాక్యం సంఖ్య {i}" for i in range(300)]
+    (tmp_path / "samanantar_te_en.tsv").write_text(
+        "english\ttelugu\n" + "\n".join(rows) + "\n", encoding="utf-8"
+    )
+
+    contents = await collect(
+        SamanantatLoader(tmp_path, max_items=120, parse_workers=2, chunk_bytes=512)
+    )
+
+    assert len(contents) == 120
+    assert contents[0].english_text == "Sentence number 0"
+    assert contents[-1].english_text == "Sentence number 119"
+
+
+@pytest.mark.asyncio
+async def test_tatoeba_reads_archives_without_extracting(tmp_path):
+    """Raw dumps are streamed straight out of the downloaded tar.bz2 archives"""
+    write_tar(tmp_path / "sentences.tar.bz2", "sentences.csv", SENTENCES)
+    write_tar(tmp_path / "links.tar.bz2", "links.csv", LINKS)
+    loader = TatoebaLoader(tmp_path)
+
+    assert loader.validate_source()
+    contents = await collect(loader)
+
+    assert [c.english_text for c in contents] == ["Hello", "Thank you"]
+
+
+@pytest.mark.asyncio
+async def test_compressed_inputs_match_plain(tmp_path):
+    """.gz, .bz2 and .xz inputs are picked up by suffix and decompressed"""
+    plain_dir = tmp_path / "plain"
+    compressed_dir = tmp_path / "compressed"
+    plain_dir.mkdir()
+    compressed_dir.mkdir()
+    write_parallel_corpus(plain_dir, 50)
+    (compressed_dir / "train.en.gz").write_bytes(gzip.compress((plain_dir / "train.en").read_bytes()))
+    (compressed_dir / "train.te.xz").write_bytes(lzma.compress((plain_dir / "train.te").read_bytes()))
+
+    plain = await collect(SamanantatLoader(plain_dir))
+    compressed = await collect(SamanantatLoader(compressed_dir, parse_workers=2))
+
+    assert [c.id for c in compressed] == [c.id for c in plain]
+
+
+@pytest.mark.asyncio
+async def test_custom_loader_reads_compressed_json(tmp_path):
+    """CustomLoader includes compressed JSON and CSV files"""
+    data = {"content": [{"telugu": "నమస్కారం", "english": "Hello"}]}
+    (tmp_path / "greetings.json.bz2").write_bytes(bz2.compress(json.dumps(data).encode("utf-8")))
+    loader = CustomLoader(tmp_path)
+
+    assert loader.validate_source()
+    contents = await collect(loader)
+
+    assert [c.english_text for c in contents] == ["Hello"]
+
+
+@pytest.mark.asyncio
+async def test_custom_loader_streams_json_and_jsonl(tmp_path):
+    """JSON content arrays and JSON Lines files are decoded item by item"""
+    document = {
+        "version": 2,
+        "notes": {"content": ["not", "items"]},
+        "content": [
+            {"telugu": "నమస్కారం", "english": "Hello", "metadata": {"rank": 12345}},
+            {"telugu": "", "english": "Skipped"},
+            {"telugu": "ధన్యవాదాలు", "english": "Thank you, \"friend\" ]}"},
+        ],
+        "trailing": [1, 2, 3],
+    }
+    (tmp_path / "a.json").write_text(json.dumps(document, ensure_ascii=False), encoding="utf-8")
+    (tmp_path / "b.jsonl").write_text(
+        '{"telugu": "అవును", "english": "Yes"}\n\n{"telugu": "కాదు", "english": "No"}\n',
+        encoding="utf-8",
+    )
+
+    contents = await collect(CustomLoader(tmp_path))
+
+    assert [c.english_text for c in contents] == ["Hello", 'Thank you, "friend" ]}', "Yes", "No"]
+    assert contents[0].metadata == {"rank": 12345}
+
+
+@pytest.mark.asyncio
+async def test_custom_loader_scores_and_tags_in_batches(tmp_path):
+    """Missing difficulty and domains are filled by batch calls; given values are kept"""
+    (tmp_path / "items.jsonl").write_text(
+        '{"telugu": "రైలు ఎక్కడ", "english": "Where is the train"}\n'
+        '{"telugu": "అవును", "english": "Yes", "difficulty": "hard", "domains": ["family"]}\n',
+        encoding="utf-8",
+    )
+    loader = CustomLoader(tmp_path)
+
+    def per_item(*args):
+        raise AssertionError("scored one item at a time")
+
+    loader._difficulty.score = per_item
+    loader._domains.classify = per_item
+    try:
+        contents = await collect(loader)
+    finally:
+        del loader._difficulty.score, loader._domains.classify
+
+    assert contents[0].domains == ["travel"]
+    assert contents[1].difficulty.value == "advanced"
+    assert contents[1].domains == ["family"]
+
+
+def test_iter_json_items_across_small_chunks():
+    """Values split across read chunks, including numbers, decode correctly"""
+    from app.data.readers import _JsonScanner
+
+    items = [{"n": 1234567890, "text": "తెలుగు " * 5}, 9876543210, "tail"]
+    scanner = _JsonScanner(io.StringIO(json.dumps(items, ensure_ascii=False)), chunk_size=7)
+
+    assert list(scanner.array_items()) == items
+
+
+def test_truncated_json_value_stops_at_max_size():
+    """A value that never closes raises once it exceeds max_value, without reading to EOF"""
+    from app.data.readers import _JsonScanner
+
+    stream = io.StringIO('[{"telugu": "' + "అ" * 100_000)
+    scanner = _JsonScanner(stream, chunk_size=64, max_value=1024)
+
+    with pytest.raises(ValueError, match="longer than 1024"):
+        list(scanner.array_items())
+    assert stream.tell() < 10_000
+
+
+@pytest.mark.asyncio
+async def test_bad_json_lines_are_skipped_and_logged(tmp_path, caplog):
+    """Custom and Aksharantar loaders both skip malformed lines and keep going"""
+    from app.data.loaders.aksharantar import AksharantarLoader
+
+    (tmp_path / "custom").mkdir()
+    (tmp_path / "custom" / "items.jsonl").write_text(
+        '{"telugu": "అవును", "english": "Yes"}\n'
+        '{"telugu": "కాదు", "english": \n'
+        '["not", "an", "object"]\n'
+        '{"telugu": "సరే", "english": "Okay"}\n',
+        encoding="utf-8",
+    )
+    (tmp_path / "aksharantar").mkdir()
+    (tmp_path / "aksharantar" / "tel_train.json").write_text(
+        '{"native word": "అమ్మ", "english word": "amma"}\n'
+        '{"native word": "నాన్న", \n'
+        '{"native word": "ఇల్లు", "english word": "illu"}\n',
+        encoding="utf-8",
+    )
+
+    with caplog.at_level("WARNING"):
+        custom = await collect(CustomLoader(tmp_path / "custom"))
+        aksharantar = await collect(AksharantarLoader(tmp_path / "aksharantar"))
+
+    assert [c.english_text for c in custom] == ["Yes", "Okay"]
+    assert [c.english_text for c in aksharantar] == ["amma", "illu"]
+    assert "Skipped 2 malformed line(s) in items.jsonl" in caplog.text
+    assert "Skipped 1 malformed line(s) in tel_train.json" in caplog.text
+
+
+def write_monolingual_corpus(path, count):
+    lines = []
+    for i in range(count):
+        lines.append(["నేను ఇంటికి వెళ్తున్నాను", "మీరు ఎలా ఉన్నారు", "అమ్మ వంట చేస్తోంది"][i % 3])
+        lines.append(f"ఈ రోజు {i} మంది వచ్చారు")  # Digits
+        lines.append("Page about ఇల్లు and more English text")  # Mostly Latin
+    text = "\n".join(lines) + "\n"
+    path.write_bytes(text.encode("utf-8"))
+    return text
+
+
+@pytest.mark.asyncio
+async def test_indiccorp_candidates_and_token_counts(tmp_path):
+    """Only short Telugu-only lines are yielded, and every Telugu word is counted"""
+    text = write_monolingual_corpus(tmp_path / "te.txt", 30)
+    loader = IndicCorpLoader(tmp_path)
+
+    contents = await collect(loader)
+
+    # Repeats are de-duplicated within the (single) shard
+    assert [c.telugu_text for c in contents] == [
+        "నేను ఇంటికి వెళ్తున్నాను",
+        "మీరు ఎలా ఉన్నారు",
+        "అమ్మ వంట చేస్తోంది",
+    ]
+    assert all(c.english_text == "" and c.metadata["monolingual"] for c in contents)
+    assert loader.lines_read == 90
+    expected = Lexicon.build(text.splitlines())
+    assert loader.token_counts.lookup(expected.hashes).tolist() == expected.counts.tolist()
+    assert loader.token_counts.lookup(Lexicon.build(["ఇల్లు"]).hashes).tolist() == [30]
+
+
+@pytest.mark.asyncio
+async def test_indiccorp_parallel_and_compressed_match_sequential(tmp_path):
+    """Sharding across workers or a compressed stream changes neither output nor counts"""
+    plain_dir = tmp_path / "plain"
+    compressed_dir = tmp_path / "compressed"
+    plain_dir.mkdir()
+    compressed_dir.mkdir()
+    text = write_monolingual_corpus(plain_dir / "te.txt", 200)
+    (compressed_dir / "te.txt.xz").write_bytes(lzma.compress(text.encode("utf-8")))
+
+    sequential = IndicCorpLoader(plain_dir)
+    parallel = IndicCorpLoader(plain_dir, parse_workers=2, chunk_bytes=2048)
+    compressed = IndicCorpLoader(compressed_dir, parse_workers=2, chunk_bytes=2048)
+    results = [await collect(loader) for loader in (sequential, parallel, compressed)]
+
+    # Small shards repeat candidates that a single shard de-duplicates
+    assert len(results[1]) > len(results[0])
+    assert {c.id for c in results[1]} == {c.id for c in results[2]} == {c.id for c in results[0]}
+    for loader in (parallel, compressed):
+        assert loader.token_counts.hashes.tolist() == sequential.token_counts.hashes.tolist()
+        assert loader.token_counts.counts.tolist() == sequential.token_counts.counts.tolist()
+
+
+@pytest.mark.asyncio
+async def test_indiccorp_max_items_skips_token_counts(tmp_path):
+    """Stopping early leaves token_counts unset rather than partial"""
+    write_monolingual_corpus(tmp_path / "te.txt", 200)
+    loader = IndicCorpLoader(tmp_path, max_items=2, chunk_bytes=1024)
+
+    contents = await collect(loader)
+
+    assert len(contents) == 2
+    assert loader.token_counts is None
@@ -0,0 +1,59 @@
+"""
+Tests for the data manifest that lets download scripts skip unchanged steps.
+"""
+import os
+from pathlib import Path
+
+from app.data.downloads import DownloadResult, RemoteInfo
+from app.data.manifest import DataManifest
+
+
+def test_step_is_current_until_inputs_or_outputs_change(tmp_path):
+    """A recorded step stays current only with the same inputs and output content"""
+    output = tmp_path / "tatoeba" / "pairs.tsv"
+    output.parent.mkdir()
+    output.write_text("telugu\tenglish\n", encoding="utf-8")
+    manifest = DataManifest(tmp_path / "manifest.json")
+    manifest.record_step("tatoeba/pairs", {"downloads": {"u": "abc"}}, [output])
+
+    reloaded = DataManifest(tmp_path / "manifest.json")
+    assert reloaded.is_current("tatoeba/pairs", {"downloads": {"u": "abc"}})
+    assert not reloaded.is_current("tatoeba/pairs", {"downloads": {"u": "def"}})
+    assert not reloaded.is_current("samanantar/sample", {})
+
+    # Touching without changing content keeps it current
+    stat = output.stat()
+    os.utime(output, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert reloaded.is_current("tatoeba/pairs", {"downloads": {"u": "abc"}})
+
+    output.write_text("telugu\tENGLISH\n", encoding="utf-8")
+    assert not reloaded.is_current("tatoeba/pairs", {"downloads": {"u": "abc"}})
+    output.unlink()
+    assert not reloaded.is_current("tatoeba/pairs", {"downloads": {"u": "abc"}})
+
+
+def test_remote_changes_are_detected_from_validators(tmp_path):
+    """ETags decide when present; otherwise size and Last-Modified must both match"""
+    manifest = DataManifest(tmp_path / "manifest.json")
+    manifest.record_download(DownloadResult(
+        url="https://example.org/a", path=Path("a"), size=10, sha256="aa", etag='"v1"',
+    ))
+    manifest.record_download(DownloadResult(
+        url="https://example.org/b", path=Path("b"), size=20, sha256="bb", last_modified="Mon",
+    ))
+
+    assert manifest.remote_unchanged("https://example.org/a", RemoteInfo("https://example.org/a", etag='"v1"'))
+    assert not manifest.remote_unchanged("https://example.org/a", RemoteInfo("https://example.org/a", etag='"v2"'))
+    assert manifest.remote_unchanged(
+        "https://example.org/b", RemoteInfo("https://example.org/b", size=20, last_modified="Mon")
+    )
+    assert not manifest.remote_unchanged(
+        "https://example.org/b", RemoteInfo("https://example.org/b", size=21, last_modified="Mon")
+    )
+    assert not manifest.remote_unchanged("https://example.org/b", None)
+
+    assert manifest.download_hashes(["https://example.org/a", "https://example.org/b"]) == {
+        "https://example.org/a": "aa",
+        "https://example.org/b": "bb",
+    }
+    assert manifest.download_hashes(["https://example.org/c"]) is None
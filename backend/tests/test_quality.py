@@ -0,0 +1,92 @@
+"""
+Tests for the batch quality filter.
+"""
+from app.data.models import ProcessedContent, ContentType
+from app.data.quality import QualityFilter
+
+
+def make_item(telugu: str, english: str, content_type: ContentType = ContentType.SENTENCE) -> ProcessedContent:
+    return ProcessedContent(
+        id=f"{telugu}|{english}",
+        content_type=content_type,
+        text=f"{telugu} | {english}",
+        telugu_text=telugu,
+        english_text=english,
+        source="Test",
+        license="CC0",
+    )
+
+
+def test_good_pairs_are_kept():
+    """Ordinary sentence pairs pass every check"""
+    quality = QualityFilter()
+    items = [
+        make_item("నేను బస్సులో ఆఫీసుకు వెళ్తాను.", "I go to office by bus."),
+        make_item("ఇది ఎంత?", "How much is this?"),
+        make_item("నేను ఉదయం 6 గంటలకు లేస్తాను", "I wake up at 6 AM"),
+    ]
+
+    kept, rejected = quality.filter(items)
+
+    assert kept == items
+    assert sum(rejected.values()) == 0
+
+
+def test_rejections_are_counted_by_reason():
+    """Each bad pair is rejected for the first check it fails"""
+    quality = QualityFilter()
+    items = [
+        make_item("this is not telugu at all", "This is not Telugu at all"),
+        make_item("అవును", "Yes, and then they walked all the way back to the village together"),
+        make_item("2019 - 2020 : 1234", "2019 - 2020 : 1234"),
+        make_item("!!! ... ??? ఓ", "!!! ... ??? oh"),
+        make_item("ఈ సినిమా చాలా బాగుంది", "This movie is very good"),
+    ]
+
+    kept, rejected = quality.filter(items)
+
+    assert [item.english_text for item in kept] == ["This movie is very good"]
+    assert rejected == {
+        "telugu_ratio": 2,  # Latin text, and digits with no Telugu letters
+        "length_ratio": 1,
+        "digit_density": 0,
+        "punct_density": 1,
+    }
+    assert quality.rejections == rejected
+    assert quality.accepted == 1
+
+
+def test_empty_text_does_not_break_batch():
+    """An empty Telugu side is rejected without affecting its neighbours"""
+    quality = QualityFilter()
+    items = [
+        make_item("", "Hello"),
+        make_item("నమస్కారం", "Hello"),
+        make_item("", "Goodbye"),
+    ]
+
+    kept, _ = quality.filter(items)
+
+    assert [item.id for item in kept] == ["నమస్కారం|Hello"]
+
+
+def test_monolingual_and_transliteration_items_pass_through():
+    """Only translation pairs are judged; other items keep their place"""
+    quality = QualityFilter()
+    items = [
+        make_item("ఈ సినిమా చాలా బాగుంది", ""),  # Monolingual, as from IndicCorp
+        make_item("this is not telugu at all", "This is not Telugu at all"),
+        make_item("నమస్కారం", "namaskaaram", ContentType.TRANSLITERATION),
+        make_item("ఇది ఎంత?", "How much is this?"),
+    ]
+
+    kept, rejected = quality.filter(items)
+
+    assert [item.id for item in kept] == [
+        "ఈ సినిమా చాలా బాగుంది|",
+        "నమస్కారం|namaskaaram",
+        "ఇది ఎంత?|How much is this?",
+    ]
+    assert rejected["telugu_ratio"] == 1
+    assert quality.accepted == 1
+    assert quality.filter(items[2:3]) == (items[2:3], {reason: 0 for reason in rejected})
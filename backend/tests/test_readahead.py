@@ -0,0 +1,127 @@
+"""
+Tests for background-thread read-ahead in loaders.
+"""
+import asyncio
+import gzip
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from app.data.loaders.chunked import map_ordered
+from app.data.loaders.readahead import iter_parsed_chunks, iter_row_batches, read_ahead
+from app.data.readers import find_data_file
+
+
+@pytest.mark.asyncio
+async def test_row_batches_in_order():
+    """Rows come back in order, grouped into batches"""
+    batches = [batch async for batch in iter_row_batches(lambda: iter(range(10)), batch_size=4)]
+
+    assert batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+@pytest.mark.asyncio
+async def test_blocking_reads_leave_event_loop_free():
+    """Other tasks keep running while the producer blocks"""
+    ticks = []
+
+    def slow_rows():
+        for i in range(5):
+            time.sleep(0.02)
+            yield i
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    rows = [row async for row in read_ahead(slow_rows)]
+    task.cancel()
+
+    assert rows == [0, 1, 2, 3, 4]
+    assert len(ticks) >= 5
+
+
+@pytest.mark.asyncio
+async def test_producer_errors_are_raised():
+    """An exception in the reader thread surfaces in the async consumer"""
+    def failing():
+        yield 1
+        raise ValueError("bad row")
+
+    seen = []
+    with pytest.raises(ValueError, match="bad row"):
+        async for item in read_ahead(failing):
+            seen.append(item)
+    assert seen == [1]
+
+
+@pytest.mark.asyncio
+async def test_early_close_stops_and_closes_producer():
+    """Closing the consumer stops the reader and runs its cleanup"""
+    closed = threading.Event()
+    produced = []
+
+    def endless():
+        try:
+            i = 0
+            while True:
+                produced.append(i)
+                yield i
+                i += 1
+        finally:
+            closed.set()
+
+    items = read_ahead(endless, prefetch=2)
+    assert await items.__anext__() == 0
+    await items.aclose()
+
+    assert await asyncio.to_thread(closed.wait, 5)
+    # Reading ahead is bounded by prefetch
+    assert len(produced) <= 4
+
+
+@pytest.mark.asyncio
+async def test_parsed_chunks_cover_compressed_file(tmp_path):
+    """Chunks end on newlines, so every line is parsed exactly once"""
+    lines = [f"line {i} తెలుగు" for i in range(500)]
+    (tmp_path / "rows.txt.gz").write_bytes(gzip.compress(("\n".join(lines) + "\n").encode("utf-8")))
+    data_file = find_data_file(tmp_path, "rows.txt")
+
+    def parse(chunk: bytes):
+        return chunk.decode("utf-8").splitlines()
+
+    chunks = [chunk async for chunk in iter_parsed_chunks(data_file, parse, chunk_bytes=256)]
+
+    assert len(chunks) > 1
+    assert [line for chunk in chunks for line in chunk] == lines
+
+
+@pytest.mark.asyncio
+async def test_map_ordered_draws_tasks_off_the_event_loop():
+    """Task generators (range scans, decompression) run in a worker thread"""
+    threads = set()
+
+    def tasks():
+        for i in range(6):
+            threads.add(threading.current_thread())
+            yield 2, i
+
+    results = [result async for result in map_ordered(pow, tasks(), workers=2)]
+
+    assert results == [1, 2, 4, 8, 16, 32]
+    assert threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_map_ordered_close_stops_workers():
+    """Closing partway through leaves no worker processes behind"""
+    results = map_ordered(pow, ((2, i) for i in range(100)), workers=2)
+
+    assert await results.__anext__() == 1
+    await results.aclose()
+
+    assert multiprocessing.active_children() == []
@@ -0,0 +1,79 @@
+"""
+Tests for single-pass reservoir and stratified sampling.
+"""
+from collections import Counter
+
+import pytest
+
+from app.data.loaders.samanantar import SamanantatLoader
+from app.data.sampling import reservoir_sample, stratified_sample
+
+
+async def stream(items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.asyncio
+async def test_reservoir_sample_is_seeded_and_in_stream_order():
+    """Same seed, same sample; items keep their stream order"""
+    first = await reservoir_sample(stream(range(10_000)), 50, seed=3)
+    again = await reservoir_sample(stream(range(10_000)), 50, seed=3)
+    other = await reservoir_sample(stream(range(10_000)), 50, seed=4)
+
+    assert first == again
+    assert first != other
+    assert len(first) == 50 and first == sorted(first)
+    # Not just the head of the stream
+    assert max(first) > 5000
+
+
+@pytest.mark.asyncio
+async def test_reservoir_sample_is_uniform():
+    """Every position is about equally likely to be kept"""
+    hits = Counter()
+    for seed in range(400):
+        hits.update(item // 10 for item in await reservoir_sample(stream(range(100)), 10, seed))
+
+    # 400 samples x 10 items over 10 buckets: ~400 per bucket
+    assert all(300 < hits[bucket] < 500 for bucket in range(10))
+
+
+@pytest.mark.asyncio
+async def test_reservoir_sample_of_short_stream_keeps_everything():
+    assert await reservoir_sample(stream(range(5)), 10) == list(range(5))
+    assert await reservoir_sample(stream(range(5)), 0) == []
+
+
+@pytest.mark.asyncio
+async def test_stratified_sample_is_proportional():
+    """Strata keep their share of the stream, including small ones"""
+    items = [("common", i) for i in range(900)] + [("rare", i) for i in range(100)]
+    sample = await stratified_sample(stream(items), 50, key=lambda item: item[0], seed=1)
+
+    counts = Counter(stratum for stratum, _ in sample)
+    assert counts == {"common": 45, "rare": 5}
+    assert sample == sorted(sample, key=items.index)
+
+
+@pytest.mark.asyncio
+async def test_samanantar_sampling_reads_whole_corpus(tmp_path):
+    """Sampled max_items come from the whole file, not just its head"""
+    lines = [(f"Sentence number {i} here", f"ఇది వాక్యం సంఖ్య {i}") for i in range(500)]
+    (tmp_path / "samanantar_te_en.tsv").write_text(
+        "".join(f"{en}\t{te}\n" for en, te in lines), encoding="utf-8"
+    )
+
+    async def english(**options):
+        loader = SamanantatLoader(tmp_path, max_items=20, **options)
+        return [content.english_text async for content in loader.load()]
+
+    head = await english()
+    reservoir = await english(sampling="reservoir", seed=5)
+    stratified = await english(sampling="stratified", seed=5)
+
+    assert head == [en for en, _ in lines[:20]]
+    assert len(reservoir) == len(stratified) == 20
+    assert reservoir == await english(sampling="reservoir", seed=5)
+    assert set(reservoir) - set(head)
+    assert stratified != head
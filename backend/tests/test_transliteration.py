@@ -0,0 +1,92 @@
+"""
+Tests for the transliteration loaders and index.
+"""
+import json
+import zipfile
+
+import pytest
+
+from app.data.loaders.aksharantar import AksharantarLoader
+from app.data.loaders.dakshina import DakshinaLoader
+from app.data.models import ContentType
+from app.data.transliteration import TransliterationIndex, TransliterationIndexBuilder
+
+DAKSHINA_LEXICON = (
+    "అమ్మ\tamma\t3\n"
+    "అమ్మ\tammaa\t1\n"
+    "ఇల్లు\tillu\t2\n"
+    "నాన్న\tnanna\t1\n"
+    "నాన్న\tnaanna\t4\n"
+)
+
+
+def write_dakshina(root):
+    lexicons = root / "te" / "lexicons"
+    lexicons.mkdir(parents=True)
+    (lexicons / "te.translit.sampled.train.tsv").write_text(DAKSHINA_LEXICON, encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_dakshina_groups_romanizations_by_word(tmp_path):
+    """One item per native word, with its most attested romanization first"""
+    write_dakshina(tmp_path)
+    loader = DakshinaLoader(tmp_path)
+
+    contents = [content async for content in loader.load()]
+
+    assert [(c.telugu_text, c.transliteration) for c in contents] == [
+        ("అమ్మ", "amma"),
+        ("ఇల్లు", "illu"),
+        ("నాన్న", "naanna"),
+    ]
+    assert contents[0].content_type == ContentType.TRANSLITERATION
+    assert contents[2].metadata["romanizations"] == [
+        {"romanized": "naanna", "attestations": 4},
+        {"romanized": "nanna", "attestations": 1},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_aksharantar_reads_splits_inside_zip(tmp_path):
+    """Splits are streamed from tel.zip; malformed lines are skipped"""
+    records = [
+        {"unique_identifier": "tel1", "native word": "పాట", "english word": "Paata", "source": "x", "score": None},
+        {"unique_identifier": "tel2", "native word": "", "english word": "empty", "source": "x", "score": None},
+    ]
+    lines = "\n".join(json.dumps(record, ensure_ascii=False) for record in records) + "\n{broken\n"
+    with zipfile.ZipFile(tmp_path / "tel.zip", "w") as zf:
+        zf.writestr("tel/tel_train.json", lines)
+    loader = AksharantarLoader(tmp_path)
+
+    assert loader.validate_source()
+    contents = [content async for content in loader.load()]
+
+    assert [(c.telugu_text, c.transliteration) for c in contents] == [("పాట", "paata")]
+    assert contents[0].metadata["aksharantar_id"] == "tel1"
+
+
+@pytest.mark.asyncio
+async def test_index_round_trip_with_mmap(tmp_path):
+    """Both directions resolve to the best-attested pair after save/load"""
+    write_dakshina(tmp_path / "dakshina")
+    builder = TransliterationIndexBuilder()
+    builder.add_content([content async for content in DakshinaLoader(tmp_path / "dakshina").load()])
+    builder.add("అమ", "amma", 1)
+    builder.build().save(tmp_path / "index")
+
+    index = TransliterationIndex.load(tmp_path / "index")
+
+    assert index.romanize_words(["అమ్మ", "నాన్న", "పాట"]) == ["amma", "naanna", None]
+    assert index.telugu_words(["AMMA", "nanna", "illu"]) == ["అమ్మ", "నాన్న", "ఇల్లు"]
+
+
+def test_romanize_batch_keeps_punctuation_and_checks_coverage():
+    """Sentences are romanized word by word; partial coverage gives None by default"""
+    builder = TransliterationIndexBuilder()
+    for telugu, romanized in [("అమ్మ", "amma"), ("నాన్న", "naanna"), ("ఇల్లు", "illu")]:
+        builder.add(telugu, romanized)
+    index = builder.build()
+
+    texts = ["అమ్మ, నాన్న!", "అమ్మ ఎక్కడ?", "Hello", "ఇల్లు OK"]
+    assert index.romanize_batch(texts) == ["amma, naanna!", None, None, "illu OK"]
+    assert index.romanize_batch(texts, min_coverage=0.5)[1] == "amma ఎక్కడ?"